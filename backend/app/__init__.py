@@ -5,6 +5,7 @@ from config import Config
 import os
 
 from utils.db import init_db
+from utils.dataset_version import DatasetVersionWatcher
 from app.extensions import api
 
 # RESTX namespaces
@@ -32,16 +33,16 @@ def create_app():
     # CORS for React frontend
     CORS(app, resources={r"/*": {"origins": "*"}})
 
-    # Cache
-    cache = Cache(app, config={
-        "CACHE_TYPE": "SimpleCache",
-        "CACHE_DEFAULT_TIMEOUT": 300  # 5 minutes
-    })
+    # Cache (backend from Config.CACHE_TYPE, shared by the workers; see utils/cache.py)
+    cache = Cache(app)
     app.cache = cache
 
     # Initialize database
     init_db(app)
 
+    # Dataset version published by the pipeline: part of every cache key
+    app.dataset_version = DatasetVersionWatcher(app.config["MONGO_DB"], Config.DATASET_VERSION_POLL)
+
     # Initialize RESTX API
     api.init_app(app)
 
@@ -68,6 +69,7 @@ def create_app():
         return {
             "status": "InnSight API LIVE ",
             "data_ready": True,
+            "dataset_version": app.dataset_version.current(),
             "cities": sorted(Config.ALLOWED_CITIES),
             "endpoints": [
                 "/api/listings?city=amsterdam",
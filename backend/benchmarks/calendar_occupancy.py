@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Parity check + benchmark for the single calendar pass (scripts/calendar_occupancy.py).
+
+For each city, runs the two previous calendar passes (DataETL.process_calendar
+and the pandas part of aggregate_occupancy, copied below) and the new
+single pass on the same calendar.csv/listings_clean, fails if
+occupancy_monthly or any occupancy_by_month document differs, and reports
+both timings.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.calendar_occupancy
+    python -m benchmarks.calendar_occupancy amsterdam rome
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from scripts.artifacts import read_artifact  # noqa: E402
+from scripts.calendar_occupancy import (  # noqa: E402
+    read_calendar, neighborhood_month_counts, city_monthly_occupancy, monthly_occupancy_docs
+)
+
+DATA_DIR = BACKEND_DIR / "data"
+
+CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+
+# ---------------------------------------------------------------------------
+# Previous implementation (two full calendar passes)
+# ---------------------------------------------------------------------------
+
+def legacy_occupancy_monthly(calendar_path, listings):
+    calendar = pd.read_csv(calendar_path)
+    calendar = calendar[calendar['listing_id'].isin(listings['listing_id'])]
+
+    calendar['date'] = pd.to_datetime(calendar['date'], errors='coerce')
+    calendar = calendar.dropna(subset=['date'])
+
+    calendar['year_month'] = calendar['date'].dt.to_period('M')
+    calendar['is_available'] = calendar['available'].map({'t': 1, 'f': 0})
+
+    monthly = calendar.groupby('year_month').agg(
+        available_nights=('is_available', 'sum'),
+        total_nights=('is_available', 'count')
+    ).reset_index()
+
+    monthly['occupancy_rate'] = (1 - monthly['available_nights'] / monthly['total_nights']) * 100
+    monthly['year_month'] = monthly['year_month'].astype(str)
+    return monthly
+
+
+def legacy_monthly(df):
+    monthly = (
+        df.groupby("month", as_index=False)
+        .agg(occupied=("occupied", "sum"), total_nights=("listing_id", "count"))
+    )
+    monthly["occupancy_rate"] = (monthly["occupied"] / monthly["total_nights"] * 100).round(2)
+    return [
+        {
+            "month": row["month"],
+            "occupied_nights": int(row["occupied"]),
+            "total_nights": int(row["total_nights"]),
+            "occupancy_rate": float(row["occupancy_rate"]),
+        }
+        for _, row in monthly.iterrows()
+    ]
+
+
+def legacy_occupancy_docs(calendar_path, listings):
+    calendar_df = pd.read_csv(calendar_path)
+
+    calendar_df["date"] = pd.to_datetime(calendar_df["date"], errors="coerce")
+    calendar_df = calendar_df.dropna(subset=["date"])
+    calendar_df["month"] = calendar_df["date"].dt.to_period("M").astype(str)
+    calendar_df["occupied"] = calendar_df["available"].apply(lambda x: 0 if x == "t" else 1)
+
+    listing_to_neigh = {str(lid): n for lid, n in zip(listings["listing_id"], listings["neighborhood"])}
+    calendar_df["neighborhood"] = calendar_df["listing_id"].astype(str).map(listing_to_neigh)
+    calendar_df = calendar_df.dropna(subset=["neighborhood"])
+
+    docs = [(None, legacy_monthly(calendar_df))]
+    for neigh, neigh_df in calendar_df.groupby("neighborhood"):
+        docs.append((neigh, legacy_monthly(neigh_df)))
+    return docs
+
+
+# ---------------------------------------------------------------------------
+# Single pass
+# ---------------------------------------------------------------------------
+
+def single_pass(calendar_path, listings):
+    counts = neighborhood_month_counts(read_calendar(calendar_path), listings)
+    monthly = city_monthly_occupancy(counts)
+    docs = [(None, monthly_occupancy_docs(counts))]
+    for neigh, neigh_counts in counts.groupby("neighborhood", sort=True):
+        docs.append((neigh, monthly_occupancy_docs(neigh_counts)))
+    return monthly, docs
+
+
+def bench_city(city: str) -> bool:
+    calendar_path = DATA_DIR / "raw" / city / "calendar.csv"
+    processed = DATA_DIR / "processed" / city
+    if not calendar_path.exists():
+        print(f"  ⚠️  {city}: no calendar.csv, skipped")
+        return True
+
+    try:
+        listings = read_artifact(processed, "listings_clean", columns=["listing_id", "neighborhood"])
+    except FileNotFoundError:
+        print(f"  ⚠️  {city}: no listings_clean (run data_etl.py), skipped")
+        return True
+
+    start = time.perf_counter()
+    old_monthly = legacy_occupancy_monthly(calendar_path, listings)
+    old_docs = legacy_occupancy_docs(calendar_path, listings)
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new_monthly, new_docs = single_pass(calendar_path, listings)
+    single_s = time.perf_counter() - start
+
+    ok = True
+    try:
+        pd.testing.assert_frame_equal(old_monthly, new_monthly, check_dtype=False)
+    except AssertionError as e:
+        print(f"  ❌ {city}: occupancy_monthly differs\n{e}")
+        ok = False
+
+    if old_docs != new_docs:
+        bad = [n for (n, a), (_, b) in zip(old_docs, new_docs) if a != b]
+        print(f"  ❌ {city}: occupancy_by_month differs ({len(old_docs)} vs {len(new_docs)} docs, e.g. {bad[:3]})")
+        ok = False
+
+    status = "✅" if ok else "❌"
+    print(f"  {city:<10} {legacy_s:>10.2f}s {single_s:>10.2f}s {legacy_s / single_s:>7.1f}x  {status} {len(new_docs)} docs")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calendar occupancy: two passes vs single pass")
+    parser.add_argument("cities", nargs="*", help=f"Cities (default: {', '.join(CITIES)})")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("⏱️  CALENDAR OCCUPANCY: legacy two passes vs single typed pass")
+    print("=" * 70)
+    print(f"  {'city':<10} {'legacy':>11} {'single':>11} {'speedup':>8}")
+
+    ok = all([bench_city(city) for city in args.cities or CITIES])
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
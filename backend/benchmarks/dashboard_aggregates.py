@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Parity check + benchmark for the in-process dashboard engine
+(scripts/dashboard_aggregates.py). Needs the MongoDB of config.py with the
+processed artifacts uploaded (listings_clean, reviews_sentiment); nothing
+is written.
+
+For each city, builds sentiment_summary, room_type_distribution and
+top_hosts_agg documents with the aggregate_* scripts (Mongo pipelines),
+and occupancy_by_month the way the original aggregate_occupancy did (the
+raw calendar.csv mapped to neighborhoods through listings_clean), then
+builds all four with city_dashboard_docs() (pandas on the artifacts),
+fails if any document differs, and reports both timings.
+Documents are matched on (level, neighborhood); top host averages may
+differ by one rounding unit (sums added up in a different order).
+
+tests/test_dashboard_aggregates.py checks the same on a small fixture
+without MongoDB.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.dashboard_aggregates
+    python -m benchmarks.dashboard_aggregates amsterdam rome
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+from pymongo import MongoClient
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from config import Config  # noqa: E402
+from scripts.aggregate_room_types import city_room_type_docs  # noqa: E402
+from scripts.aggregate_sentiment_summary import city_sentiment_docs  # noqa: E402
+from scripts.aggregate_top_hosts import city_top_hosts_docs  # noqa: E402
+from scripts.dashboard_aggregates import city_dashboard_docs, load_city_frames  # noqa: E402
+
+PROCESSED_DIR = BACKEND_DIR / "data" / "processed"
+RAW_DIR = BACKEND_DIR / "data" / "raw"
+
+CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+# Rounding places of the float fields that may differ in the last unit
+TOLERANCES = {"avg_price": 2, "avg_rating": 3}
+
+
+def _monthly(calendar: pd.DataFrame) -> list[dict]:
+    monthly = (
+        calendar.groupby("month", as_index=False)
+        .agg(occupied=("occupied", "sum"), total_nights=("listing_id", "count"))
+    )
+    monthly["occupancy_rate"] = (monthly["occupied"] / monthly["total_nights"] * 100).round(2)
+    return [
+        {
+            "month": row["month"],
+            "occupied_nights": int(row["occupied"]),
+            "total_nights": int(row["total_nights"]),
+            "occupancy_rate": float(row["occupancy_rate"]),
+        }
+        for _, row in monthly.iterrows()
+    ]
+
+
+def calendar_occupancy_docs(db, city: str) -> list[dict]:
+    """occupancy_by_month documents as the original aggregate_occupancy built them from calendar.csv."""
+    calendar = pd.read_csv(RAW_DIR / city / "calendar.csv", usecols=["listing_id", "date", "available"])
+    calendar["date"] = pd.to_datetime(calendar["date"], errors="coerce")
+    calendar = calendar.dropna(subset=["date"])
+    calendar["month"] = calendar["date"].dt.to_period("M").astype(str)
+    # available == 't' means NOT occupied
+    calendar["occupied"] = (calendar["available"] != "t").astype(int)
+
+    listing_to_neigh = {
+        str(doc["listing_id"]): doc["neighborhood"]
+        for doc in db.listings_clean.find({"city": city}, {"listing_id": 1, "neighborhood": 1})
+        if doc.get("listing_id") is not None and doc.get("neighborhood") is not None
+    }
+    calendar["neighborhood"] = calendar["listing_id"].astype(str).map(listing_to_neigh)
+    calendar = calendar.dropna(subset=["neighborhood"])
+
+    docs = [{"city": city, "neighborhood": None, "level": "city", "monthly_occupancy": _monthly(calendar)}]
+    for neigh, neigh_calendar in calendar.groupby("neighborhood"):
+        docs.append({
+            "city": city,
+            "neighborhood": neigh,
+            "level": "neighborhood",
+            "monthly_occupancy": _monthly(neigh_calendar),
+        })
+    return docs
+
+
+def script_docs(db, city: str) -> dict:
+    """The original aggregations' documents for one city (no writes)."""
+    return {
+        "sentiment_summary": city_sentiment_docs(db, city),
+        "room_type_distribution": city_room_type_docs(db, city),
+        "occupancy_by_month": calendar_occupancy_docs(db, city),
+        "top_hosts_agg": city_top_hosts_docs(db, city),
+    }
+
+
+def same(a, b, key=None) -> bool:
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(same(a[k], b[k], k) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(same(x, y, key) for x, y in zip(a, b))
+    if key in TOLERANCES and isinstance(a, float) and isinstance(b, float):
+        if math.isnan(a) or math.isnan(b):
+            return math.isnan(a) and math.isnan(b)
+        return abs(a - b) <= 10 ** -TOLERANCES[key] + 1e-9
+    return a == b
+
+
+def by_key(docs: list[dict]) -> dict:
+    return {(d["level"], d["neighborhood"]): d for d in docs}
+
+
+def bench_city(db, city: str) -> bool:
+    if not db.listings_clean.find_one({"city": city}):
+        print(f"  ⚠️  {city}: not uploaded, skipped")
+        return True
+
+    start = time.perf_counter()
+    expected = script_docs(db, city)
+    scripts_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = city_dashboard_docs(city, **load_city_frames(PROCESSED_DIR / city))
+    engine_s = time.perf_counter() - start
+
+    ok = True
+    for name, docs in expected.items():
+        old, new = by_key(docs), by_key(actual[name])
+        bad = [k for k in old.keys() | new.keys() if k not in old or k not in new or not same(old[k], new[k])]
+        if bad:
+            ok = False
+            print(f"  ❌ {city}/{name}: {len(bad)} documents differ, e.g. {sorted(bad, key=str)[:3]}")
+
+    status = "✅" if ok else "❌"
+    total = sum(len(d) for d in actual.values())
+    print(f"  {city:<10} {scripts_s:>10.2f}s {engine_s:>10.2f}s {scripts_s / engine_s:>7.1f}x  {status} {total} docs")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard documents: aggregate_* scripts vs in-process engine")
+    parser.add_argument("cities", nargs="*", help=f"Cities (default: {', '.join(CITIES)})")
+    args = parser.parse_args()
+
+    db = MongoClient(Config.MONGO_URI)[Config.MONGO_DB]
+
+    print("=" * 70)
+    print("⏱️  DASHBOARD AGGREGATES: Mongo pipelines vs in-process frames")
+    print("=" * 70)
+    print(f"  {'city':<10} {'scripts':>11} {'engine':>11} {'speedup':>8}")
+
+    ok = all([bench_city(db, city) for city in args.cities or CITIES])
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
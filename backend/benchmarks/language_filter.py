@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Parity check + benchmark for the column-level English filter.
+
+For each city, runs the scalar is_likely_english (row-by-row .apply) and
+the column kernel english_mask on the same comments, fails if any review
+is classified differently, and reports reviews/second for both.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.language_filter
+    python -m benchmarks.language_filter amsterdam rome --max-reviews 200000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from scripts.review_language import is_likely_english, english_mask  # noqa: E402
+
+RAW_DATA_DIR = BACKEND_DIR / "data" / "raw"
+
+CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+# Edge cases that have to agree regardless of the city data
+EDGE_CASES = pd.Series([
+    None,
+    float("nan"),
+    "",
+    "too short",
+    "The place was great",
+    "het was a great place, the host was nice",
+    "one two three four five het the place was great",
+    "one two three four het the place was great",
+    "THE PLACE WAS GREAT!",
+    "the\tplace\nwas  great   and clean",
+    "très bien, the location was very good",
+    "We had a great stay. The host was lovely.",
+    "12345678901234567890",
+    "Das Apartment war sehr gut und the host was nice",
+    "ÇA the host WAS good",
+], dtype=object)
+
+
+def check_parity(comments: pd.Series, label: str) -> np.ndarray:
+    expected = comments.apply(is_likely_english).to_numpy(dtype=bool)
+    actual = english_mask(comments)
+
+    mismatched = np.flatnonzero(expected != actual)
+    if len(mismatched):
+        print(f"  ❌ {label}: {len(mismatched):,} mismatches, e.g.:")
+        for i in mismatched[:5]:
+            print(f"     {comments.iloc[i]!r}: scalar={expected[i]} column={actual[i]}")
+        sys.exit(1)
+
+    return expected
+
+
+def bench_city(city: str, max_reviews: int | None):
+    reviews_path = RAW_DATA_DIR / city / "reviews.csv"
+    if not reviews_path.exists():
+        print(f"  ⚠️  {city}: no reviews.csv, skipped")
+        return
+
+    comments = pd.read_csv(reviews_path, usecols=["comments"], nrows=max_reviews)["comments"]
+
+    start = time.perf_counter()
+    expected = comments.apply(is_likely_english).to_numpy(dtype=bool)
+    scalar_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = english_mask(comments)
+    vector_s = time.perf_counter() - start
+
+    if not np.array_equal(expected, actual):
+        check_parity(comments, city)
+
+    n = len(comments)
+    print(
+        f"  {city:<10} {n:>10,}  "
+        f"{n / scalar_s:>12,.0f}  {n / vector_s:>12,.0f}  "
+        f"{scalar_s / vector_s:>6.1f}x  ✅ {int(actual.sum()):,} English"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="English filter parity + throughput")
+    parser.add_argument("cities", nargs="*", help=f"Cities (default: {', '.join(CITIES)})")
+    parser.add_argument("--max-reviews", type=int, default=None, help="Read only the first N reviews per city")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("⏱️  ENGLISH FILTER: scalar .apply vs column english_mask")
+    print("=" * 70)
+
+    check_parity(EDGE_CASES, "edge cases")
+    print(f"  ✅ edge cases: {len(EDGE_CASES)} agree\n")
+
+    print(f"  {'city':<10} {'reviews':>10}  {'scalar r/s':>12}  {'column r/s':>12}  {'speedup':>7}")
+    for city in args.cities or CITIES:
+        bench_city(city, args.max_reviews)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Payload size and serialization time of the /api/listings-map formats
+(utils/listings_payload.py) against the current flask-restx JSON.
+
+The records are /api/listings-map documents: a city's listings_map artifact
+when it exists (data/processed/<city>), else synthetic ones shaped like them
+(neighborhoods and room types of benchmarks/synthetic_data.py).
+
+For each format and coding: body size, server time (encode + compress) and
+client time (decompress + parse: json.loads, or an Arrow Table whose columns
+are the buffers themselves, as apache-arrow reads them in the browser).
+
+Usage (from the backend/ directory):
+    python -m benchmarks.listings_payload                  # 50,000 synthetic markers
+    python -m benchmarks.listings_payload --rows 5000
+    python -m benchmarks.listings_payload --city amsterdam # real listings_map artifact
+"""
+
+import argparse
+import gzip
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import pyarrow as pa
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from benchmarks.synthetic_data import CITY_SPECS, ROOM_TYPES  # noqa: E402
+from utils.listings_payload import FORMATS, brotli, compress, encode  # noqa: E402
+
+PROCESSED_DIR = BACKEND_DIR / "data" / "processed"
+
+# ListingsMapResource projection
+MAP_FIELDS = [
+    "listing_id", "listing_name", "latitude", "longitude", "price", "room_type", "neighborhood",
+    "sentiment_mean", "sentiment_category", "review_count", "city",
+]
+
+REPEAT = 3
+
+
+def synthetic_markers(rows: int, city: str = "amsterdam", seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    spec = CITY_SPECS[city]
+    lat, lon = spec["center"]
+    markers = []
+    for i in range(rows):
+        sentiment = rng.uniform(-0.2, 1.0) if rng.random() > 0.15 else None
+        markers.append({
+            "listing_id": 10**17 + rng.randrange(10**17) if rng.random() < 0.6 else rng.randrange(10**7),
+            "listing_name": f"{rng.choice(['Cozy', 'Bright', 'Quiet', 'Lovely'])} {rng.choice(ROOM_TYPES).lower()} #{i}",
+            "latitude": round(lat + rng.gauss(0, 0.03), 6),
+            "longitude": round(lon + rng.gauss(0, 0.04), 6),
+            "price": float(rng.randrange(30, 600)) if rng.random() > 0.05 else None,
+            "room_type": rng.choice(ROOM_TYPES),
+            "neighborhood": rng.choice(spec["neighborhoods"]),
+            "sentiment_mean": sentiment,
+            "sentiment_category": None if sentiment is None else (
+                "positive" if sentiment >= 0.05 else "negative" if sentiment <= -0.05 else "neutral"
+            ),
+            "review_count": rng.randrange(0, 400),
+            "city": city,
+        })
+    return markers
+
+
+def artifact_markers(city: str) -> list[dict]:
+    from scripts.artifacts import read_artifact
+    from scripts.bulk_loader import frame_documents, normalize_columns
+
+    docs = frame_documents(normalize_columns(read_artifact(PROCESSED_DIR / city, "listings_map")), city=city)
+    return [{k: d[k] for k in MAP_FIELDS if k in d} for d in docs]
+
+
+def decode(body: bytes, mimetype: str, coding: str | None):
+    if coding == "br":
+        body = brotli.decompress(body)
+    elif coding == "gzip":
+        body = gzip.decompress(body)
+    if FORMATS[mimetype] == "arrow":
+        return pa.ipc.open_stream(body).read_all()
+    return json.loads(body)
+
+
+def best_time(fn) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="listings-map payload formats: size and (de)serialization time")
+    parser.add_argument("--rows", type=int, default=50000, help="Synthetic markers (default 50,000)")
+    parser.add_argument("--city", help="Use data/processed/<city>/listings_map instead of synthetic markers")
+    args = parser.parse_args()
+
+    records = artifact_markers(args.city) if args.city else synthetic_markers(args.rows)
+
+    print("=" * 86)
+    print(f"⏱️  LISTINGS-MAP PAYLOADS: {len(records):,} markers ({args.city or 'synthetic'}), best of {REPEAT}")
+    print("=" * 86)
+
+    # Current response: flask-restx output_json (json.dumps defaults + newline), uncompressed
+    server_s, body = best_time(lambda: (json.dumps(records) + "\n").encode("utf-8"))
+    client_s, _ = best_time(lambda: json.loads(body))
+    baseline = len(body)
+    print(f"\n  {'format':<10} {'coding':<9} {'bytes':>12} {'vs now':>8} {'server ms':>10} {'client ms':>10}")
+    print(f"  {'now':<10} {'-':<9} {baseline:>12,} {1:>7.2f}x {server_s * 1000:>10.1f} {client_s * 1000:>10.1f}")
+
+    for mimetype, name in FORMATS.items():
+        for coding in [None, "gzip"] + (["br"] if brotli is not None else []):
+            server_s, body = best_time(lambda: compress(encode(records, mimetype), coding))
+            client_s, _ = best_time(lambda: decode(body, mimetype, coding))
+            print(
+                f"  {name:<10} {coding or '-':<9} {len(body):>12,} {len(body) / baseline:>7.2f}x "
+                f"{server_s * 1000:>10.1f} {client_s * 1000:>10.1f}"
+            )
+
+    if brotli is None:
+        print("\nℹ️ brotli not installed → br not measured (pip install brotli)")
+    print("\nServer time is paid once per dataset version and query (the body is cached).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+/api/listings response modes on a loaded database: time to first byte,
+total time and peak Python memory of one request.
+
+  full     the cached list of documents (cache cleared first: a miss)
+  stream   stream=1, documents serialized as the cursor yields them
+  pages    page_size=N, following the `next` cursor to the end
+
+Runs the listings namespace in-process (Flask test client, unbuffered) with
+a per-process SimpleCache, against MONGO_URI / MONGO_DB of config.py: needs
+a local mongod with the pipeline's data. Peak memory is measured with
+tracemalloc, which also slows every mode down by a similar factor; the
+pages' peak includes the pages the SimpleCache keeps.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.listings_stream                  # every city
+    python -m benchmarks.listings_stream rome --page-size 2000
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from config import Config  # noqa: E402
+
+CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+
+def make_app():
+    from flask import Flask
+    from flask_caching import Cache
+    from flask_restx import Api
+
+    from routes.listings import ns
+    from utils.db import init_db
+
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    app.config["CACHE_TYPE"] = "SimpleCache"
+    app.cache = Cache(app)
+    init_db(app)
+    api = Api(app)
+    api.add_namespace(ns)
+    return app
+
+
+def measure(client, url: str, keep: bool = False) -> tuple[float, float, int, int, dict | None]:
+    """
+    (seconds to first chunk, total seconds, bytes, documents, parsed body if keep).
+    Chunks are only kept for keep=True, so the client doesn't count in the peak.
+    """
+    start = time.perf_counter()
+    response = client.get(url, buffered=False)
+    first = None
+    size = docs = 0
+    chunks = []
+    for chunk in response.response:
+        if first is None:
+            first = time.perf_counter() - start
+        chunk = chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
+        size += len(chunk)
+        docs += chunk.count(b'"listing_id":')
+        if keep:
+            chunks.append(chunk)
+    response.close()
+    total = time.perf_counter() - start
+    return first or total, total, size, docs, json.loads(b"".join(chunks)) if keep else None
+
+
+def run_mode(app, city: str, mode: str, page_size: int) -> dict:
+    client = app.test_client()
+    app.cache.clear()
+
+    tracemalloc.start()
+    if mode == "full":
+        ttfb, total, size, docs, _ = measure(client, f"/api/listings?city={city}&limit=0")
+    elif mode == "stream":
+        ttfb, total, size, docs, _ = measure(client, f"/api/listings?city={city}&limit=0&stream=1")
+    else:
+        url = f"/api/listings?city={city}&page_size={page_size}"
+        ttfb, total, size, docs, page = measure(client, url, keep=True)
+        while page["next"]:
+            _, t, s, d, page = measure(client, f"{url}&cursor={page['next']}", keep=True)
+            total, size, docs = total + t, size + s, docs + d
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {"mode": mode, "docs": docs, "ttfb_s": ttfb, "total_s": total, "bytes": size, "peak_mb": peak / 2**20}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/api/listings: full vs streamed vs keyset pages")
+    parser.add_argument("cities", nargs="*", help="Cities (default: all)")
+    parser.add_argument("--page-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    app = make_app()
+
+    print("=" * 80)
+    print(f"⏱️  /api/listings MODES ({Config.MONGO_DB}, page size {args.page_size:,})")
+    print("=" * 80)
+    print(f"\n  {'city':<11} {'mode':<7} {'docs':>8} {'TTFB ms':>9} {'total ms':>9} {'MB sent':>8} {'peak MB':>8}")
+
+    for city in args.cities or CITIES:
+        for mode in ("full", "stream", "pages"):
+            r = run_mode(app, city, mode, args.page_size)
+            print(
+                f"  {city:<11} {r['mode']:<7} {r['docs']:>8,} {r['ttfb_s'] * 1000:>9.1f} "
+                f"{r['total_s'] * 1000:>9.1f} {r['bytes'] / 2**20:>8.1f} {r['peak_mb']:>8.1f}"
+            )
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Pipeline benchmark on synthetic data at several scales (benchmarks/synthetic_data.py).
+
+For each scale, in a fresh process (so peak memory is that scale's own):
+generates the raw CSVs if needed, runs DataETL, the review language filter,
+SentimentETL and WordCloudETL for every city, then upload_all_data and the
+dashboard aggregates into a separate benchmark database, each stage under a
+StageTimer (wall/CPU time, rows, rows/s, peak RSS, Mongo documents).
+
+Needs a local mongod (MONGO_URI of config.py). The benchmark database is
+dropped before every scale; the app's database is never touched.
+
+Each scale's metrics are saved as a run report in <data-dir>/reports/scale_<N>/
+(same format as run_full_pipeline.py, see stage_timer.py). --compare flags
+regressions against the previous report of the same scale, and the summary
+flags stages whose throughput drops as the data grows (rows/s at the largest
+scale below SCALING_FLOOR x rows/s at the smallest).
+
+Usage (from the backend/ directory):
+    python -m benchmarks.pipeline_scale                          # scales 1, 10, 50
+    python -m benchmarks.pipeline_scale --scales 1 10 --cities rome lisbon
+    python -m benchmarks.pipeline_scale --compare                # vs the last run of each scale
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from benchmarks.synthetic_data import CITIES, generate, generated_with  # noqa: E402
+from scripts.stage_timer import (  # noqa: E402
+    StageTimer, previous_report, print_comparison, print_stage_table, write_report
+)
+
+SCALES = [1, 10, 50]
+
+BENCH_DIR = BACKEND_DIR / "data" / "bench"
+BENCH_DB = "innsight_bench"
+APP_DB = "innsight_db"
+
+# Throughput at the largest scale must stay above this fraction of the smallest
+SCALING_FLOOR = 0.5
+
+ETL_STAGES = ["data_etl", "review_language", "sentiment", "wordcloud"]
+
+
+def scale_dir(data_dir, scale: float) -> Path:
+    return Path(data_dir) / f"scale_{scale:g}"
+
+
+def report_dir(data_dir, scale: float) -> Path:
+    return Path(data_dir) / "reports" / f"scale_{scale:g}"
+
+
+def stage_files(data_dir: Path, city: str, stage: str) -> tuple[list, list]:
+    """(inputs, outputs) of an ETL stage, for the row counts."""
+    from scripts.artifacts import artifact_path, output_formats
+
+    raw = data_dir / "raw" / city
+    processed = data_dir / "processed" / city
+
+    def artifacts(*names):
+        return [artifact_path(processed, name, output_formats()[0]) for name in names]
+
+    return {
+        "data_etl": ([raw / "listings.csv", raw / "calendar.csv"], artifacts("listings_clean", "occupancy_neighborhood")),
+        "review_language": ([raw / "reviews.csv"], artifacts("reviews_language")),
+        "sentiment": ([raw / "reviews.csv"], artifacts("reviews_sentiment")),
+        "wordcloud": ([raw / "reviews.csv"], artifacts("review_words")),
+    }[stage]
+
+
+def run_etl_stage(data_dir: Path, city: str, stage: str):
+    from scripts.data_etl import DataETL
+    from scripts.review_language import ReviewLanguageETL
+    from scripts.sentiment_etl import SentimentETL
+    from scripts.wordcloud_etl import WordCloudETL
+
+    if stage == "data_etl":
+        DataETL(city, data_dir=data_dir).run()
+    elif stage == "review_language":
+        ReviewLanguageETL(city, data_dir=data_dir).run()
+    elif stage == "sentiment":
+        SentimentETL(city, data_dir=data_dir).run()
+    elif stage == "wordcloud":
+        WordCloudETL(city, data_dir=data_dir).run()
+
+
+def run_scale(data_dir: Path, cities: list[str], log_path: Path) -> list[dict]:
+    """One scale, in a worker process: every stage timed, stage output sent to log_path."""
+    from pymongo import MongoClient
+
+    from config import Config
+    from scripts import dashboard_aggregates, upload_all_data
+
+    shutil.rmtree(data_dir / "processed", ignore_errors=True)
+    MongoClient(Config.MONGO_URI).drop_database(Config.MONGO_DB)
+
+    # This process only runs this scale: send all stage output (render
+    # workers included) to the log
+    log = open(log_path, "w", encoding="utf-8")
+    os.dup2(log.fileno(), 1)
+    os.dup2(log.fileno(), 2)
+    sys.stdout = sys.stderr = log
+
+    stages = []
+    for city in cities:
+        for stage in ETL_STAGES:
+            inputs, outputs = stage_files(data_dir, city, stage)
+            timer = StageTimer(stage, city, inputs, outputs)
+            with timer:
+                run_etl_stage(data_dir, city, stage)
+            stages.append(timer.metrics)
+
+    timer = StageTimer("upload", ",".join(cities))
+    with timer:
+        timer.ok = upload_all_data.main(
+            run_aggs=False, show_summary=False, cities=cities, data_dir=data_dir
+        ) is not False
+    stages.append(timer.metrics)
+
+    timer = StageTimer("aggregate", ",".join(cities))
+    with timer:
+        dashboard_aggregates.build_dashboards(cities, data_dir=data_dir / "processed")
+    stages.append(timer.metrics)
+
+    log.flush()
+    return stages
+
+
+def stage_throughput(stages: list[dict]) -> dict:
+    """{stage: (rows, seconds)} summed over cities."""
+    totals = {}
+    for s in stages:
+        rows = s["rows_in"] if s["rows_in"] is not None else s["rows_out"] or s["mongo_docs"]
+        r, w = totals.get(s["stage"], (0, 0.0))
+        totals[s["stage"]] = (r + (rows or 0), w + s["wall_s"])
+    return totals
+
+
+def print_scaling(results: dict) -> list[str]:
+    """rows/s and peak MB per stage and scale; returns the stages that scale badly."""
+    scales = sorted(results)
+    names = list(dict.fromkeys(s["stage"] for stages in results.values() for s in stages))
+    throughput = {scale: stage_throughput(results[scale]) for scale in scales}
+    peak = {
+        scale: {name: max(s["peak_rss_mb"] for s in results[scale] if s["stage"] == name) for name in names}
+        for scale in scales
+    }
+
+    print(f"\n  {'stage':<16}" + "".join(f"{f'rows/s @{s:g}x':>16}" for s in scales)
+          + "".join(f"{f'MB @{s:g}x':>11}" for s in scales))
+    slow = []
+    for name in names:
+        rates = []
+        for scale in scales:
+            rows, wall = throughput[scale].get(name, (0, 0.0))
+            rates.append(rows / wall if wall > 0 else None)
+        line = f"  {name:<16}" + "".join(f"{'-' if r is None else f'{r:,.0f}':>16}" for r in rates)
+        line += "".join(f"{peak[scale].get(name, 0):>11,.0f}" for scale in scales)
+        if len(scales) > 1 and rates[0] and rates[-1] is not None and rates[-1] < rates[0] * SCALING_FLOOR:
+            slow.append(f"{name}: {rates[0]:,.0f} rows/s at {scales[0]:g}x → {rates[-1]:,.0f} at {scales[-1]:g}x")
+            line += "  ⚠️"
+        print(line)
+    return slow
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline throughput/memory on synthetic data at several scales")
+    parser.add_argument("--scales", type=float, nargs="+", default=SCALES, help="Scale factors (default: 1 10 50)")
+    parser.add_argument("--cities", nargs="+", default=CITIES, choices=CITIES, metavar="CITY")
+    parser.add_argument("--data-dir", default=str(BENCH_DIR), help=f"Synthetic data + reports (default: {BENCH_DIR})")
+    parser.add_argument("--db", default=BENCH_DB, help=f"Benchmark database, dropped per scale (default: {BENCH_DB})")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--regenerate", action="store_true", help="Rewrite the synthetic CSVs even if present")
+    parser.add_argument("--compare", action="store_true", help="Flag regressions vs the previous run of each scale")
+    args = parser.parse_args()
+
+    if args.db == APP_DB:
+        parser.error(f"{APP_DB} is the app's database; the benchmark drops --db")
+    # Worker processes import config with this database (MONGO_DB)
+    os.environ["MONGO_DB"] = args.db
+
+    print("=" * 70)
+    print(f"⏱️  PIPELINE SCALE BENCHMARK: scales {', '.join(f'{s:g}x' for s in args.scales)}, db {args.db}")
+    print("=" * 70)
+
+    results = {}
+    ok = True
+    for scale in sorted(args.scales):
+        data_dir = scale_dir(args.data_dir, scale)
+        meta = generated_with(data_dir)
+        if (
+            args.regenerate or meta is None or meta["scale"] != scale or meta["seed"] != args.seed
+            or not set(args.cities) <= {c["city"] for c in meta["cities"]}
+        ):
+            print(f"\n🧪 Generating scale {scale:g}x data in {data_dir}")
+            shutil.rmtree(data_dir / "raw", ignore_errors=True)
+            generate(data_dir, scale, args.cities, args.seed)
+
+        log_path = data_dir / "pipeline.log"
+        print(f"\n▶ Scale {scale:g}x (stage output: {log_path})")
+        start = time.perf_counter()
+        # Fresh process per scale: peak RSS is not inflated by the previous scale
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            stages = pool.submit(run_scale, data_dir, args.cities, log_path).result()
+        print(f"  done in {time.perf_counter() - start:.1f}s\n")
+        print_stage_table(stages)
+
+        reports = report_dir(args.data_dir, scale)
+        report = write_report(reports, stages, scale=scale, seed=args.seed, cities=args.cities, db=args.db)
+        print(f"\n📝 Run report: {report}")
+        if args.compare:
+            baseline = previous_report(reports, before=report)
+            if baseline:
+                ok = print_comparison(baseline, report) and ok
+            else:
+                print("ℹ️ No previous report for this scale")
+        results[scale] = stages
+
+    print("\n" + "=" * 70)
+    print("📈 SCALING")
+    print("=" * 70)
+    slow = print_scaling(results)
+    for s in slow:
+        print(f"  ⚠️  {s}")
+    if not slow:
+        print("\n  ✅ Throughput holds up across scales")
+
+    return ok and not slow
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
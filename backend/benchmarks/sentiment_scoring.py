@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark parallel VADER scoring (scripts/sentiment_scoring.py).
+
+Scores one city's English reviews with 1, 2, 4, ... workers, reports
+reviews/second and speedup over the serial run, and checks that the
+reviews_sentiment.csv bytes are identical for every worker count.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.sentiment_scoring --city amsterdam
+    python -m benchmarks.sentiment_scoring --city rome --max-reviews 50000 --batch-size 1000
+"""
+
+import argparse
+import hashlib
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from scripts.review_language import load_review_language, english_review_ids  # noqa: E402
+from scripts.sentiment_scoring import (  # noqa: E402
+    SentimentScorer, categorize_sentiment, BATCH_SIZE, default_workers
+)
+
+DATA_DIR = BACKEND_DIR / "data"
+RAW_DATA_DIR = DATA_DIR / "raw"
+
+
+def load_english_reviews(city: str, max_reviews: int | None) -> pd.DataFrame:
+    reviews = pd.read_csv(
+        RAW_DATA_DIR / city / "reviews.csv",
+        usecols=["listing_id", "id", "date", "comments"],
+    )
+    english_ids = english_review_ids(load_review_language(city, data_dir=DATA_DIR))
+    reviews = reviews[reviews["id"].isin(english_ids)]
+    if max_reviews:
+        reviews = reviews.head(max_reviews)
+    return reviews
+
+
+def output_digest(reviews: pd.DataFrame, scores: list[float]) -> str:
+    out = reviews[["listing_id", "id", "date"]].copy()
+    out["sentiment"] = scores
+    out["sentiment_category"] = out["sentiment"].apply(categorize_sentiment)
+    return hashlib.sha256(out.to_csv(index=False).encode("utf-8")).hexdigest()
+
+
+def worker_counts(max_workers: int) -> list[int]:
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel VADER scoring")
+    parser.add_argument("--city", default="amsterdam")
+    parser.add_argument("--max-reviews", type=int, default=None)
+    parser.add_argument("--max-workers", type=int, default=default_workers())
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"⏱️  VADER SCORING BENCHMARK: {args.city.upper()}")
+    print("=" * 60)
+
+    reviews = load_english_reviews(args.city, args.max_reviews)
+    comments = reviews["comments"]
+    print(f"  English reviews: {len(reviews):,}  (batch size {args.batch_size})\n")
+
+    baseline = None
+    reference = None
+
+    print(f"  {'workers':>7}  {'seconds':>9}  {'reviews/s':>11}  {'speedup':>7}  output")
+    for workers in worker_counts(args.max_workers):
+        with SentimentScorer(workers, args.batch_size) as scorer:
+            start = time.perf_counter()
+            scores = scorer.score(comments)
+            elapsed = time.perf_counter() - start
+
+        digest = output_digest(reviews, scores)
+        if baseline is None:
+            baseline = elapsed
+            reference = digest
+
+        same = "identical" if digest == reference else "❌ DIFFERS"
+        rate = len(comments) / elapsed if elapsed else float("inf")
+        print(f"  {workers:>7}  {elapsed:>9.2f}  {rate:>11,.0f}  {baseline / elapsed:>6.2f}x  {same}")
+
+        if digest != reference:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
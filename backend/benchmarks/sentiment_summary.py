@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Parity check + benchmark for the neighborhood level of the sentiment
+summary (scripts/aggregate_sentiment_summary.py). Needs the MongoDB of
+config.py with listings_clean and reviews_sentiment uploaded (the latter
+from a sentiment_etl.py run that writes the neighborhood column); nothing
+is written.
+
+For each city, runs the previous reviews_sentiment -> listings_clean
+$lookup pipeline (copied below) and the plain $group on the denormalized
+neighborhood, fails if the per-neighborhood counts differ, and reports
+both timings.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.sentiment_summary
+    python -m benchmarks.sentiment_summary amsterdam --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from pymongo import MongoClient
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from config import Config  # noqa: E402
+
+CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+CATEGORIES = ["positive", "neutral", "negative"]
+
+
+def legacy_pipeline(city: str) -> list[dict]:
+    return [
+        {"$match": {"city": city, "sentiment_category": {"$in": CATEGORIES}}},
+        {"$lookup": {
+            "from": "listings_clean",
+            "localField": "listing_id",
+            "foreignField": "listing_id",
+            "as": "listing"
+        }},
+        {"$unwind": "$listing"},
+        {"$addFields": {
+            "neighborhood_norm": {"$ifNull": ["$listing.neighborhood", "$listing.neighbourhood"]}
+        }},
+        {"$match": {"neighborhood_norm": {"$ne": None}}},
+        {"$group": {
+            "_id": {"neighborhood": "$neighborhood_norm", "category": "$sentiment_category"},
+            "count": {"$sum": 1}
+        }},
+    ]
+
+
+def group_pipeline(city: str) -> list[dict]:
+    return [
+        {"$match": {"city": city, "neighborhood": {"$ne": None}, "sentiment_category": {"$in": CATEGORIES}}},
+        {"$group": {
+            "_id": {"neighborhood": "$neighborhood", "category": "$sentiment_category"},
+            "count": {"$sum": 1}
+        }},
+    ]
+
+
+def run(db, pipeline: list[dict], repeat: int) -> tuple[dict, float]:
+    """({(neighborhood, category): count}, best time of `repeat` runs)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = list(db.reviews_sentiment.aggregate(pipeline, allowDiskUse=True))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return {(r["_id"]["neighborhood"], r["_id"]["category"]): r["count"] for r in rows}, best
+
+
+def bench_city(db, city: str, repeat: int) -> bool:
+    if not db.reviews_sentiment.find_one({"city": city}):
+        print(f"  ⚠️  {city}: no reviews_sentiment documents, skipped")
+        return True
+    if not db.reviews_sentiment.find_one({"city": city, "neighborhood": {"$exists": True}}):
+        print(f"  ⚠️  {city}: reviews_sentiment has no neighborhood (re-run sentiment_etl.py + upload), skipped")
+        return True
+
+    old, legacy_s = run(db, legacy_pipeline(city), repeat)
+    new, group_s = run(db, group_pipeline(city), repeat)
+
+    ok = old == new
+    if not ok:
+        bad = sorted(k for k in set(old) | set(new) if old.get(k) != new.get(k))
+        print(f"  ❌ {city}: counts differ for {bad[:3]}")
+
+    status = "✅" if ok else "❌"
+    reviews = sum(new.values())
+    print(f"  {city:<10} {reviews:>10,} {legacy_s:>10.3f}s {group_s:>10.3f}s {legacy_s / group_s:>7.1f}x  {status}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentiment summary: $lookup vs denormalized neighborhood")
+    parser.add_argument("cities", nargs="*", help=f"Cities (default: {', '.join(CITIES)})")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per pipeline (best time is reported)")
+    args = parser.parse_args()
+
+    db = MongoClient(Config.MONGO_URI)[Config.MONGO_DB]
+    # Same indexes aggregate_sentiment creates
+    db.reviews_sentiment.create_index([("city", 1)])
+    db.reviews_sentiment.create_index([("city", 1), ("neighborhood", 1), ("sentiment_category", 1)])
+    db.listings_clean.create_index([("listing_id", 1)])
+
+    print("=" * 70)
+    print("⏱️  SENTIMENT SUMMARY: $lookup into listings_clean vs $group")
+    print("=" * 70)
+    print(f"  {'city':<10} {'reviews':>10} {'$lookup':>11} {'$group':>11} {'speedup':>8}")
+
+    ok = all([bench_city(db, city, args.repeat) for city in args.cities or CITIES])
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Synthetic Inside Airbnb downloads for benchmarking the pipeline without
+the real files.
+
+Writes <out>/raw/<city>/listings.csv, calendar.csv and reviews.csv for the
+six cities, with the columns the ETL reads and the quirks of the real data:
+
+  - prices as strings: "$1,234.00" and "€85.00" (some missing)
+  - missing neighborhoods (empty or blank), hosts and ratings
+  - 18-digit listing ids next to short legacy ones
+  - multilingual comments (English, Dutch, German, French, Italian,
+    Spanish, Portuguese, Greek, in a per-city mix), some empty, some with
+    <br/> tags, commas, quotes and line breaks
+
+Scale 1 is about 1% of a real download (100 ≈ the real size); rows grow
+linearly with the scale. Output is deterministic for a (scale, seed).
+
+Usage (from the backend/ directory):
+    python -m benchmarks.synthetic_data --scale 1 --out data/bench/scale_1
+    python -m benchmarks.synthetic_data --scale 10 --out /tmp/bench rome lisbon
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+# Listings at scale 1, map center, language mix of the reviews
+CITY_SPECS = {
+    "amsterdam": {
+        "listings": 100, "center": (52.37, 4.89),
+        "languages": {"en": 0.60, "nl": 0.20, "de": 0.10, "fr": 0.10},
+        "neighborhoods": ["Centrum-West", "Centrum-Oost", "De Pijp - Rivierenbuurt", "Westerpark",
+                          "Oud-Oost", "Bos en Lommer", "Zuid", "Noord-West", "IJburg - Zeeburgereiland"],
+    },
+    "rome": {
+        "listings": 260, "center": (41.90, 12.50),
+        "languages": {"en": 0.55, "it": 0.25, "fr": 0.08, "es": 0.07, "de": 0.05},
+        "neighborhoods": ["I Centro Storico", "II Parioli/Nomentano", "VII San Giovanni/Cinecittà",
+                          "XIII Aurelia", "XII Monte Verde", "I Trastevere", "V Prenestino/Centocelle"],
+    },
+    "lisbon": {
+        "listings": 230, "center": (38.72, -9.14),
+        "languages": {"en": 0.55, "pt": 0.20, "fr": 0.10, "es": 0.10, "de": 0.05},
+        "neighborhoods": ["Santa Maria Maior", "Misericórdia", "Arroios", "Santo António", "Estrela",
+                          "Alcântara", "Cascais e Estoril", "Belém", "Penha de França"],
+    },
+    "sicily": {
+        "listings": 500, "center": (37.60, 14.02),
+        "languages": {"en": 0.40, "it": 0.35, "fr": 0.10, "de": 0.10, "es": 0.05},
+        "neighborhoods": ["Palermo", "Catania", "Taormina", "Siracusa", "Cefalù", "Trapani",
+                          "Agrigento", "Ragusa", "Lipari", "Noto"],
+    },
+    "bordeaux": {
+        "listings": 110, "center": (44.84, -0.58),
+        "languages": {"en": 0.35, "fr": 0.55, "es": 0.05, "de": 0.05},
+        "neighborhoods": ["Bordeaux Centre", "Chartrons", "Saint-Michel", "Bastide", "Caudéran",
+                          "Arcachon", "Mérignac", "Pessac"],
+    },
+    "crete": {
+        "listings": 220, "center": (35.24, 24.81),
+        "languages": {"en": 0.55, "de": 0.15, "el": 0.10, "fr": 0.10, "nl": 0.10},
+        "neighborhoods": ["Chania", "Heraklion", "Rethymno", "Agios Nikolaos", "Hersonissos",
+                          "Malevizi", "Platanias", "Sitia"],
+    },
+}
+
+ROOM_TYPES = ["Entire home/apt", "Private room", "Hotel room", "Shared room"]
+ROOM_WEIGHTS = [0.72, 0.24, 0.02, 0.02]
+PROPERTY_TYPES = ["Entire rental unit", "Private room in rental unit", "Entire condo", "Entire villa",
+                  "Room in boutique hotel", "Entire loft", "Entire home"]
+
+# Fractions of rows with the data problems the ETL has to cope with
+MISSING_NEIGHBORHOOD = 0.03
+MISSING_PRICE = 0.02
+MISSING_HOST = 0.01
+MISSING_RATING = 0.15
+EMPTY_COMMENT = 0.02
+EURO_PRICE = 0.30
+
+REVIEWS_PER_LISTING = 40
+NO_REVIEWS = 0.15
+CALENDAR_DAYS = 365
+CALENDAR_START = "2024-09-01"
+REVIEW_DATES = ("2015-01-01", "2024-08-31")
+
+# Distinct comments generated per city; reviews sample from this pool
+COMMENT_POOL = 20000
+
+# Listings per calendar/reviews write
+WRITE_CHUNK = 2000
+
+# Sentence templates per language: {adj} positive/negative, {noun} a thing, {place} a neighborhood
+SENTENCES = {
+    "en": [
+        "The place was {adj} and the host was very helpful.",
+        "We had a {adj} stay, the {noun} was exactly as in the pictures.",
+        "Great location close to {place}, would recommend!",
+        "The {noun} was {adj}, but the street was a bit noisy at night.",
+        "Check-in was easy and the apartment was clean.",
+        "Our host gave us great tips about {place}.",
+        "The {noun} was {adj}. We would definitely stay here again.",
+        "Not what we expected: the {noun} was {adj} and nobody answered our messages.",
+        "Nice neighborhood, lots of restaurants near {place}.",
+        "Good value for money, {adj} {noun}.",
+    ],
+    "nl": [
+        "Het appartement was {adj} en de host was erg behulpzaam.",
+        "Een van de beste plekken in {place}, zeer aan te raden.",
+        "Mooie {noun}, goede locatie.",
+        "De {noun} was {adj} maar het was wel gehorig.",
+    ],
+    "de": [
+        "Die Wohnung war sehr {adj} und die Lage in {place} ist super.",
+        "Wir hatten einen schönen Aufenthalt, die {noun} war sauber.",
+        "Der Gastgeber war sehr freundlich und hilfsbereit.",
+        "Leider war die {noun} {adj} und es war laut.",
+    ],
+    "fr": [
+        "Très bel appartement, {adj}, proche de {place}.",
+        "Nous avons passé un séjour {adj}, merci pour l'accueil !",
+        "Le logement était propre et bien situé.",
+        "La {noun} était {adj}, mais le quartier est bruyant.",
+    ],
+    "it": [
+        "Casa molto {adj}, posizione ottima vicino a {place}.",
+        "Siamo stati benissimo, la {noun} era pulita.",
+        "Host gentilissimo e disponibile, consigliato!",
+        "La {noun} era {adj} e un po' rumorosa.",
+    ],
+    "es": [
+        "El apartamento estaba muy {adj} y muy bien ubicado cerca de {place}.",
+        "Todo estaba perfecto, la {noun} muy limpia.",
+        "El anfitrión fue muy amable, lo recomiendo.",
+        "La {noun} estaba {adj} y había mucho ruido.",
+    ],
+    "pt": [
+        "O apartamento é muito {adj}, perto de {place}.",
+        "Estadia excelente, a {noun} estava limpa.",
+        "Anfitrião muito simpático, recomendo!",
+        "A {noun} estava {adj} e havia barulho à noite.",
+    ],
+    "el": [
+        "Πολύ {adj} διαμέρισμα, κοντά στο {place}.",
+        "Ο οικοδεσπότης ήταν πολύ φιλικός.",
+        "Καθαρό και άνετο, το προτείνω!",
+    ],
+}
+
+ADJECTIVES = {
+    "en": (["great", "lovely", "amazing", "spotless", "cozy", "perfect", "beautiful", "comfortable"],
+           ["dirty", "terrible", "awful", "disappointing", "small", "dark", "noisy"]),
+    "nl": (["mooi", "schoon", "gezellig", "fantastisch"], ["vies", "klein", "teleurstellend"]),
+    "de": (["schön", "sauber", "gemütlich", "toll"], ["schmutzig", "enttäuschend", "klein"]),
+    "fr": (["agréable", "charmant", "parfait", "propre"], ["sale", "décevant", "petit"]),
+    "it": (["bella", "accogliente", "pulita", "perfetta"], ["sporca", "deludente", "piccola"]),
+    "es": (["bonito", "limpio", "acogedor", "perfecto"], ["sucio", "pequeño", "decepcionante"]),
+    "pt": (["bonito", "limpo", "acolhedor", "perfeito"], ["sujo", "pequeno", "dececionante"]),
+    "el": (["όμορφο", "καθαρό", "άνετο"], ["βρώμικο", "μικρό"]),
+}
+
+NOUNS = {
+    "en": ["apartment", "room", "bed", "kitchen", "bathroom", "view", "balcony", "terrace", "shower", "studio"],
+    "nl": ["kamer", "keuken", "badkamer", "uitzicht"],
+    "de": ["Wohnung", "Küche", "Aussicht", "Dusche"],
+    "fr": ["chambre", "cuisine", "vue", "terrasse"],
+    "it": ["camera", "cucina", "vista", "terrazza"],
+    "es": ["habitación", "cocina", "vista", "terraza"],
+    "pt": ["casa", "cozinha", "vista", "varanda"],
+    "el": ["θέα", "κουζίνα", "βεράντα"],
+}
+
+NEGATIVE_SHARE = 0.15
+
+
+# ---------------------------------------------------------------------------
+# Building blocks
+# ---------------------------------------------------------------------------
+
+def scaled(count: int, scale: float) -> int:
+    return max(1, round(count * scale))
+
+
+def comment_pool(rng, spec: dict, size: int = COMMENT_POOL) -> np.ndarray:
+    """`size` distinct-ish comments in the city's language mix."""
+    languages = list(spec["languages"])
+    weights = np.array(list(spec["languages"].values()))
+    picked = rng.choice(languages, size=size, p=weights / weights.sum())
+    py = random.Random(int(rng.integers(2**32)))  # per-item draws: much cheaper than numpy scalars
+
+    pool = []
+    for lang in picked:
+        adjectives = ADJECTIVES[lang][py.random() < NEGATIVE_SHARE]
+        sentences = [
+            template.format(
+                adj=py.choice(adjectives), noun=py.choice(NOUNS[lang]), place=py.choice(spec["neighborhoods"])
+            )
+            for template in py.choices(SENTENCES[lang], k=py.randint(1, 4))
+        ]
+        text = py.choice([" ", " ", " ", "<br/>", "\n"]).join(sentences)
+        if py.random() < 0.05:
+            text = f'"{text}" - {py.choice(["10/10", "5 stars", "thanks", ":)"])}'
+        pool.append(text)
+    return np.array(pool, dtype=object)
+
+
+def price_strings(rng, prices: np.ndarray) -> np.ndarray:
+    """"$1,234.00" / "€85.00" strings, NaN for missing prices."""
+    euro = rng.random(len(prices)) < EURO_PRICE
+    text = np.array([f"{p:,.2f}" for p in prices], dtype=object)
+    text = np.where(euro, "€" + text, "$" + text).astype(object)
+    text[rng.random(len(prices)) < MISSING_PRICE] = np.nan
+    return text
+
+
+def listing_ids(rng, count: int, city_index: int) -> np.ndarray:
+    """Unique ids: short legacy ones and 18-digit ones, as in recent downloads."""
+    short = np.arange(1, count + 1, dtype=np.int64) * 7 + city_index * 10_000_000
+    long = 600_000_000_000_000_000 + city_index * 10**15 + np.arange(count, dtype=np.int64) * 9973
+    return np.where(rng.random(count) < 0.5, short, long)
+
+
+def make_listings(rng, city: str, spec: dict, count: int) -> pd.DataFrame:
+    city_index = CITIES.index(city)
+    neighborhoods = np.array(spec["neighborhoods"], dtype=object)
+    weights = rng.dirichlet(np.ones(len(neighborhoods)) * 2)
+    neighborhood = rng.choice(neighborhoods, size=count, p=weights).astype(object)
+    missing = rng.random(count) < MISSING_NEIGHBORHOOD
+    neighborhood[missing] = rng.choice(np.array(["", " ", np.nan], dtype=object), size=missing.sum())
+
+    # Few hosts own many listings (long tail)
+    hosts = max(1, count // 3)
+    host_id = (rng.zipf(1.6, size=count) % hosts + 1 + city_index * 10_000_000).astype(np.int64)
+    host_name = np.array([f"Host {h % 9973}" for h in host_id], dtype=object)
+    host_name[rng.random(count) < MISSING_HOST] = np.nan
+
+    room_type = rng.choice(ROOM_TYPES, size=count, p=ROOM_WEIGHTS)
+    accommodates = rng.integers(1, 9, size=count)
+    prices = np.round(rng.lognormal(4.7, 0.6, size=count) * np.where(room_type == "Entire home/apt", 1.3, 0.7))
+    rating = np.round(rng.beta(12, 1.2, size=count) * 5, 2)
+    rating[rng.random(count) < MISSING_RATING] = np.nan
+    lat, lon = spec["center"]
+
+    return pd.DataFrame({
+        "id": listing_ids(rng, count, city_index),
+        "name": [f"{t} in {city.title()} #{i}" for i, t in enumerate(room_type)],
+        "host_id": host_id,
+        "host_name": host_name,
+        "neighbourhood_cleansed": neighborhood,
+        "latitude": np.round(lat + rng.normal(0, 0.03, size=count), 6),
+        "longitude": np.round(lon + rng.normal(0, 0.04, size=count), 6),
+        "property_type": rng.choice(PROPERTY_TYPES, size=count),
+        "room_type": room_type,
+        "accommodates": accommodates,
+        "bedrooms": np.maximum(1, accommodates // 2),
+        "beds": np.maximum(1, accommodates // 2 + rng.integers(0, 2, size=count)),
+        "price": price_strings(rng, prices),
+        "minimum_nights": rng.choice([1, 2, 3, 7, 30], size=count, p=[0.4, 0.3, 0.2, 0.05, 0.05]),
+        "maximum_nights": rng.choice([30, 90, 365, 1125], size=count),
+        "number_of_reviews": 0,
+        "review_scores_rating": rating,
+    })
+
+
+def review_counts(rng, count: int) -> np.ndarray:
+    counts = rng.negative_binomial(1, 1 / REVIEWS_PER_LISTING, size=count)
+    counts[rng.random(count) < NO_REVIEWS] = 0
+    return counts
+
+
+def make_reviews(rng, listing_id: np.ndarray, counts: np.ndarray, pool: np.ndarray, first_id: int) -> pd.DataFrame:
+    total = int(counts.sum())
+    start, end = (np.datetime64(d) for d in REVIEW_DATES)
+    days = rng.integers(0, (end - start).astype(int) + 1, size=total)
+    comments = pool[rng.integers(0, len(pool), size=total)]
+    comments[rng.random(total) < EMPTY_COMMENT] = np.nan
+
+    return pd.DataFrame({
+        "listing_id": np.repeat(listing_id, counts),
+        "id": first_id + np.arange(total, dtype=np.int64) * 3,
+        "date": (start + days).astype(str),
+        "reviewer_id": rng.integers(1, 500_000_000, size=total),
+        "reviewer_name": rng.choice(["Anna", "Marco", "Sophie", "João", "Lukas", "Eleni", "Emma", "Pierre"], size=total),
+        "comments": comments,
+    })
+
+
+def make_calendar(rng, listings: pd.DataFrame, days: int) -> pd.DataFrame:
+    count = len(listings)
+    dates = pd.date_range(CALENDAR_START, periods=days).strftime("%Y-%m-%d").to_numpy()
+    occupancy = rng.beta(2, 2, size=count)
+    booked = rng.random((count, days)) < occupancy[:, None]
+    price = listings["price"].fillna("$100.00").to_numpy()
+
+    return pd.DataFrame({
+        "listing_id": np.repeat(listings["id"].to_numpy(), days),
+        "date": np.tile(dates, count),
+        "available": np.where(booked.ravel(), "f", "t"),
+        "price": np.repeat(price, days),
+        "adjusted_price": np.nan,
+        "minimum_nights": np.repeat(listings["minimum_nights"].to_numpy(), days),
+        "maximum_nights": np.repeat(listings["maximum_nights"].to_numpy(), days),
+    })
+
+
+# ---------------------------------------------------------------------------
+# Generation
+# ---------------------------------------------------------------------------
+
+def generate_city(city: str, out_dir, scale: float = 1, seed: int = 0, calendar_days: int = CALENDAR_DAYS) -> dict:
+    """Write the city's three CSVs under out_dir/raw/<city>; returns the row counts."""
+    spec = CITY_SPECS[city]
+    rng = np.random.default_rng([seed, CITIES.index(city)])
+    raw = Path(out_dir) / "raw" / city
+    raw.mkdir(parents=True, exist_ok=True)
+
+    listings = make_listings(rng, city, spec, scaled(spec["listings"], scale))
+    counts = review_counts(rng, len(listings))
+    listings["number_of_reviews"] = counts
+    listings.to_csv(raw / "listings.csv", index=False)
+
+    pool = comment_pool(rng, spec)
+    first_id = 10**9 * (CITIES.index(city) + 1)
+    reviews = calendar = 0
+
+    # Chunked: at large scales neither file fits comfortably in memory
+    for start in range(0, len(listings), WRITE_CHUNK):
+        chunk = listings.iloc[start:start + WRITE_CHUNK]
+        chunk_counts = counts[start:start + WRITE_CHUNK]
+        mode, header = ("w", True) if start == 0 else ("a", False)
+
+        df = make_reviews(rng, chunk["id"].to_numpy(), chunk_counts, pool, first_id + reviews * 3)
+        df.to_csv(raw / "reviews.csv", mode=mode, header=header, index=False)
+        reviews += len(df)
+
+        df = make_calendar(rng, chunk, calendar_days)
+        df.to_csv(raw / "calendar.csv", mode=mode, header=header, index=False)
+        calendar += len(df)
+
+    return {"city": city, "listings": len(listings), "reviews": reviews, "calendar": calendar}
+
+
+def generate(out_dir, scale: float = 1, cities=None, seed: int = 0, calendar_days: int = CALENDAR_DAYS) -> list[dict]:
+    """All cities; also writes out_dir/raw/synthetic.json describing the data."""
+    cities = cities or CITIES
+    stats = []
+    for city in cities:
+        start = time.perf_counter()
+        s = generate_city(city, out_dir, scale, seed, calendar_days)
+        print(f"  🏙️  {city:<10} {s['listings']:>9,} listings {s['reviews']:>11,} reviews "
+              f"{s['calendar']:>13,} calendar rows ({time.perf_counter() - start:.1f}s)")
+        stats.append(s)
+
+    meta = {"scale": scale, "seed": seed, "calendar_days": calendar_days, "cities": stats}
+    with open(Path(out_dir) / "raw" / "synthetic.json", "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    return stats
+
+
+def generated_with(out_dir) -> dict | None:
+    """The synthetic.json of a previous generate() in out_dir (None if absent)."""
+    path = Path(out_dir) / "raw" / "synthetic.json"
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic Inside Airbnb CSVs")
+    parser.add_argument("cities", nargs="*", help=f"Cities (default: {', '.join(CITIES)})")
+    parser.add_argument("--scale", type=float, default=1, help="Size factor (1 ≈ 1%% of the real downloads)")
+    parser.add_argument("--out", required=True, help="Data directory (files go to <out>/raw/<city>/)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--calendar-days", type=int, default=CALENDAR_DAYS)
+    args = parser.parse_args()
+
+    unknown = set(args.cities) - set(CITIES)
+    if unknown:
+        parser.error(f"unknown cities: {', '.join(sorted(unknown))}")
+
+    print(f"🧪 Generating scale {args.scale:g} data in {args.out}")
+    generate(args.out, args.scale, args.cities or None, args.seed, args.calendar_days)
+    print("✅ Done")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
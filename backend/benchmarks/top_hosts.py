@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Parity check + benchmark for the single-pipeline top hosts aggregation
+(scripts/aggregate_top_hosts.py). Needs the MongoDB of config.py with
+listings_clean uploaded; nothing is written.
+
+For each city, builds the top_hosts_agg documents with the previous
+one-aggregation-per-neighborhood loop (copied below) and with
+city_top_hosts_docs(), and reports timings and round trips. The previous
+pipelines left hosts with equal total_listings in no particular order, so
+each top-10 list is compared as its total_listings sequence plus the
+values of the hosts present in both lists (averages within one rounding
+unit: partial sums may add up in a different order).
+
+Usage (from the backend/ directory):
+    python -m benchmarks.top_hosts
+    python -m benchmarks.top_hosts amsterdam rome
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+from pymongo import MongoClient
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from config import Config  # noqa: E402
+from scripts.aggregate_top_hosts import (  # noqa: E402
+    RATING_FIELD, _detect_neighborhood_field, _rating_in_range, city_top_hosts_docs
+)
+
+CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+
+# ---------------------------------------------------------------------------
+# Previous implementation (one aggregation per neighborhood)
+# ---------------------------------------------------------------------------
+
+def legacy_pipeline(match: dict) -> list[dict]:
+    return [
+        {"$match": match},
+        {"$group": {
+            "_id": {"host_id": "$host_id", "host_name": "$host_name"},
+            "total_listings": {"$sum": 1},
+            "avg_price": {"$avg": "$price"},
+            "avg_rating": {"$avg": {"$cond": [_rating_in_range(RATING_FIELD), f"${RATING_FIELD}", None]}},
+        }},
+        {"$sort": {"total_listings": -1}},
+        {"$limit": 10},
+        {"$project": {
+            "_id": 0,
+            "host_id": "$_id.host_id",
+            "host_name": "$_id.host_name",
+            "total_listings": 1,
+            "avg_price": {"$round": ["$avg_price", 2]},
+            "avg_rating": {
+                "$cond": [
+                    {"$ne": ["$avg_rating", None]},
+                    {"$round": ["$avg_rating", 3]},
+                    None,
+                ]
+            },
+        }},
+    ]
+
+
+def legacy_docs(db, city: str) -> tuple[list[dict], int]:
+    """(docs, round trips)"""
+    neigh_field = _detect_neighborhood_field(db, city)
+    neighborhoods = db.listings_clean.distinct(neigh_field, {"city": city, neigh_field: {"$ne": None}})
+    hosts = {"city": city, "host_id": {"$ne": None}, "host_name": {"$ne": None}}
+
+    docs = [{
+        "city": city,
+        "neighborhood": None,
+        "level": "city",
+        "top_hosts": list(db.listings_clean.aggregate(legacy_pipeline(hosts), allowDiskUse=True)),
+    }]
+    for neigh in neighborhoods:
+        docs.append({
+            "city": city,
+            "neighborhood": neigh,
+            "level": "neighborhood",
+            "top_hosts": list(db.listings_clean.aggregate(legacy_pipeline({**hosts, neigh_field: neigh}),
+                                                          allowDiskUse=True)),
+        })
+    # find_one + distinct + one aggregation per doc (+ one insert_one per doc)
+    return docs, 2 + 2 * len(docs)
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+def same_value(a, b, places: int) -> bool:
+    if a is None or b is None:
+        return a is b
+    if math.isnan(a) or math.isnan(b):
+        return math.isnan(a) and math.isnan(b)
+    return abs(a - b) <= 10 ** -places + 1e-9
+
+
+def same_hosts(old: list[dict], new: list[dict]) -> bool:
+    if [h["total_listings"] for h in old] != [h["total_listings"] for h in new]:
+        return False
+    new_by_host = {(h["host_id"], h["host_name"]): h for h in new}
+    for h in old:
+        n = new_by_host.get((h["host_id"], h["host_name"]))
+        if n is None:
+            continue  # tie at the cut-off, other host kept
+        if not (same_value(h["avg_price"], n["avg_price"], 2) and same_value(h["avg_rating"], n["avg_rating"], 3)):
+            return False
+    return True
+
+
+def bench_city(db, city: str) -> bool:
+    if not db.listings_clean.find_one({"city": city}):
+        print(f"  ⚠️  {city}: no listings_clean documents, skipped")
+        return True
+
+    start = time.perf_counter()
+    old_docs, old_trips = legacy_docs(db, city)
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new_docs = city_top_hosts_docs(db, city)
+    single_s = time.perf_counter() - start
+
+    old = {d["neighborhood"]: d["top_hosts"] for d in old_docs}
+    new = {d["neighborhood"]: d["top_hosts"] for d in new_docs}
+    bad = [n for n in old if n not in new or not same_hosts(old[n], new[n])]
+    ok = set(old) == set(new) and not bad
+    if not ok:
+        print(f"  ❌ {city}: differs for {bad[:3] or sorted(set(old) ^ set(new), key=str)[:3]}")
+
+    status = "✅" if ok else "❌"
+    print(
+        f"  {city:<10} {legacy_s:>9.2f}s ({old_trips:>4} trips) {single_s:>9.2f}s (   4 trips) "
+        f"{legacy_s / single_s:>6.1f}x  {status} {len(new_docs)} docs"
+    )
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Top hosts: per-neighborhood pipelines vs one pipeline per city")
+    parser.add_argument("cities", nargs="*", help=f"Cities (default: {', '.join(CITIES)})")
+    args = parser.parse_args()
+
+    db = MongoClient(Config.MONGO_URI)[Config.MONGO_DB]
+
+    print("=" * 70)
+    print("⏱️  TOP HOSTS: one aggregation per neighborhood vs one per city")
+    print("=" * 70)
+    print(f"  {'city':<10} {'legacy':>22} {'single':>22} {'speedup':>7}")
+
+    ok = all([bench_city(db, city) for city in args.cities or CITIES])
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Parity check + benchmark for the upload document conversion (scripts/bulk_loader.py).
+
+For every processed artifact, builds the insert_many documents with the
+previous astype(object) / where / to_dict('records') conversion (copied
+below) and with frame_documents(), fails if any document differs (values,
+types and key order), and reports rows/s of both.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.upload_documents
+    python -m benchmarks.upload_documents amsterdam --batch-size 5000
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from scripts.artifacts import UPLOAD_ARTIFACTS, find_artifact, iter_artifact_file  # noqa: E402
+from scripts.bulk_loader import BATCH_SIZE, frame_documents, normalize_columns  # noqa: E402
+
+PROCESSED_DIR = BACKEND_DIR / "data" / "processed"
+
+
+def legacy_documents(df: pd.DataFrame, city_name: str) -> list[dict]:
+    df = df.astype(object).where(pd.notnull(df), None)
+    df["city"] = city_name
+    return df.to_dict("records")
+
+
+def same_value(a, b) -> bool:
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, float) and math.isnan(a):
+        return math.isnan(b)
+    return a == b
+
+
+def same_documents(expected: list[dict], actual: list[dict]) -> bool:
+    if len(expected) != len(actual):
+        return False
+    for e, a in zip(expected, actual):
+        if list(e) != list(a) or not all(same_value(e[k], a[k]) for k in e):
+            return False
+    return True
+
+
+def bench_file(city: str, path: Path, batch_size: int) -> bool:
+    chunks = [normalize_columns(c) for c in iter_artifact_file(path, batch_size)]
+    rows = sum(len(c) for c in chunks)
+    if not rows:
+        return True
+
+    start = time.perf_counter()
+    expected = [legacy_documents(c, city) for c in chunks]
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [frame_documents(c, city=city) for c in chunks]
+    new_s = time.perf_counter() - start
+
+    same = all(same_documents(e, a) for e, a in zip(expected, actual))
+    status = "identical" if same else "❌ DIFFERS"
+    print(
+        f"  {city + '/' + path.stem:<34} {rows:>9,} rows  "
+        f"legacy {rows / legacy_s:>9,.0f}/s  new {rows / new_s:>9,.0f}/s  "
+        f"{legacy_s / new_s:>5.1f}x  {status}"
+    )
+    return same
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Upload documents: to_dict('records') vs frame_documents")
+    parser.add_argument("cities", nargs="*", help="Cities (default: every folder in data/processed)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("⏱️  UPLOAD DOCUMENTS: astype(object) + to_dict vs column-wise")
+    print("=" * 70)
+
+    cities = args.cities or sorted(p.name for p in PROCESSED_DIR.iterdir() if p.is_dir())
+    ok = True
+    for city in cities:
+        for name in UPLOAD_ARTIFACTS:
+            path = find_artifact(PROCESSED_DIR / city, name)
+            if path is None:
+                print(f"  ⚠️  {city}/{name}: missing, skipped")
+                continue
+            ok &= bench_file(city, path, args.batch_size)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Parity check + benchmark for single-pass word counting (scripts/word_counts.py).
+
+For each city, builds the review_words rows with the previous per-neighborhood
+re-filtering loop (copied below) and with count_reviews() at 1..N workers,
+fails if any row differs (word, frequency and order), and reports timings.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.word_counts
+    python -m benchmarks.word_counts amsterdam --workers 4 --chunksize 5000
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import pandas as pd
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from scripts.artifacts import read_artifact  # noqa: E402
+from scripts.review_language import load_review_language, english_review_ids  # noqa: E402
+from scripts.word_counts import clean_text, count_reviews, default_stop_words, CHUNK_SIZE  # noqa: E402
+
+DATA_DIR = BACKEND_DIR / "data"
+
+CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+
+def load_reviews(city: str) -> pd.DataFrame | None:
+    reviews_path = DATA_DIR / "raw" / city / "reviews.csv"
+    if not reviews_path.exists():
+        return None
+    reviews = pd.read_csv(reviews_path, usecols=["id", "listing_id", "comments"])
+    listings = read_artifact(DATA_DIR / "processed" / city, "listings_clean", columns=["listing_id", "neighborhood"])
+    reviews = reviews.merge(listings, on="listing_id", how="inner")
+    english_ids = english_review_ids(load_review_language(city, data_dir=DATA_DIR))
+    return reviews[reviews["id"].isin(english_ids)]
+
+
+def legacy_rows(reviews: pd.DataFrame, stop_words) -> list[tuple]:
+    rows = []
+    for neighborhood in reviews["neighborhood"].dropna().unique():
+        neighborhood_reviews = reviews[reviews["neighborhood"] == neighborhood]
+        all_words = []
+        for comment in neighborhood_reviews["comments"].dropna():
+            all_words.extend(clean_text(comment, stop_words))
+        rows += [(neighborhood, w, f) for w, f in Counter(all_words).most_common(100)]
+
+    all_words = []
+    for comment in reviews["comments"].dropna():
+        all_words.extend(clean_text(comment, stop_words))
+    rows += [(None, w, f) for w, f in Counter(all_words).most_common(200)]
+    return rows
+
+
+def single_pass_rows(reviews: pd.DataFrame, stop_words, workers: int, chunksize: int) -> list[tuple]:
+    counts = count_reviews(reviews, stop_words, workers=workers, chunksize=chunksize)
+    rows = []
+    for neighborhood, word_counts in counts.neighborhoods.items():
+        if neighborhood is not None:
+            rows += [(neighborhood, w, f) for w, f in word_counts.most_common(100)]
+    rows += [(None, w, f) for w, f in counts.city_counts().most_common(200)]
+    return rows
+
+
+def bench_city(city: str, stop_words, max_workers: int, chunksize: int) -> bool:
+    try:
+        reviews = load_reviews(city)
+    except FileNotFoundError:
+        reviews = None
+    if reviews is None:
+        print(f"  ⚠️  {city}: no reviews/listings_clean, skipped")
+        return True
+
+    start = time.perf_counter()
+    expected = legacy_rows(reviews, stop_words)
+    legacy_s = time.perf_counter() - start
+    print(f"  {city:<10} {len(reviews):>9,} reviews  legacy {legacy_s:>7.2f}s")
+
+    ok = True
+    workers = 1
+    while workers <= max_workers:
+        start = time.perf_counter()
+        actual = single_pass_rows(reviews, stop_words, workers, chunksize)
+        elapsed = time.perf_counter() - start
+
+        same = actual == expected
+        ok &= same
+        status = "identical" if same else "❌ DIFFERS"
+        print(f"  {'':<10} {workers:>9} worker(s) {elapsed:>7.2f}s  {legacy_s / elapsed:>5.1f}x  {status}")
+        workers *= 2
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Word counting: legacy loop vs single pass")
+    parser.add_argument("cities", nargs="*", help=f"Cities (default: {', '.join(CITIES)})")
+    parser.add_argument("--workers", type=int, default=4, help="Highest worker count to try")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    stop_words = default_stop_words()
+    print("=" * 70)
+    print("⏱️  WORD COUNTS: per-neighborhood re-filtering vs single pass")
+    print("=" * 70)
+
+    ok = all([bench_city(c, stop_words, args.workers, args.chunksize) for c in args.cities or CITIES])
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,5 +3,22 @@ import os
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'inn-sight-dev-key'
     MONGO_URI = os.environ.get('MONGO_URI') or 'mongodb://localhost:27017'
-    MONGO_DB = 'innsight_db'
-    ALLOWED_CITIES = {"amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"}
\ No newline at end of file
+    MONGO_DB = os.environ.get('MONGO_DB') or 'innsight_db'
+    # data/processed artifact format: parquet | csv | both
+    ARTIFACT_FORMAT = os.environ.get('ARTIFACT_FORMAT') or 'parquet'
+    ALLOWED_CITIES = {"amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"}
+
+    # API response cache, shared by the gunicorn workers (see utils/cache.py):
+    # FileSystemCache (one host) | RedisCache (CACHE_REDIS_URL) | SimpleCache (per process)
+    CACHE_TYPE = os.environ.get('CACHE_TYPE') or 'FileSystemCache'
+    CACHE_DIR = os.environ.get('CACHE_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'cache', 'api')
+    CACHE_THRESHOLD = int(os.environ.get('CACHE_THRESHOLD') or 500)
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL') or 'redis://localhost:6379/0'
+    CACHE_KEY_PREFIX = 'innsight:'
+    CACHE_DEFAULT_TIMEOUT = 300  # 5 minutes
+    # Cache keys carry the dataset version (utils/dataset_version.py): once one is
+    # published, entries live until the next load (or this many seconds)
+    CACHE_VERSIONED_TIMEOUT = int(os.environ.get('CACHE_VERSIONED_TIMEOUT') or 7 * 24 * 3600)
+    DATASET_VERSION_POLL = int(os.environ.get('DATASET_VERSION_POLL') or 30)  # seconds
+    # Cache-Control max-age of the read endpoints (utils/http_cache.py); 0 = revalidate every time
+    HTTP_CACHE_MAX_AGE = int(os.environ.get('HTTP_CACHE_MAX_AGE') or 0)
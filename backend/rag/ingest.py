@@ -23,9 +23,12 @@ BACKEND_DIR = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(BACKEND_DIR))
 
 from rag.vector_store import FAISSStore  # noqa: E402
+from scripts.artifacts import artifact_exists, read_artifact  # noqa: E402
+from scripts.review_language import load_review_language, english_review_ids  # noqa: E402
 
-RAW_DATA_DIR = BACKEND_DIR / "data" / "raw"
-PROCESSED_DIR = BACKEND_DIR / "data" / "processed"
+DATA_DIR = BACKEND_DIR / "data"
+RAW_DATA_DIR = DATA_DIR / "raw"
+PROCESSED_DIR = DATA_DIR / "processed"
 RAG_DATA_DIR = BACKEND_DIR / "rag_data"
 
 CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
@@ -35,64 +38,32 @@ DEFAULT_MAX_REVIEWS = 2000
 MIN_REVIEW_LENGTH = 30
 
 
-# ===================================================================
-# Helpers
-# ===================================================================
-
-def is_likely_english(text) -> bool:
-    """Quick heuristic English detection (matches sentiment_etl logic)."""
-    if pd.isna(text) or len(str(text)) < 10:
-        return False
-
-    text_lower = str(text).lower()
-
-    non_english_markers = [
-        "het", "een", "van", "voor", "zeer", "erg", "mooie", "zijn",
-        "sehr", "gut", "und", "ist", "wir", "schön",
-        "molto", "bella", "ottimo", "bellissimo", "siamo", "della",
-        "très", "bien", "nous", "était", "avec", "merci",
-        "muy", "estaba", "todo", "excelente",
-    ]
-    first_words = text_lower.split()[:5]
-    for word in first_words:
-        if word in non_english_markers:
-            return False
-
-    english_markers = [
-        "the", "was", "very", "great", "nice", "good", "we", "our",
-        "had", "place", "location", "stay", "apartment", "host",
-        "clean", "would", "recommend", "is", "it", "and", "but",
-    ]
-    english_count = sum(1 for w in text_lower.split() if w in english_markers)
-    return english_count >= 2
-
-
 # ===================================================================
 # Review loading
 # ===================================================================
 
 def load_reviews(city: str, max_reviews: int) -> list[dict]:
-    """Read raw reviews CSV, filter English, map to neighborhoods."""
+    """Read raw reviews CSV, keep English (reviews_language artifact), map to neighborhoods."""
     reviews_path = RAW_DATA_DIR / city / "reviews.csv"
-    listings_path = PROCESSED_DIR / city / "listings_clean.csv"
 
     if not reviews_path.exists():
         print(f"  ⚠️  No reviews.csv for {city}")
         return []
 
-    reviews = pd.read_csv(reviews_path, usecols=["listing_id", "comments"])
+    reviews = pd.read_csv(reviews_path, usecols=["id", "listing_id", "comments"])
 
     # Neighbourhood lookup from cleaned listings
     neighborhood_map: dict = {}
-    if listings_path.exists():
-        listings = pd.read_csv(listings_path, usecols=["listing_id", "neighborhood"])
+    if artifact_exists(PROCESSED_DIR / city, "listings_clean"):
+        listings = read_artifact(PROCESSED_DIR / city, "listings_clean", columns=["listing_id", "neighborhood"])
         neighborhood_map = dict(zip(listings["listing_id"], listings["neighborhood"]))
 
     # Filter: English + minimum length
-    mask = reviews["comments"].apply(
-        lambda x: isinstance(x, str) and len(x) >= MIN_REVIEW_LENGTH and is_likely_english(x)
+    english_ids = english_review_ids(
+        load_review_language(city, data_dir=DATA_DIR),
+        min_length=MIN_REVIEW_LENGTH,
     )
-    reviews = reviews[mask]
+    reviews = reviews[reviews["id"].isin(english_ids)]
 
     # Sample down if needed
     if len(reviews) > max_reviews:
@@ -1,13 +1,15 @@
-from flask import request, current_app
-from flask_restx import Namespace, Resource
+from flask import request
+from flask_restx import Namespace
+from utils.http_cache import CachedResource
 from utils.db import get_db
+from utils.cache import get_or_set
 from config import Config
 
 ns = Namespace("analytics", path="/api/analytics", description="General analytics overview")
 
 
 @ns.route("")
-class AnalyticsResource(Resource):
+class AnalyticsResource(CachedResource):
     def get(self):
         """
         Query params:
@@ -23,11 +25,6 @@ class AnalyticsResource(Resource):
 
 
         cache_key = f"analytics_{city if city else 'all'}"
-        cache = current_app.cache
-
-        cached = cache.get(cache_key)
-        if cached:
-            return cached, 200
 
         db = get_db()
 
@@ -35,7 +32,7 @@ class AnalyticsResource(Resource):
         if city:
             match_stage["city"] = city
 
-        try:
+        def query():
             # Basic city overview (fast, no giant arrays)
             pipeline = [
                 {"$match": match_stage},
@@ -72,8 +69,9 @@ class AnalyticsResource(Resource):
                         results[0]["top_neighborhood"] = None
                         results[0]["top_neigh_count"] = 0
 
-            cache.set(cache_key, results, timeout=300)
-            return results, 200
+            return results
 
+        try:
+            return get_or_set(cache_key, query, timeout=300), 200
         except Exception as e:
             return {"error": f"Analytics query failed: {str(e)}"}, 500
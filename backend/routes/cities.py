@@ -1,23 +1,16 @@
-from flask import current_app
-from flask_restx import Namespace, Resource
+from flask_restx import Namespace
+from utils.http_cache import CachedResource
 from config import Config
+from utils.cache import get_or_set
 
 ns = Namespace("cities", path="/api/cities", description="City endpoints")
 
 
 @ns.route("")
-class CitiesResource(Resource):
+class CitiesResource(CachedResource):
     def get(self):
-        cache = current_app.cache
-
-        cached = cache.get("cities_list")
-        if cached:
-            return cached, 200
-
-        result = {"cities": sorted(Config.ALLOWED_CITIES)}
-
         # Cache for 10 minutes
-        cache.set("cities_list", result, timeout=600)
+        result = get_or_set("cities_list", lambda: {"cities": sorted(Config.ALLOWED_CITIES)}, timeout=600)
 
         return result, 200
 
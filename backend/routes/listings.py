@@ -1,11 +1,23 @@
-from flask import request, current_app
-from flask_restx import Namespace, Resource
+from flask import Response, request, stream_with_context
+from flask_restx import Namespace
+from utils.http_cache import CachedResource
 from utils.db import get_db
+from utils.cache import get_or_set
+from utils.listings_payload import payload_response
 from config import Config
+import base64
+import itertools
+import json
 import math
+import traceback
 
 ns = Namespace("listings", path="/api", description="Listings and map endpoints")
 
+PAGE_SIZE_MAX = 5000
+# stream=1: documents fetched per cursor batch / sent per chunk
+STREAM_BATCH_SIZE = 1000
+STREAM_CHUNK_DOCS = 200
+
 
 def _clean_nan(v):
     return None if isinstance(v, float) and math.isnan(v) else v
@@ -36,9 +48,48 @@ def _validate_city(city: str | None):
     return True
 
 
+def _encode_cursor(listing_id) -> str:
+    """Opaque `next` token: the last listing_id of the page."""
+    raw = json.dumps({"after": listing_id}).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(token: str):
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        return json.loads(raw)["after"]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("invalid cursor") from None
+
+
+def _stream_json(docs):
+    """
+    JSON array written from the cursor as documents arrive: memory stays at one batch.
+
+    The 200 status is sent with the first chunk, so a database error after
+    that is logged and the array is closed with a last {"error": ...}
+    element (listing documents have no "error" field) the client can check
+    for, instead of ending as truncated JSON.
+    """
+    chunk = ["["]
+    sent = 0
+    try:
+        for doc in docs:
+            chunk.append(("," if sent else "") + json.dumps(_clean_doc(doc), separators=(",", ":")))
+            sent += 1
+            if len(chunk) >= STREAM_CHUNK_DOCS:
+                yield "".join(chunk)
+                chunk = []
+    except Exception as e:
+        print(f"❌ listings stream error after {sent} documents: {str(e)}")
+        traceback.print_exc()
+        chunk.append(("," if sent else "") + json.dumps({"error": f"Database query failed: {str(e)}"}))
+    chunk.append("]")
+    yield "".join(chunk)
+
 
 @ns.route("/listings")
-class ListingsResource(Resource):
+class ListingsResource(CachedResource):
     def get(self):
         """
         Full listings (used for list/table and also OK for map).
@@ -49,6 +100,13 @@ class ListingsResource(Resource):
           - min_price (optional)
           - max_price (optional)
           - limit (optional, default=500, max=50000)
+          - page_size (optional, max=5000) / cursor (optional): one page by listing_id,
+            returned as {"listings": [...], "next": <cursor of the next page or null>};
+            limit is ignored
+          - stream (optional, 1|true): JSON array streamed from the cursor. Bypasses the
+            versioned response cache and gets no ETag (every request runs the query);
+            a database error mid-stream ends the array with an {"error": ...} element
+        Accept selects JSON (default), columnar JSON or Arrow (utils/listings_payload.py).
         """
         db = get_db()
 
@@ -59,6 +117,9 @@ class ListingsResource(Resource):
             max_price = request.args.get("max_price")
             room_type = request.args.get("room_type")
             limit = int(request.args.get("limit", 500))
+            page_size = request.args.get("page_size")
+            cursor_token = request.args.get("cursor")
+            stream = request.args.get("stream", "").lower() in ("1", "true")
 
             if not _validate_city(city):
                 return {"error": "Invalid city"}, 400
@@ -78,15 +139,14 @@ class ListingsResource(Resource):
             if limit < 0:
                 limit = 0
 
+            if page_size is not None or cursor_token:
+                page_size = min(max(int(page_size or 500), 1), PAGE_SIZE_MAX)
+            after = _decode_cursor(cursor_token) if cursor_token else None
+
         except ValueError as e:
             return {"error": f"Invalid parameter: {str(e)}"}, 400
 
         cache_key = f"listings_{city}_{neighborhood}_{min_price}_{max_price}_{room_type}_{limit}"
-        cache = current_app.cache
-
-        cached = cache.get(cache_key)
-        if cached:
-            return cached, 200
 
         query = {}
 
@@ -106,16 +166,42 @@ class ListingsResource(Resource):
             if max_price is not None:
                 query["price"]["$lte"] = max_price
 
-        try:
+        def fetch():
             cursor = db.listings_map.find(query, {"_id": 0})  # exclude _id at query-time
 
             if limit and limit > 0:
                 cursor = cursor.limit(limit)
 
-            results = [_clean_doc(doc) for doc in cursor]
+            return [_clean_doc(doc) for doc in cursor]
 
-            cache.set(cache_key, results, timeout=300)
-            return results, 200
+        def fetch_page():
+            # Keyset: listing_id > the cursor's, one extra document to know if there is a next page
+            page_query = {**query, "listing_id": {"$gt": after}} if after is not None else query
+            cursor = db.listings_map.find(page_query, {"_id": 0}).sort("listing_id", 1).limit(page_size + 1)
+            docs = [_clean_doc(doc) for doc in cursor]
+            more = len(docs) > page_size
+            docs = docs[:page_size]
+            return {"listings": docs, "next": _encode_cursor(docs[-1]["listing_id"]) if more else None}
+
+        try:
+            if stream:
+                cursor = db.listings_map.find(query, {"_id": 0}).batch_size(STREAM_BATCH_SIZE)
+                if limit and limit > 0:
+                    cursor = cursor.limit(limit)
+                # Run the query before the first byte: an error here is still a 500
+                first = next(cursor, None)
+                docs = itertools.chain([first], cursor) if first is not None else iter(())
+                return Response(
+                    stream_with_context(_stream_json(docs)),
+                    mimetype="application/json",
+                    headers={"Cache-Control": "no-store"},
+                )
+
+            if page_size:
+                page_key = f"{cache_key}_page_{page_size}_{cursor_token}"
+                return get_or_set(page_key, fetch_page, timeout=300), 200
+
+            return payload_response(cache_key, fetch, timeout=300)
 
         except Exception as e:
             print(f"❌ listings query error: {str(e)}")
@@ -125,7 +211,7 @@ class ListingsResource(Resource):
 
 
 @ns.route("/listings-map")
-class ListingsMapResource(Resource):
+class ListingsMapResource(CachedResource):
     def get(self):
         """
         Lightweight listings for map markers.
@@ -134,6 +220,7 @@ class ListingsMapResource(Resource):
           - city (required for performance)
           - neighborhood (optional)
           - limit (optional, default=5000, max=50000)
+        Accept selects JSON (default), columnar JSON or Arrow (utils/listings_payload.py).
         """
         # reuse ListingsResource logic by calling it with a different default limit
         # (keep it simple, no duplication)
@@ -158,37 +245,33 @@ class ListingsMapResource(Resource):
             limit = 0
 
         cache_key = f"listings_map_{city}_{neighborhood}_{limit}"
-        cache = current_app.cache
-        cached = cache.get(cache_key)
-        if cached:
-            return cached, 200
 
         query = {"city": city}
         if neighborhood:
             query["neighborhood"] = neighborhood
 
-        try:
-            # Only fields needed for map markers + tooltip
-            projection = {
-                "_id": 0,
-                "listing_id": 1,
-                "listing_name": 1,
-                "latitude": 1,
-                "longitude": 1,
-                "price": 1,
-                "room_type": 1,
-                "neighborhood": 1,
-                "sentiment_mean": 1,
-                "sentiment_category": 1,
-                "review_count": 1,
-                "city": 1,
-            }
-
+        # Only fields needed for map markers + tooltip
+        projection = {
+            "_id": 0,
+            "listing_id": 1,
+            "listing_name": 1,
+            "latitude": 1,
+            "longitude": 1,
+            "price": 1,
+            "room_type": 1,
+            "neighborhood": 1,
+            "sentiment_mean": 1,
+            "sentiment_category": 1,
+            "review_count": 1,
+            "city": 1,
+        }
+
+        def fetch():
             cursor = db.listings_map.find(query, projection).limit(limit) if limit else db.listings_map.find(query, projection)
-            results = [_clean_doc(doc) for doc in cursor]
+            return [_clean_doc(doc) for doc in cursor]
 
-            cache.set(cache_key, results, timeout=300)
-            return results, 200
+        try:
+            return payload_response(cache_key, fetch, timeout=300)
 
         except Exception as e:
             print(f"❌ listings-map query error: {str(e)}")
@@ -1,6 +1,8 @@
-from flask import request, current_app
-from flask_restx import Namespace, Resource
+from flask import request
+from flask_restx import Namespace
+from utils.http_cache import CachedResource
 from utils.db import get_db
+from utils.cache import get_or_set
 from config import Config
 import math
 
@@ -22,7 +24,7 @@ def _clean_nan(obj):
 
 
 @ns.route("")
-class NeighborhoodSentimentResource(Resource):
+class NeighborhoodSentimentResource(CachedResource):
     def get(self):
         """
         Query params:
@@ -39,15 +41,10 @@ class NeighborhoodSentimentResource(Resource):
         city = city.lower()
 
         cache_key = f"neighborhood_sentiment_{city}"
-        cache = current_app.cache
-
-        cached = cache.get(cache_key)
-        if cached:
-            return cached, 200
 
         db = get_db()
 
-        try:
+        def query():
             cursor = (
                 db.neighborhood_sentiment
                   .find({"city": city}, {"_id": 0})
@@ -56,8 +53,9 @@ class NeighborhoodSentimentResource(Resource):
             results = list(cursor)
             results = _clean_nan(results)
 
-            cache.set(cache_key, results, timeout=600)
-            return results, 200
+            return results
 
+        try:
+            return get_or_set(cache_key, query, timeout=600), 200
         except Exception as e:
             return {"error": f"Sentiment query failed: {str(e)}"}, 500
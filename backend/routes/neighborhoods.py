@@ -1,5 +1,6 @@
 from flask import request
-from flask_restx import Namespace, Resource
+from flask_restx import Namespace
+from utils.http_cache import CachedResource
 from utils.db import get_db
 from config import Config
 
@@ -7,7 +8,7 @@ ns = Namespace("neighborhoods", path="/api/neighborhoods", description="Neighbor
 
 
 @ns.route("")
-class NeighborhoodsResource(Resource):
+class NeighborhoodsResource(CachedResource):
     def get(self):
         """
         Get neighborhoods for a city.
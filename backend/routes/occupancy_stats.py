@@ -1,6 +1,8 @@
-from flask import request, current_app
-from flask_restx import Namespace, Resource
+from flask import request
+from flask_restx import Namespace
+from utils.http_cache import CachedResource
 from utils.db import get_db
+from utils.cache import get_or_set
 from config import Config
 
 ns = Namespace("occupancy", path="/api/occupancy", description="Occupancy endpoints")
@@ -9,7 +11,7 @@ ALLOWED_LEVELS = {"city", "neighborhood"}
 
 
 @ns.route("")
-class OccupancyResource(Resource):
+class OccupancyResource(CachedResource):
     def get(self):
         """
         Query params:
@@ -32,11 +34,6 @@ class OccupancyResource(Resource):
 
             # Normalize cache key after lowercasing
             cache_key = f"occupancy_{city}_{neighborhood}_{level}"
-            cache = current_app.cache
-
-            cached = cache.get(cache_key)
-            if cached:
-                return cached, 200
 
             query = {"level": level}
             if city:
@@ -48,17 +45,17 @@ class OccupancyResource(Resource):
 
             db = get_db()
 
-            if level == "city":
-                doc = db.occupancy_by_month.find_one(query, {"_id": 0})
-                results = [doc] if doc else []
-            else:
-                results = list(
+            def fetch():
+                if level == "city":
+                    doc = db.occupancy_by_month.find_one(query, {"_id": 0})
+                    return [doc] if doc else []
+                return list(
                     db.occupancy_by_month
                       .find(query, {"_id": 0})
                       .sort([("neighborhood", 1)])
                 )
 
-            cache.set(cache_key, results, timeout=600)
+            results = get_or_set(cache_key, fetch, timeout=600)
             return results, 200
 
         except Exception as e:
@@ -1,13 +1,15 @@
-from flask import request, current_app
-from flask_restx import Namespace, Resource
+from flask import request
+from flask_restx import Namespace
+from utils.http_cache import CachedResource
 from utils.db import get_db
+from utils.cache import get_or_set
 from config import Config
 
 ns = Namespace("reviews_sentiment", path="/api/reviews-sentiment", description="Review-level sentiment endpoints")
 
 
 @ns.route("")
-class ReviewsSentimentResource(Resource):
+class ReviewsSentimentResource(CachedResource):
     def get(self):
         """
         Query params:
@@ -30,17 +32,12 @@ class ReviewsSentimentResource(Resource):
             return {"error": "Invalid limit parameter (must be number)"}, 400
 
         cache_key = f"reviews_sentiment_{city if city else 'all'}_{limit}"
-        cache = current_app.cache
-
-        cached = cache.get(cache_key)
-        if cached:
-            return cached, 200
 
         db = get_db()
 
         query = {"city": city} if city else {}
 
-        try:
+        def fetch():
             cursor = (
                 db.reviews_sentiment
                   .find(query, {"_id": 0})
@@ -49,8 +46,9 @@ class ReviewsSentimentResource(Resource):
             )
             results = list(cursor)
 
-            cache.set(cache_key, results, timeout=300)
-            return results, 200
+            return results
 
+        try:
+            return get_or_set(cache_key, fetch, timeout=300), 200
         except Exception as e:
             return {"error": f"Reviews query failed: {str(e)}"}, 500
@@ -1,13 +1,15 @@
-from flask import request, current_app
-from flask_restx import Namespace, Resource
+from flask import request
+from flask_restx import Namespace
+from utils.http_cache import CachedResource
 from utils.db import get_db
+from utils.cache import get_or_set
 from config import Config
 
 ns = Namespace("room_types", path="/api/room-types", description="Room type distribution endpoints")
 
 
 @ns.route("")
-class RoomTypesResource(Resource):
+class RoomTypesResource(CachedResource):
     def get(self):
         """
         Query params:
@@ -24,11 +26,6 @@ class RoomTypesResource(Resource):
                 return {"error": "City must be amsterdam, lisbon, sicily, bordeaux, crete or rome"}, 400
 
             cache_key = f"room_types_{city}_{neighborhood}_{level}"
-            cache = current_app.cache
-
-            cached = cache.get(cache_key)
-            if cached:
-                return cached, 200
 
             query = {}
             if city:
@@ -39,14 +36,13 @@ class RoomTypesResource(Resource):
                 query["level"] = level
 
             db = get_db()
-            results = list(
+            results = get_or_set(cache_key, lambda: list(
                 db.room_type_distribution
                   .find(query, {"_id": 0})
                   .sort("total_listings", -1)
-            )
+            ), timeout=600)
 
             # return empty list with 200 for frontend simplicity
-            cache.set(cache_key, results, timeout=600)
             return results, 200
 
         except Exception as e:
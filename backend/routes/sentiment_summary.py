@@ -1,5 +1,6 @@
 from flask import request
-from flask_restx import Namespace, Resource
+from flask_restx import Namespace
+from utils.http_cache import CachedResource
 from utils.db import get_db
 from config import Config
 import math
@@ -33,7 +34,7 @@ def _clean_numbers(results):
 
 
 @ns.route("")
-class SentimentSummaryResource(Resource):
+class SentimentSummaryResource(CachedResource):
     def get(self):
         """
         Query params:
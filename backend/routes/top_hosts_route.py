@@ -1,6 +1,8 @@
-from flask import request, current_app
-from flask_restx import Namespace, Resource
+from flask import request
+from flask_restx import Namespace
+from utils.http_cache import CachedResource
 from utils.db import get_db
+from utils.cache import get_or_set
 from config import Config
 import math
 
@@ -19,7 +21,7 @@ def _clean_nan(obj):
 
 
 @ns.route("")
-class TopHostsResource(Resource):
+class TopHostsResource(CachedResource):
     def get(self):
         """
         Query params:
@@ -36,11 +38,6 @@ class TopHostsResource(Resource):
                 return {"error": "City must be amsterdam, lisbon, sicily, bordeaux, crete or rome"}, 400
 
             cache_key = f"top_hosts_{city}_{neighborhood}_{level}"
-            cache = current_app.cache
-
-            cached = cache.get(cache_key)
-            if cached:
-                return cached, 200
 
             query = {}
             if city:
@@ -52,15 +49,11 @@ class TopHostsResource(Resource):
 
             db = get_db()
 
-            results = list(
+            results = get_or_set(cache_key, lambda: _clean_nan(list(
                 db.top_hosts_agg
                   .find(query, {"_id": 0})
                   .sort([("level", 1), ("neighborhood", 1)])
-            )
-
-            results = _clean_nan(results)
-
-            cache.set(cache_key, results, timeout=600)
+            )), timeout=600)
             return results, 200
 
         except Exception as e:
@@ -1,6 +1,8 @@
-from flask import request, current_app
-from flask_restx import Namespace, Resource
+from flask import request
+from flask_restx import Namespace
+from utils.http_cache import CachedResource
 from utils.db import get_db
+from utils.cache import get_or_set
 from config import Config
 
 ns = Namespace("wordcloud", path="/api/wordcloud", description="Wordcloud endpoints")
@@ -23,7 +25,7 @@ def _image_url(city: str, neighborhood: str | None) -> str:
 
 
 @ns.route("")
-class WordCloudResource(Resource):
+class WordCloudResource(CachedResource):
     def get(self):
         """
         Query params:
@@ -54,11 +56,6 @@ class WordCloudResource(Resource):
             return {"error": "Invalid limit parameter (must be number)"}, 400
 
         cache_key = f"wordcloud_{city}_{neighborhood if neighborhood else 'all'}_{limit}"
-        cache = current_app.cache
-
-        cached = cache.get(cache_key)
-        if cached:
-            return cached, 200
 
         db = get_db()
 
@@ -69,7 +66,7 @@ class WordCloudResource(Resource):
             # city-level words are stored with neighborhood: None in your ETL
             query["neighborhood"] = None
 
-        try:
+        def fetch():
             cursor = db.review_words.find(query, {"_id": 0}).sort("frequency", -1).limit(limit)
             words = list(cursor)
 
@@ -80,8 +77,9 @@ class WordCloudResource(Resource):
                 "words": words
             }
 
-            cache.set(cache_key, result, timeout=900)
-            return result, 200
+            return result
 
+        try:
+            return get_or_set(cache_key, fetch, timeout=900), 200
         except Exception as e:
             return {"error": f"Wordcloud query failed: {str(e)}"}, 500
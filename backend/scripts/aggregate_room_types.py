@@ -4,6 +4,10 @@ Aggregate room type distribution by neighborhood and city
 
 Input: listings_clean
 Output: room_type_distribution
+
+One $group on (neighborhood, room_type) per city; the city-level counts are
+summed from the same result and the city's documents written with a single
+insert_many.
 """
 
 import sys
@@ -12,6 +16,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from pymongo import MongoClient
 from config import Config
+from scripts.collection_swap import swap_collection
 
 
 def _detect_neighborhood_field(db, city: str) -> str:
@@ -29,108 +34,102 @@ def _detect_neighborhood_field(db, city: str) -> str:
     return 'neighborhood'
 
 
-def aggregate_room_types():
+def room_type_distribution(counts: dict) -> dict:
+    """{room_type: count} -> total_listings + room_types (most common first)."""
+    total = sum(counts.values())
+    ordered = sorted(counts.items(), key=lambda kv: (-kv[1], str(kv[0])))
+    return {
+        'total_listings': int(total),
+        'room_types': {
+            room_type: {
+                'count': int(count),
+                'percentage': round((count / total) * 100, 2) if total else 0.0
+            }
+            for room_type, count in ordered
+        }
+    }
+
+
+def city_room_type_docs(db, city: str) -> list[dict]:
+    """
+    room_type_distribution documents of one city from a single $group on
+    (neighborhood, room_type): one doc per neighborhood, and the city doc
+    from the sum over all of them (listings without a neighborhood count
+    city-wide only).
+    """
+    neigh_field = _detect_neighborhood_field(db, city)
+
+    pipeline = [
+        {'$match': {'city': city, 'room_type': {'$ne': None}}},
+        {'$group': {
+            '_id': {'neighborhood': f'${neigh_field}', 'room_type': '$room_type'},
+            'count': {'$sum': 1},
+        }},
+    ]
+
+    city_counts = {}
+    neigh_counts = {}
+    for r in db.listings_clean.aggregate(pipeline):
+        neigh, room_type = r['_id'].get('neighborhood'), r['_id']['room_type']
+        city_counts[room_type] = city_counts.get(room_type, 0) + r['count']
+        if neigh is not None:
+            neigh_counts.setdefault(neigh, {})[room_type] = r['count']
+
+    docs = []
+    if city_counts:
+        docs.append({
+            'city': city,
+            'neighborhood': None,
+            'level': 'city',
+            **room_type_distribution(city_counts),
+        })
+
+    for neigh in sorted(neigh_counts, key=str):
+        docs.append({
+            'city': city,
+            'neighborhood': neigh,       # canonical output field
+            'level': 'neighborhood',
+            **room_type_distribution(neigh_counts[neigh]),
+        })
+    return docs
+
+
+def aggregate_room_types(cities=None):
     client = MongoClient(Config.MONGO_URI)
     db = client[Config.MONGO_DB]
 
     print("🔄 Aggregating room type distribution...")
 
-    # Drop existing collection
-    db.room_type_distribution.drop()
-
-    cities = ['amsterdam', 'rome', 'lisbon', 'sicily', 'bordeaux', 'crete']
-
-    for city in cities:
-        print(f"\n📊 Processing {city}...")
-
-        neigh_field = _detect_neighborhood_field(db, city)
-
-        # ----------------------------
-        # 1) CITY LEVEL
-        # ----------------------------
-        city_pipeline = [
-            {'$match': {'city': city, 'room_type': {'$ne': None}}},
-            {'$group': {'_id': '$room_type', 'count': {'$sum': 1}}},
-            {'$sort': {'count': -1}},
-        ]
-
-        city_results = list(db.listings_clean.aggregate(city_pipeline))
-
-        if city_results:
-            total_city = sum(r['count'] for r in city_results)
-
-            room_types = {
-                r['_id']: {
-                    'count': int(r['count']),
-                    'percentage': round((r['count'] / total_city) * 100, 2) if total_city else 0.0
-                }
-                for r in city_results
-            }
-
-            city_doc = {
-                'city': city,
-                'neighborhood': None,
-                'level': 'city',
-                'total_listings': int(total_city),
-                'room_types': room_types
-            }
-            db.room_type_distribution.insert_one(city_doc)
-            print(f"  ✅ City-level: {total_city:,} listings")
-        else:
-            print("  ⚠️  No city room_type data found")
-
-        # ----------------------------
-        # 2) NEIGHBORHOOD LEVEL
-        # ----------------------------
-        neighborhoods = db.listings_clean.distinct(
-            neigh_field,
-            {'city': city, neigh_field: {'$ne': None}}
-        )
-
-        inserted = 0
-        for neigh in neighborhoods:
-            neigh_pipeline = [
-                {'$match': {'city': city, neigh_field: neigh, 'room_type': {'$ne': None}}},
-                {'$group': {'_id': '$room_type', 'count': {'$sum': 1}}},
-                {'$sort': {'count': -1}},
-            ]
-
-            neigh_results = list(db.listings_clean.aggregate(neigh_pipeline))
-            if not neigh_results:
+    rebuild = cities is None
+    if rebuild:
+        cities = ['amsterdam', 'rome', 'lisbon', 'sicily', 'bordeaux', 'crete']
+
+    # Built in a staging collection (other cities copied over on a partial
+    # run) with the API indexes, then swapped in
+    with swap_collection(
+        db, 'room_type_distribution',
+        indexes=[[('city', 1), ('level', 1)], [('city', 1), ('neighborhood', 1)]],
+        cities=None if rebuild else cities,
+    ) as out:
+        for city in cities:
+            print(f"\n📊 Processing {city}...")
+
+            docs = city_room_type_docs(db, city)
+            if not docs:
+                print("  ⚠️  No city room_type data found")
                 continue
 
-            total_neigh = sum(r['count'] for r in neigh_results)
-            room_types = {
-                r['_id']: {
-                    'count': int(r['count']),
-                    'percentage': round((r['count'] / total_neigh) * 100, 2) if total_neigh else 0.0
-                }
-                for r in neigh_results
-            }
-
-            neigh_doc = {
-                'city': city,
-                'neighborhood': neigh,       # canonical output field
-                'level': 'neighborhood',
-                'total_listings': int(total_neigh),
-                'room_types': room_types
-            }
-            db.room_type_distribution.insert_one(neigh_doc)
-            inserted += 1
-
-        print(f"  ✅ Neighborhoods: {inserted}")
-
-    # Indexes
-    db.room_type_distribution.create_index([('city', 1), ('level', 1)])
-    db.room_type_distribution.create_index([('city', 1), ('neighborhood', 1)])
+            out.insert_many(docs)
+            print(f"  ✅ City-level: {docs[0]['total_listings']:,} listings")
+            print(f"  ✅ Neighborhoods: {len(docs) - 1}")
 
     total = db.room_type_distribution.count_documents({})
     print(f"\n✅ Room type distribution complete: {total} documents")
 
 
-def main():
+def main(cities=None):
     """Callable entrypoint for pipeline imports."""
-    aggregate_room_types()
+    aggregate_room_types(cities=cities)
     return True
 
 
@@ -3,8 +3,9 @@
 Aggregate sentiment summary from MongoDB using REVIEW-LEVEL truth.
 
 Source:
-  reviews_sentiment: {city, listing_id, sentiment_category, ...}  (English-filtered in ETL)
-  listings_clean: {listing_id, neighborhood (or neighbourhood), city, ...}
+  reviews_sentiment: {city, listing_id, neighborhood, sentiment_category, ...}
+    (English-filtered in ETL; neighborhood copied from listings_clean by
+    sentiment_etl.py, so no $lookup is needed)
 
 Output:
   sentiment_summary:
@@ -24,132 +25,131 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from pymongo import MongoClient
 from config import Config
+from scripts.collection_swap import swap_collection
 
 
-def aggregate_sentiment():
+CATEGORIES = ["positive", "neutral", "negative"]
+
+
+def summary_doc(city: str, neighborhood, pos: int, neu: int, neg: int) -> dict:
+    total = pos + neu + neg
+    return {
+        "city": city,
+        "neighborhood": neighborhood,
+        "level": "city" if neighborhood is None else "neighborhood",
+        "total_reviews": total,
+        "positive_count": pos,
+        "neutral_count": neu,
+        "negative_count": neg,
+        "positive": round(pos / total * 100, 1),
+        "neutral": round(neu / total * 100, 1),
+        "negative": round(neg / total * 100, 1),
+    }
+
+
+def city_sentiment_docs(db, city: str) -> list[dict]:
+    """sentiment_summary documents of one city: the city doc (if any reviews), then one per neighborhood."""
+    docs = []
+
+    # ----------------------------
+    # CITY LEVEL (direct from reviews_sentiment)
+    # ----------------------------
+    city_pipeline = [
+        {"$match": {"city": city, "sentiment_category": {"$in": CATEGORIES}}},
+        {"$group": {"_id": "$sentiment_category", "count": {"$sum": 1}}},
+    ]
+
+    city_counts = {r["_id"]: r["count"] for r in db.reviews_sentiment.aggregate(city_pipeline)}
+    pos = int(city_counts.get("positive", 0))
+    neu = int(city_counts.get("neutral", 0))
+    neg = int(city_counts.get("negative", 0))
+
+    if pos + neu + neg > 0:
+        docs.append(summary_doc(city, None, pos, neu, neg))
+
+    # ----------------------------
+    # NEIGHBORHOOD LEVEL
+    # ----------------------------
+    neigh_pipeline = [
+        {"$match": {
+            "city": city,
+            "neighborhood": {"$ne": None},
+            "sentiment_category": {"$in": CATEGORIES},
+        }},
+        {"$group": {
+            "_id": {"neighborhood": "$neighborhood", "category": "$sentiment_category"},
+            "count": {"$sum": 1}
+        }},
+        {"$group": {
+            "_id": "$_id.neighborhood",
+            "counts": {"$push": {"k": "$_id.category", "v": "$count"}},
+            "total_reviews": {"$sum": "$count"}
+        }},
+        {"$addFields": {"countsObj": {"$arrayToObject": "$counts"}}},
+        {"$project": {
+            "_id": 0,
+            "neighborhood": "$_id",
+            "total_reviews": 1,
+            "positive_count": {"$ifNull": ["$countsObj.positive", 0]},
+            "neutral_count": {"$ifNull": ["$countsObj.neutral", 0]},
+            "negative_count": {"$ifNull": ["$countsObj.negative", 0]},
+        }},
+        {"$sort": {"neighborhood": 1}},
+    ]
+
+    for n in db.reviews_sentiment.aggregate(neigh_pipeline):
+        if int(n.get("total_reviews", 0) or 0) <= 0:
+            continue
+
+        docs.append(summary_doc(
+            city,
+            n["neighborhood"],
+            int(n.get("positive_count", 0) or 0),
+            int(n.get("neutral_count", 0) or 0),
+            int(n.get("negative_count", 0) or 0),
+        ))
+    return docs
+
+
+def aggregate_sentiment(cities=None):
     client = MongoClient(Config.MONGO_URI)
     db = client[Config.MONGO_DB]
 
     print("🔄 Aggregating sentiment summary (from reviews_sentiment)...")
-    db.sentiment_summary.drop()
-
-    cities = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+    rebuild = cities is None
+    if rebuild:
+        cities = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
 
-    # Speed indexes
+    # Speed indexes: both levels are answered from the second one
     db.reviews_sentiment.create_index([("city", 1)])
-    db.reviews_sentiment.create_index([("listing_id", 1)])
-    db.listings_clean.create_index([("city", 1)])
-    db.listings_clean.create_index([("listing_id", 1)])
-
-    # Helpful for API
-    db.sentiment_summary.create_index([("city", 1), ("level", 1)])
-    db.sentiment_summary.create_index([("city", 1), ("neighborhood", 1)])
-
-    for city in cities:
-        print(f"\n📊 {city}")
-
-        # ----------------------------
-        # CITY LEVEL (direct from reviews_sentiment)
-        # ----------------------------
-        city_pipeline = [
-            {"$match": {"city": city, "sentiment_category": {"$in": ["positive", "neutral", "negative"]}}},
-            {"$group": {"_id": "$sentiment_category", "count": {"$sum": 1}}},
-        ]
-
-        city_counts = {r["_id"]: r["count"] for r in db.reviews_sentiment.aggregate(city_pipeline)}
-        pos = int(city_counts.get("positive", 0))
-        neu = int(city_counts.get("neutral", 0))
-        neg = int(city_counts.get("negative", 0))
-        total = pos + neu + neg
-
-        if total > 0:
-            db.sentiment_summary.insert_one({
-                "city": city,
-                "neighborhood": None,
-                "level": "city",
-                "total_reviews": total,
-                "positive_count": pos,
-                "neutral_count": neu,
-                "negative_count": neg,
-                "positive": round(pos / total * 100, 1),
-                "neutral": round(neu / total * 100, 1),
-                "negative": round(neg / total * 100, 1),
-            })
-            print(f"  ✅ City reviews: {total:,}")
-        else:
-            print("  ⚠️ No reviews found for city (reviews_sentiment empty?)")
-
-        # ----------------------------
-        # NEIGHBORHOOD LEVEL
-        # Join reviews_sentiment -> listings_clean to get neighborhood
-        # ----------------------------
-        neigh_pipeline = [
-            {"$match": {"city": city, "sentiment_category": {"$in": ["positive", "neutral", "negative"]}}},
-            {"$lookup": {
-                "from": "listings_clean",
-                "localField": "listing_id",
-                "foreignField": "listing_id",
-                "as": "listing"
-            }},
-            {"$unwind": "$listing"},
-            {"$addFields": {
-                "neighborhood_norm": {"$ifNull": ["$listing.neighborhood", "$listing.neighbourhood"]}
-            }},
-            {"$match": {"neighborhood_norm": {"$ne": None}}},
-            {"$group": {
-                "_id": {"neighborhood": "$neighborhood_norm", "category": "$sentiment_category"},
-                "count": {"$sum": 1}
-            }},
-            {"$group": {
-                "_id": "$_id.neighborhood",
-                "counts": {"$push": {"k": "$_id.category", "v": "$count"}},
-                "total_reviews": {"$sum": "$count"}
-            }},
-            {"$addFields": {"countsObj": {"$arrayToObject": "$counts"}}},
-            {"$project": {
-                "_id": 0,
-                "neighborhood": "$_id",
-                "total_reviews": 1,
-                "positive_count": {"$ifNull": ["$countsObj.positive", 0]},
-                "neutral_count": {"$ifNull": ["$countsObj.neutral", 0]},
-                "negative_count": {"$ifNull": ["$countsObj.negative", 0]},
-            }},
-        ]
-
-        neigh_docs = list(db.reviews_sentiment.aggregate(neigh_pipeline))
-
-        inserted = 0
-        for n in neigh_docs:
-            total_n = int(n.get("total_reviews", 0) or 0)
-            if total_n <= 0:
-                continue
-
-            pos_n = int(n.get("positive_count", 0) or 0)
-            neu_n = int(n.get("neutral_count", 0) or 0)
-            neg_n = int(n.get("negative_count", 0) or 0)
-
-            db.sentiment_summary.insert_one({
-                "city": city,
-                "neighborhood": n["neighborhood"],
-                "level": "neighborhood",
-                "total_reviews": total_n,
-                "positive_count": pos_n,
-                "neutral_count": neu_n,
-                "negative_count": neg_n,
-                "positive": round(pos_n / total_n * 100, 1),
-                "neutral": round(neu_n / total_n * 100, 1),
-                "negative": round(neg_n / total_n * 100, 1),
-            })
-            inserted += 1
-
-        print(f"  ✅ Neighborhoods: {inserted}")
+    db.reviews_sentiment.create_index([("city", 1), ("neighborhood", 1), ("sentiment_category", 1)])
+
+    # Built in a staging collection (other cities copied over on a partial
+    # run) with the API indexes, then swapped in
+    with swap_collection(
+        db, "sentiment_summary",
+        indexes=[[("city", 1), ("level", 1)], [("city", 1), ("neighborhood", 1)]],
+        cities=None if rebuild else cities,
+    ) as out:
+        for city in cities:
+            print(f"\n📊 {city}")
+
+            docs = city_sentiment_docs(db, city)
+            if docs:
+                out.insert_many(docs)
+
+            if docs and docs[0]["level"] == "city":
+                print(f"  ✅ City reviews: {docs[0]['total_reviews']:,}")
+            else:
+                print("  ⚠️ No reviews found for city (reviews_sentiment empty?)")
+            print(f"  ✅ Neighborhoods: {sum(d['level'] == 'neighborhood' for d in docs)}")
 
     total_docs = db.sentiment_summary.count_documents({})
     print(f"\n✅ DONE: {total_docs} sentiment summary docs")
 
 
-def main():
-    aggregate_sentiment()
+def main(cities=None):
+    aggregate_sentiment(cities=cities)
     return True
 
 
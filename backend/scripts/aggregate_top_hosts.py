@@ -4,6 +4,11 @@ Aggregate top 10 hosts by total listings per neighborhood and city.
 
 Input: listings_clean
 Output: top_hosts_agg
+
+One aggregation per city: listings are grouped once by (neighborhood, host)
+with partial sums, then a $facet ranks the hosts of every neighborhood with
+$topN and re-sums the partials per host for the city-level list. The city's
+documents are written with a single insert_many.
 """
 
 import sys
@@ -12,6 +17,15 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from pymongo import MongoClient
 from config import Config
+from scripts.collection_swap import swap_collection
+
+
+TOP_N = 10
+
+RATING_FIELD = "review_scores_rating"
+
+# Most listings first; host_id (then name) makes ties deterministic
+HOST_ORDER = {"total_listings": -1, "host_id": 1, "host_name": 1}
 
 
 def _detect_neighborhood_field(db, city: str) -> str:
@@ -25,139 +39,155 @@ def _detect_neighborhood_field(db, city: str) -> str:
     return "neighborhood"
 
 
-def _safe_avg_rating_in_range(field_name: str, lo: float = 0.0, hi: float = 5.0):
+def _rating_in_range(field_name: str, lo: float = 0.0, hi: float = 5.0):
     """
-    NaN-proof rating average:
-    - Keeps only ratings in [lo, hi] (Airbnb rating scale is 0..5 in your DB)
-    - Everything else (null, missing, strings, NaN) becomes null and is ignored by $avg
+    NaN-proof rating filter: only ratings in [lo, hi] count (Airbnb rating
+    scale is 0..5 in our DB); null, missing, strings and NaN are ignored.
     """
     return {
-        "$avg": {
-            "$cond": [
-                {
-                    "$and": [
-                        {"$gte": [f"${field_name}", lo]},
-                        {"$lte": [f"${field_name}", hi]},
-                    ]
-                },
-                f"${field_name}",
-                None,
-            ]
-        }
+        "$and": [
+            {"$gte": [f"${field_name}", lo]},
+            {"$lte": [f"${field_name}", hi]},
+        ]
     }
 
 
-def aggregate_top_hosts():
-    client = MongoClient(Config.MONGO_URI)
-    db = client[Config.MONGO_DB]
+def _partial_sums(field_name: str) -> dict:
+    """$group accumulators that add up across groups (unlike $avg)."""
+    in_range = _rating_in_range(field_name)
+    return {
+        "total_listings": {"$sum": 1},
+        "price_sum": {"$sum": "$price"},  # non-numeric prices are ignored, as by $avg
+        "price_count": {"$sum": {"$cond": [{"$isNumber": "$price"}, 1, 0]}},
+        "rating_sum": {"$sum": {"$cond": [in_range, f"${field_name}", 0]}},
+        "rating_count": {"$sum": {"$cond": [in_range, 1, 0]}},
+    }
 
-    print("🔄 Aggregating top hosts...")
-    db.top_hosts_agg.drop()
 
-    cities = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+def _resum(fields) -> dict:
+    return {f: {"$sum": f"${f}"} for f in fields}
 
-    # speed
-    db.listings_clean.create_index([("city", 1)])
-    db.listings_clean.create_index([("host_id", 1)])
-    db.top_hosts_agg.create_index([("city", 1), ("level", 1)])
-    db.top_hosts_agg.create_index([("city", 1), ("neighborhood", 1)])
-
-    rating_field = "review_scores_rating"
-
-    for city in cities:
-        print(f"\n📊 Processing {city}...")
-
-        neigh_field = _detect_neighborhood_field(db, city)
-
-        neighborhoods = db.listings_clean.distinct(
-            neigh_field,
-            {"city": city, neigh_field: {"$ne": None}}
-        )
-
-        # ---------- CITY LEVEL ----------
-        city_pipeline = [
-            {"$match": {"city": city, "host_id": {"$ne": None}, "host_name": {"$ne": None}}},
-            {"$group": {
-                "_id": {"host_id": "$host_id", "host_name": "$host_name"},
-                "total_listings": {"$sum": 1},
-                "avg_price": {"$avg": "$price"},
-                "avg_rating": _safe_avg_rating_in_range(rating_field),
-            }},
-            {"$sort": {"total_listings": -1}},
-            {"$limit": 10},
-            {"$project": {
-                "_id": 0,
-                "host_id": "$_id.host_id",
-                "host_name": "$_id.host_name",
-                "total_listings": 1,
-                "avg_price": {"$round": ["$avg_price", 2]},
-                "avg_rating": {
-                    "$cond": [
-                        {"$ne": ["$avg_rating", None]},
-                        {"$round": ["$avg_rating", 3]},
-                        None,
-                    ]
-                },
-            }},
+
+def _average(sum_field: str, count_field: str, places: int) -> dict:
+    return {
+        "$cond": [
+            {"$gt": [f"${count_field}", 0]},
+            {"$round": [{"$divide": [f"${sum_field}", f"${count_field}"]}, places]},
+            None,
         ]
+    }
 
-        city_hosts = list(db.listings_clean.aggregate(city_pipeline, allowDiskUse=True))
-        db.top_hosts_agg.insert_one({
-            "city": city,
-            "neighborhood": None,
-            "level": "city",
-            "top_hosts": city_hosts,
-        })
-        print(f"  ✅ City-level: {len(city_hosts)} hosts")
 
-        # ---------- NEIGHBORHOOD LEVEL ----------
-        inserted = 0
-        for neigh in neighborhoods:
-            match = {"city": city, "host_id": {"$ne": None}, "host_name": {"$ne": None}, neigh_field: neigh}
+# One top_hosts entry, from a (host, partial sums) row
+HOST_OUTPUT = {
+    "host_id": "$host_id",
+    "host_name": "$host_name",
+    "total_listings": "$total_listings",
+    "avg_price": _average("price_sum", "price_count", 2),
+    "avg_rating": _average("rating_sum", "rating_count", 3),
+}
+
 
-            neigh_pipeline = [
-                {"$match": match},
+def top_hosts_pipeline(city: str, neigh_field: str, rating_field: str = RATING_FIELD) -> list[dict]:
+    """
+    Single result document:
+      {neighborhoods: [{_id: <neighborhood>, top_hosts: [...]}, ...],
+       city: [<host>, ...]}
+    """
+    sums = _partial_sums(rating_field)
+
+    return [
+        {"$match": {"city": city, "host_id": {"$ne": None}, "host_name": {"$ne": None}}},
+        {"$group": {
+            "_id": {"neighborhood": f"${neigh_field}", "host_id": "$host_id", "host_name": "$host_name"},
+            **sums,
+        }},
+        {"$set": {
+            "neighborhood": "$_id.neighborhood",
+            "host_id": "$_id.host_id",
+            "host_name": "$_id.host_name",
+        }},
+        {"$facet": {
+            "neighborhoods": [
+                {"$match": {"neighborhood": {"$ne": None}}},
                 {"$group": {
-                    "_id": {"host_id": "$host_id", "host_name": "$host_name"},
-                    "total_listings": {"$sum": 1},
-                    "avg_price": {"$avg": "$price"},
-                    "avg_rating": _safe_avg_rating_in_range(rating_field),
-                }},
-                {"$sort": {"total_listings": -1}},
-                {"$limit": 10},
-                {"$project": {
-                    "_id": 0,
-                    "host_id": "$_id.host_id",
-                    "host_name": "$_id.host_name",
-                    "total_listings": 1,
-                    "avg_price": {"$round": ["$avg_price", 2]},
-                    "avg_rating": {
-                        "$cond": [
-                            {"$ne": ["$avg_rating", None]},
-                            {"$round": ["$avg_rating", 3]},
-                            None,
-                        ]
-                    },
+                    "_id": "$neighborhood",
+                    "top_hosts": {"$topN": {"n": TOP_N, "sortBy": HOST_ORDER, "output": HOST_OUTPUT}},
                 }},
-            ]
+            ],
+            # Listings without a neighborhood still count city-wide
+            "city": [
+                {"$group": {"_id": {"host_id": "$host_id", "host_name": "$host_name"}, **_resum(sums)}},
+                {"$set": {"host_id": "$_id.host_id", "host_name": "$_id.host_name"}},
+                {"$sort": HOST_ORDER},
+                {"$limit": TOP_N},
+                {"$project": {"_id": 0, **HOST_OUTPUT}},
+            ],
+        }},
+    ]
+
+
+def city_top_hosts_docs(db, city: str) -> list[dict]:
+    """top_hosts_agg documents of one city: the city doc, then one per neighborhood."""
+    neigh_field = _detect_neighborhood_field(db, city)
+
+    result = next(db.listings_clean.aggregate(top_hosts_pipeline(city, neigh_field), allowDiskUse=True))
+    by_neighborhood = {n["_id"]: n["top_hosts"] for n in result["neighborhoods"]}
+
+    docs = [{
+        "city": city,
+        "neighborhood": None,
+        "level": "city",
+        "top_hosts": result["city"],
+    }]
+
+    # Neighborhoods whose listings all lack a host still get an (empty) doc
+    neighborhoods = db.listings_clean.distinct(neigh_field, {"city": city, neigh_field: {"$ne": None}})
+    for neigh in neighborhoods:
+        docs.append({
+            "city": city,
+            "neighborhood": neigh,  # canonical output field
+            "level": "neighborhood",
+            "top_hosts": by_neighborhood.get(neigh, []),
+        })
+    return docs
+
+
+def aggregate_top_hosts(cities=None):
+    client = MongoClient(Config.MONGO_URI)
+    db = client[Config.MONGO_DB]
+
+    print("🔄 Aggregating top hosts...")
+    rebuild = cities is None
+    if rebuild:
+        cities = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+    # speed
+    db.listings_clean.create_index([("city", 1)])
+    db.listings_clean.create_index([("host_id", 1)])
+
+    # Built in a staging collection (other cities copied over on a partial
+    # run) with the API indexes, then swapped in
+    with swap_collection(
+        db, "top_hosts_agg",
+        indexes=[[("city", 1), ("level", 1)], [("city", 1), ("neighborhood", 1)]],
+        cities=None if rebuild else cities,
+    ) as out:
+        for city in cities:
+            print(f"\n📊 Processing {city}...")
 
-            neigh_hosts = list(db.listings_clean.aggregate(neigh_pipeline, allowDiskUse=True))
-            db.top_hosts_agg.insert_one({
-                "city": city,
-                "neighborhood": neigh,  # canonical output field
-                "level": "neighborhood",
-                "top_hosts": neigh_hosts,
-            })
-            inserted += 1
+            docs = city_top_hosts_docs(db, city)
+            out.insert_many(docs)
 
-        print(f"  ✅ Neighborhoods: {inserted}")
+            print(f"  ✅ City-level: {len(docs[0]['top_hosts'])} hosts")
+            print(f"  ✅ Neighborhoods: {len(docs) - 1}")
 
     total = db.top_hosts_agg.count_documents({})
     print(f"\n✅ Top hosts aggregation complete: {total} documents")
 
 
-def main():
-    aggregate_top_hosts()
+def main(cities=None):
+    aggregate_top_hosts(cities=cities)
     return True
 
 
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Processed-data artifacts (data/processed/<city>/<name>.parquet|.csv).
+
+Every ETL output is written and read through here so dtypes survive the
+round trip (listing ids stay int64, counts stay integers) and readers can
+project just the columns they need.
+
+Format is Config.ARTIFACT_FORMAT (env ARTIFACT_FORMAT):
+  parquet (default) | csv | both
+Readers take whichever file exists, preferring Parquet.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import Config  # noqa: E402
+
+
+FORMATS = ("parquet", "csv")
+
+# Explicit column types per artifact. 'str' = text (object column, NaN -> null).
+# Columns not listed (e.g. per-room-type % columns) pass through as inferred.
+SCHEMAS = {
+    "listings_clean": {
+        "listing_id": "int64",
+        "listing_name": "str",
+        "host_id": "Int64",
+        "host_name": "str",
+        "latitude": "float64",
+        "longitude": "float64",
+        "property_type": "str",
+        "room_type": "str",
+        "accommodates": "Int64",
+        "bedrooms": "Int64",
+        "beds": "Int64",
+        "price": "float64",
+        "minimum_nights": "Int64",
+        "maximum_nights": "Int64",
+        "number_of_reviews": "Int64",
+        "review_scores_rating": "float64",
+        "neighborhood": "str",
+    },
+    "occupancy_monthly": {
+        "year_month": "str",
+        "available_nights": "int64",
+        "total_nights": "int64",
+        "occupancy_rate": "float64",
+    },
+    "occupancy_neighborhood": {
+        "neighborhood": "str",
+        "year_month": "str",
+        "total_nights": "int64",
+        "available_nights": "int64",
+        "flagged_nights": "int64",
+    },
+    "neighborhood_stats": {
+        "neighborhood": "str",
+        "total_listings": "int64",
+        "avg_price": "float64",
+        "median_price": "float64",
+        "min_price": "float64",
+        "max_price": "float64",
+        "avg_rating": "float64",
+        "most_common_room_type": "str",
+    },
+    "top_hosts": {
+        "host_id": "Int64",
+        "host_name": "str",
+        "total_listings": "int64",
+        "avg_rating": "float64",
+    },
+    "review_words": {
+        "city": "str",
+        "neighborhood": "str",
+        "word": "str",
+        "frequency": "int64",
+    },
+    "reviews_sentiment": {
+        "listing_id": "int64",
+        "id": "int64",
+        "date": "str",
+        "neighborhood": "str",
+        "sentiment": "float64",
+        "sentiment_category": "str",
+    },
+    "listing_sentiment": {
+        "listing_id": "int64",
+        "sentiment_mean": "float64",
+        "sentiment_std": "float64",
+        "sentiment_min": "float64",
+        "sentiment_max": "float64",
+        "review_count": "int64",
+        "city": "str",
+    },
+    "neighborhood_sentiment": {
+        "neighborhood": "str",
+        "sentiment_mean": "float64",
+        "sentiment_median": "float64",
+        "sentiment_std": "float64",
+        "total_reviews": "int64",
+        "negative": "float64",
+        "neutral": "float64",
+        "positive": "float64",
+        "city": "str",
+    },
+    "listings_map": {
+        "listing_id": "int64",
+        "listing_name": "str",
+        "latitude": "float64",
+        "longitude": "float64",
+        "price": "float64",
+        "room_type": "str",
+        "neighborhood": "str",
+        "sentiment_mean": "float64",
+        "sentiment_category": "str",
+        "review_count": "Int64",
+        "city": "str",
+    },
+    # SentimentAccumulator state saved by SentimentETL, for run_delta() (sentiment_delta.py)
+    # (scores as integer multiples of 1e-4, see sentiment_stats.py)
+    "sentiment_moments": {
+        "listing_id": "int64",
+        "count": "int64",
+        "sum": "int64",
+        "sum_sq": "int64",
+        "min": "int64",
+        "max": "int64",
+    },
+    "sentiment_histogram": {
+        "neighborhood": "str",
+        "score": "int64",
+        "count": "int64",
+    },
+    "reviews_language": {
+        "id": "int64",
+        "listing_id": "int64",
+        "is_english": "bool",
+        "length": "int32",
+    },
+}
+
+# Artifacts uploaded to Mongo (one collection each, named after the artifact)
+UPLOAD_ARTIFACTS = [
+    "listings_clean",
+    "neighborhood_stats",
+    "occupancy_monthly",
+    "top_hosts",
+    "review_words",
+    "reviews_sentiment",
+    "listing_sentiment",
+    "neighborhood_sentiment",
+    "listings_map",
+]
+
+
+ARROW_TYPES = {
+    "str": "string",
+    "int64": "int64",
+    "Int64": "int64",
+    "int32": "int32",
+    "float64": "float64",
+    "bool": "bool",
+}
+
+
+def output_formats(fmt: str | None = None) -> tuple[str, ...]:
+    fmt = (fmt or Config.ARTIFACT_FORMAT).lower()
+    if fmt == "both":
+        return FORMATS
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown artifact format: {fmt} (expected parquet, csv or both)")
+    return (fmt,)
+
+
+def artifact_path(directory, name: str, fmt: str) -> Path:
+    return Path(directory) / f"{name}.{fmt}"
+
+
+def find_artifact(directory, name: str) -> Path | None:
+    """Existing file for an artifact, Parquet first."""
+    for fmt in FORMATS:
+        path = artifact_path(directory, name, fmt)
+        if path.exists():
+            return path
+    return None
+
+
+def artifact_exists(directory, name: str) -> bool:
+    return find_artifact(directory, name) is not None
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    return series.where(series.isna(), series.astype(str)).astype(object)
+
+
+def apply_schema(name: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Cast the columns an artifact schema declares (others untouched)."""
+    schema = SCHEMAS.get(name, {})
+    df = df.copy()
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            continue
+        if dtype == "str":
+            df[col] = _as_text(df[col])
+        elif dtype in ("int64", "int32") and df[col].dtype.kind == "f":
+            df[col] = df[col].round().astype(dtype)
+        else:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+def arrow_table(name: str, df: pd.DataFrame, schema=None):
+    """
+    pyarrow Table for an (already schema-cast) frame. Declared columns get
+    their Arrow type even when a chunk has only nulls in them.
+    """
+    import pyarrow as pa
+
+    if schema is None:
+        declared = SCHEMAS.get(name, {})
+        inferred = pa.Schema.from_pandas(df, preserve_index=False)
+        schema = pa.schema([
+            pa.field(field.name, ARROW_TYPES[declared[field.name]])
+            if field.name in declared else field
+            for field in inferred
+        ]).with_metadata(inferred.metadata)
+
+    return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+
+def write_artifact(df: pd.DataFrame, directory, name: str, fmt: str | None = None) -> Path:
+    """
+    Write an artifact in the configured format(s) and drop stale files in
+    the other format. Returns the path readers will pick up.
+    """
+    df = apply_schema(name, df)
+    formats = output_formats(fmt)
+
+    for f in FORMATS:
+        path = artifact_path(directory, name, f)
+        if f in formats:
+            if f == "parquet":
+                import pyarrow.parquet as pq
+
+                pq.write_table(arrow_table(name, df), path)
+            else:
+                df.to_csv(path, index=False)
+        else:
+            path.unlink(missing_ok=True)
+
+    return artifact_path(directory, name, formats[0])
+
+
+def _csv_dtypes(name: str, columns=None) -> dict:
+    dtypes = {}
+    for col, dtype in SCHEMAS.get(name, {}).items():
+        if columns is not None and col not in columns:
+            continue
+        dtypes[col] = object if dtype == "str" else dtype
+    return dtypes
+
+
+def read_artifact(directory, name: str, columns=None) -> pd.DataFrame:
+    """Read an artifact (Parquet preferred), optionally only some columns."""
+    path = find_artifact(directory, name)
+    if path is None:
+        raise FileNotFoundError(f"Missing artifact {name} in {directory}")
+    return read_artifact_file(path, columns=columns)
+
+
+def read_artifact_file(path, columns=None) -> pd.DataFrame:
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_csv(path, usecols=columns, dtype=_csv_dtypes(path.stem, columns))
+
+
+def iter_artifact_file(path, chunksize: int, columns=None):
+    """Yield DataFrame chunks of an artifact file without loading it whole."""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(path)
+        for batch in parquet.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(
+            path, usecols=columns, dtype=_csv_dtypes(path.stem, columns), chunksize=chunksize
+        )
+
+
+class ArtifactWriter:
+    """
+    Append-only writer for artifacts produced chunk by chunk
+    (e.g. reviews_sentiment in streaming mode).
+
+        with ArtifactWriter(processed_path, 'reviews_sentiment') as writer:
+            for chunk in ...:
+                writer.append(chunk)
+
+    append=True adds the rows to the existing artifact, in the format(s) it
+    already has: CSV is appended in place; Parquet can't be, so its row
+    groups are copied as they are (never loaded as a DataFrame) into a new
+    file that replaces the old one on close.
+    """
+
+    def __init__(self, directory, name: str, fmt: str | None = None, append: bool = False):
+        self.directory = Path(directory)
+        self.name = name
+        self.formats = output_formats(fmt)
+        self.rows = 0
+        self._parquet = None
+        self._existing = None
+
+        existing = tuple(f for f in FORMATS if artifact_path(self.directory, name, f).exists())
+        if append and existing:
+            self.formats = existing
+            self._existing = existing
+        else:
+            for f in FORMATS:
+                artifact_path(self.directory, name, f).unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _open_parquet(self, df: pd.DataFrame):
+        import pyarrow.parquet as pq
+
+        path = artifact_path(self.directory, self.name, "parquet")
+        if self._existing is None or "parquet" not in self._existing:
+            table = arrow_table(self.name, df)
+            self._parquet = pq.ParquetWriter(path, table.schema)
+            return table
+
+        previous = pq.ParquetFile(path)
+        self._parquet = pq.ParquetWriter(path.with_name(path.name + ".tmp"), previous.schema_arrow)
+        for i in range(previous.num_row_groups):
+            self._parquet.write_table(previous.read_row_group(i))
+        return arrow_table(self.name, df, schema=self._parquet.schema)
+
+    def append(self, df: pd.DataFrame):
+        if df.empty:
+            return
+
+        df = apply_schema(self.name, df)
+
+        if "parquet" in self.formats:
+            if self._parquet is None:
+                table = self._open_parquet(df)
+            else:
+                table = arrow_table(self.name, df, schema=self._parquet.schema)
+            self._parquet.write_table(table)
+
+        if "csv" in self.formats:
+            path = artifact_path(self.directory, self.name, "csv")
+            df.to_csv(path, mode="a", header=not path.exists() or path.stat().st_size == 0, index=False)
+
+        self.rows += len(df)
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+            path = artifact_path(self.directory, self.name, "parquet")
+            tmp = path.with_name(path.name + ".tmp")
+            if tmp.exists():
+                tmp.replace(path)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Bulk loading of processed artifacts into MongoDB.
+
+frame_documents() turns a DataFrame into insert_many documents column by
+column: one tolist() per column (numpy scalars become plain Python values)
+and None patched in at the null positions only, instead of the
+astype(object) / where / to_dict('records') round of full-frame copies.
+
+upload_files() loads several (city, artifact) files at once from a thread
+pool. pymongo releases the GIL while waiting on the server, so while one
+collection's batch is in flight the next batch of another collection is
+being read and converted.
+
+Each collection is built in a staging collection (see collection_swap.py)
+holding the other cities' documents plus the uploaded ones, and swapped in
+once all its files are loaded: the API never sees a half-loaded
+collection.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from scripts.artifacts import iter_artifact_file
+from scripts.collection_swap import abort_swap, begin_swap, commit_swap
+from scripts.stage_timer import record_mongo_writes
+
+
+# Rows per insert_many
+BATCH_SIZE = 10000
+
+# Collections loaded concurrently
+UPLOAD_THREADS = 4
+
+# Columns we want to normalize across the whole project
+RENAME_MAP = {
+    "neighbourhood": "neighborhood",
+    "review_score_rating": "review_scores_rating",
+}
+
+_print_lock = threading.Lock()
+
+
+def log(message: str):
+    with _print_lock:
+        print(message, flush=True)
+
+
+def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    cols = {c: RENAME_MAP[c] for c in df.columns if c in RENAME_MAP}
+    if cols:
+        df = df.rename(columns=cols)
+    return df
+
+
+def column_values(series: pd.Series) -> list:
+    """Plain Python values of a column, None where the value is null."""
+    values = series.tolist()
+    nulls = series.isna().to_numpy()
+    if nulls.any():
+        for i in np.flatnonzero(nulls):
+            values[i] = None
+    return values
+
+
+def frame_documents(df: pd.DataFrame, **constants) -> list[dict]:
+    """
+    One dict per row (NaN/NA -> None), plus constant fields such as
+    city=... which override a column of the same name.
+    """
+    keys = [*df.columns, *(k for k in constants if k not in df.columns)]
+    columns = [
+        [constants[k]] * len(df) if k in constants else column_values(df[k])
+        for k in keys
+    ]
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+def upload_file(coll, city_name: str, path: Path, batch_size: int = BATCH_SIZE) -> dict:
+    """Insert one city's artifact into coll (a staging collection)."""
+    path = Path(path)
+    start = time.perf_counter()
+
+    total = 0
+    for df_chunk in iter_artifact_file(path, batch_size):
+        docs = frame_documents(normalize_columns(df_chunk), city=city_name)
+        if docs:
+            coll.insert_many(docs, ordered=False)
+            record_mongo_writes(len(docs))
+            total += len(docs)
+
+    seconds = time.perf_counter() - start
+    rate = total / seconds if seconds else 0.0
+    log(f"  📄 {city_name}/{path.name}: {total:,} docs in {seconds:.2f}s ({rate:,.0f} docs/s)")
+    return {"city": city_name, "collection": path.stem, "docs": total, "seconds": seconds}
+
+
+def upload_files(db, jobs, threads: int = UPLOAD_THREADS, batch_size: int = BATCH_SIZE) -> list[dict]:
+    """
+    Upload [(city, path), ...] with up to `threads` files in flight, each
+    into the staging collection named after the artifact. The collections
+    are swapped in only if every file loaded; otherwise the live ones are
+    left as they were. Returns one stats dict per file, in job order.
+    """
+    jobs = [(city, Path(path)) for city, path in jobs]
+
+    uploaded_cities = {}
+    for city, path in jobs:
+        uploaded_cities.setdefault(path.stem, []).append(city)
+
+    staging = {}
+    try:
+        for name, cities in uploaded_cities.items():
+            staging[name] = begin_swap(db, name, cities=cities)
+
+        if threads <= 1 or len(jobs) <= 1:
+            stats = [upload_file(staging[path.stem], city, path, batch_size) for city, path in jobs]
+        else:
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                futures = [
+                    pool.submit(upload_file, staging[path.stem], city, path, batch_size)
+                    for city, path in jobs
+                ]
+                stats = [f.result() for f in futures]
+    except BaseException:
+        for name in staging:
+            abort_swap(db, name)
+        raise
+
+    for name in staging:
+        commit_swap(db, name)
+    return stats
+
+
+def print_upload_report(stats: list[dict], seconds: float):
+    """docs/s per collection (summed over cities) and overall."""
+    by_collection = {}
+    for s in stats:
+        docs, busy = by_collection.get(s["collection"], (0, 0.0))
+        by_collection[s["collection"]] = (docs + s["docs"], busy + s["seconds"])
+
+    print("\n  collection                      docs    docs/s")
+    for name, (docs, busy) in sorted(by_collection.items(), key=lambda kv: -kv[1][0]):
+        rate = docs / busy if busy else 0.0
+        print(f"  {name:<24} {docs:>12,} {rate:>9,.0f}")
+
+    total = sum(s["docs"] for s in stats)
+    rate = total / seconds if seconds else 0.0
+    print(f"  {'TOTAL (wall clock)':<24} {total:>12,} {rate:>9,.0f}")
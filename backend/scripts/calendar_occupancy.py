@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Single pass over calendar.csv -> monthly night counts per neighborhood.
+
+DataETL reads the calendar once and stores the result as the
+occupancy_neighborhood artifact:
+
+    neighborhood, year_month, total_nights, available_nights, flagged_nights
+
+  total_nights     every calendar row of the month
+  available_nights rows with available == 't'
+  flagged_nights   rows with available == 't' or 'f'
+
+Both occupancy definitions used in the project come from these counts:
+  occupancy_monthly (DataETL):     1 - available / flagged
+  occupancy_by_month (Mongo docs): (total - available) / total
+so aggregate_occupancy no longer re-reads the calendar.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+CALENDAR_COLUMNS = ['listing_id', 'date', 'available']
+
+COUNT_COLUMNS = ['total_nights', 'available_nights', 'flagged_nights']
+
+
+def read_calendar(calendar_path) -> pd.DataFrame:
+    """Only the columns the occupancy needs, with compact dtypes."""
+    return pd.read_csv(
+        calendar_path,
+        usecols=CALENDAR_COLUMNS,
+        # Airbnb listing ids do not fit in int32; a calendar has ~365
+        # distinct dates, so parse those instead of every row
+        dtype={'listing_id': 'int64', 'date': 'category', 'available': 'category'},
+    )
+
+
+def month_codes(dates: pd.Series) -> np.ndarray:
+    """Monthly period ordinals (int32); -1 for missing/unparseable dates."""
+    if isinstance(dates.dtype, pd.CategoricalDtype):
+        per_category = np.append(month_codes(pd.Series(dates.cat.categories)), np.int32(-1))
+        return per_category[dates.cat.codes.to_numpy()]  # code -1 (NaN) -> last slot
+
+    parsed = pd.to_datetime(dates, errors='coerce')
+    codes = (parsed.dt.year - 1970) * 12 + parsed.dt.month - 1
+    return codes.fillna(-1).to_numpy(dtype=np.int32)
+
+
+def neighborhood_month_counts(calendar: pd.DataFrame, listings: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per (neighborhood, month) night counts for the listings in `listings`
+    (listing_id, neighborhood). Rows of other listings or with bad dates
+    are dropped. Sorted by neighborhood, then month.
+    """
+    listings = listings.drop_duplicates('listing_id')
+    neighborhoods = pd.Categorical(listings['neighborhood'])
+
+    # listing_id -> neighborhood code (int16), -1 for unknown listings
+    position = pd.Index(listings['listing_id']).get_indexer(calendar['listing_id'])
+    codes = neighborhoods.codes.astype(np.int16)
+    neighborhood = np.where(position >= 0, codes[position], -1).astype(np.int16)
+
+    month = month_codes(calendar['date'])
+
+    available = calendar['available']
+    is_available = (available == 't').to_numpy()
+    is_flagged = is_available | (available == 'f').to_numpy()
+
+    keep = (neighborhood >= 0) & (month >= 0)
+    nights = pd.DataFrame({
+        'neighborhood': neighborhood[keep],
+        'month': month[keep],
+        'total_nights': np.ones(int(keep.sum()), dtype=np.int32),
+        'available_nights': is_available[keep],
+        'flagged_nights': is_flagged[keep],
+    })
+
+    counts = nights.groupby(['neighborhood', 'month'], sort=True)[COUNT_COLUMNS].sum().reset_index()
+    counts[COUNT_COLUMNS] = counts[COUNT_COLUMNS].astype('int64')
+
+    counts['neighborhood'] = neighborhoods.categories[counts['neighborhood']]
+    counts['year_month'] = pd.PeriodIndex.from_ordinals(counts['month'], freq='M').astype(str)
+
+    return counts[['neighborhood', 'year_month', *COUNT_COLUMNS]]
+
+
+def city_monthly_occupancy(counts: pd.DataFrame) -> pd.DataFrame:
+    """occupancy_monthly artifact: year_month, available_nights, total_nights, occupancy_rate."""
+    monthly = counts.groupby('year_month', sort=True).agg(
+        available_nights=('available_nights', 'sum'),
+        total_nights=('flagged_nights', 'sum'),
+    ).reset_index()
+
+    monthly['occupancy_rate'] = (1 - monthly['available_nights'] / monthly['total_nights']) * 100
+    return monthly
+
+
+def monthly_occupancy_docs(counts: pd.DataFrame) -> list[dict]:
+    """
+    occupancy_by_month 'monthly_occupancy' entries for a slice of counts
+    (one neighborhood, or a whole city), month-ordered.
+    """
+    monthly = counts.groupby('year_month', sort=True)[['total_nights', 'available_nights']].sum()
+    occupied = monthly['total_nights'] - monthly['available_nights']
+    rate = (occupied / monthly['total_nights'] * 100).round(2)
+
+    return [
+        {
+            "month": month,
+            "occupied_nights": int(o),
+            "total_nights": int(t),
+            "occupancy_rate": float(r),
+        }
+        for month, o, t, r in zip(monthly.index, occupied, monthly['total_nights'], rate)
+    ]
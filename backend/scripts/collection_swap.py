@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Zero-downtime reloads: build into a staging collection, then swap it in.
+
+    with swap_collection(db, "top_hosts_agg", indexes=[[("city", 1), ("level", 1)]]) as out:
+        out.insert_many(docs)
+
+  1) <name>__staging is (re)created with the live collection's indexes plus
+     `indexes`. For a partial reload (cities=[...]) the live documents of
+     every other city are copied in first, so staging holds the complete
+     next version.
+  2) The writer fills the staging collection; readers still see the live one.
+  3) On success the live collection is copied to <name>__previous, then the
+     staging collection is renamed over the live one (renameCollection with
+     dropTarget): the only step readers can see, and an atomic one. On
+     error the staging collection is dropped and the live one is left
+     untouched.
+
+Rollback to the previous version:
+    python scripts/collection_swap.py rollback top_hosts_agg
+    python scripts/collection_swap.py status
+"""
+
+import argparse
+import sys
+import os
+from contextlib import contextmanager
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pymongo import MongoClient
+from config import Config
+
+
+STAGING_SUFFIX = "__staging"
+PREVIOUS_SUFFIX = "__previous"
+
+# index_information() keys that are not create_index options
+_INDEX_INFO_ONLY = {"key", "v", "ns", "background"}
+
+
+def staging_name(name: str) -> str:
+    return name + STAGING_SUFFIX
+
+
+def previous_name(name: str) -> str:
+    return name + PREVIOUS_SUFFIX
+
+
+def _collection_exists(db, name: str) -> bool:
+    return bool(db.list_collection_names(filter={"name": name}))
+
+
+def _copy_indexes(db, source: str, target: str):
+    """Create the indexes of `source` (if it exists) on `target`."""
+    if not _collection_exists(db, source):
+        return
+    for index_name, info in db[source].index_information().items():
+        if index_name == "_id_":
+            continue
+        options = {k: v for k, v in info.items() if k not in _INDEX_INFO_ONLY}
+        db[target].create_index(info["key"], name=index_name, **options)
+
+
+def _copy_documents(db, source: str, target: str, match=None):
+    """Server-side copy of source's documents (optionally only `match`) into target, keeping its indexes."""
+    pipeline = [{"$match": match}] if match else []
+    db[source].aggregate(pipeline + [{"$merge": {"into": target, "whenMatched": "fail"}}])
+
+
+def begin_swap(db, name: str, indexes=(), cities=None):
+    """
+    Fresh staging collection for `name`, indexes in place. cities=None
+    rebuilds the whole collection; otherwise the live documents of every
+    other city are copied in, and the writer adds those cities' ones.
+    """
+    staging = staging_name(name)
+    db.drop_collection(staging)  # leftover of an interrupted run
+    db.create_collection(staging)
+
+    _copy_indexes(db, name, staging)
+    for keys in indexes:
+        db[staging].create_index(keys)
+
+    if cities is not None and _collection_exists(db, name):
+        _copy_documents(db, name, staging, {"city": {"$nin": list(cities)}})
+
+    return db[staging]
+
+
+def commit_swap(db, name: str):
+    """Copy the live collection to <name>__previous, then rename staging over it in one step."""
+    staging = staging_name(name)
+    if _collection_exists(db, name):
+        previous = previous_name(name)
+        db.drop_collection(previous)
+        db.create_collection(previous)
+        _copy_indexes(db, name, previous)
+        _copy_documents(db, name, previous)
+
+    db[staging].rename(name, dropTarget=True)
+
+
+def abort_swap(db, name: str):
+    db.drop_collection(staging_name(name))
+
+
+@contextmanager
+def swap_collection(db, name: str, indexes=(), cities=None):
+    """Yields the staging collection; swapped in if the block succeeds."""
+    staging = begin_swap(db, name, indexes, cities)
+    try:
+        yield staging
+    except BaseException:
+        abort_swap(db, name)
+        raise
+    commit_swap(db, name)
+
+
+def rollback(db, name: str) -> bool:
+    """Put <name>__previous back in place of the live collection (one step back only)."""
+    previous = previous_name(name)
+    if not _collection_exists(db, previous):
+        print(f"❌ No previous version of {name}")
+        return False
+    db[previous].rename(name, dropTarget=True)
+    print(f"✅ {name} rolled back ({db[name].count_documents({}):,} documents)")
+    return True
+
+
+def print_status(db):
+    names = set(db.list_collection_names())
+    live = sorted(n for n in names if not n.endswith((STAGING_SUFFIX, PREVIOUS_SUFFIX)))
+
+    print(f"{'collection':<28} {'live':>10} {'previous':>10} {'staging':>10}")
+    for name in live:
+        counts = [
+            f"{db[n].estimated_document_count():,}" if n in names else "-"
+            for n in (name, previous_name(name), staging_name(name))
+        ]
+        print(f"{name:<28} {counts[0]:>10} {counts[1]:>10} {counts[2]:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or roll back swapped collections")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="Document counts of live / previous / staging collections")
+    rollback_parser = sub.add_parser("rollback", help="Restore the previous version of collections")
+    rollback_parser.add_argument("collections", nargs="+")
+    args = parser.parse_args()
+
+    client = MongoClient(Config.MONGO_URI)
+    db = client[Config.MONGO_DB]
+
+    if args.command == "status":
+        print_status(db)
+        return True
+    return all([rollback(db, name) for name in args.collections])
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
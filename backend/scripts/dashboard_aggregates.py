@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Dashboard collections built in-process from the ETL artifacts.
+
+The aggregate_* scripts read back from Mongo what the ETL had just written.
+This module computes the same documents from the city's frames instead:
+
+  listings_clean          -> room_type_distribution, top_hosts_agg
+  reviews_sentiment       -> sentiment_summary
+  occupancy_neighborhood  -> occupancy_by_month  (the calendar, already
+                             reduced to neighborhood-month counts by DataETL)
+
+Each builder is one groupby over its frame. All cities are computed first,
+then each collection is written with one insert_many per city into a staging
+collection and swapped in (collection_swap.py).
+
+The aggregate_* scripts stay as the reference implementation:
+tests/test_dashboard_aggregates.py checks the builders against the original
+aggregations' documents on a small fixture, benchmarks/dashboard_aggregates.py
+on a city's uploaded data.
+
+Usage:
+    python scripts/dashboard_aggregates.py               # all cities
+    python scripts/dashboard_aggregates.py rome lisbon   # replace these cities only
+"""
+
+import argparse
+import os
+import sys
+import time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pandas as pd
+from pymongo import MongoClient
+
+from config import Config
+from scripts.artifacts import artifact_exists, read_artifact
+from scripts.aggregate_occupancy import city_occupancy_docs
+from scripts.aggregate_room_types import room_type_distribution
+from scripts.aggregate_sentiment_summary import CATEGORIES, summary_doc
+from scripts.aggregate_top_hosts import RATING_FIELD, TOP_N
+from scripts.collection_swap import swap_collection
+from scripts.stage_timer import record_mongo_writes
+
+
+CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+PROCESSED_DIR = os.path.join(os.path.dirname(__file__), "..", "data", "processed")
+
+# Same API indexes as the aggregate_* scripts
+DASHBOARD_INDEXES = [[("city", 1), ("level", 1)], [("city", 1), ("neighborhood", 1)]]
+
+DASHBOARD_COLLECTIONS = ["sentiment_summary", "room_type_distribution", "occupancy_by_month", "top_hosts_agg"]
+
+LISTING_COLUMNS = ["neighborhood", "room_type", "host_id", "host_name", "price", RATING_FIELD]
+
+HOST_SUMS = ["total_listings", "price_sum", "price_count", "rating_sum", "rating_count"]
+
+# Most listings first; host_id (then name) makes ties deterministic (as HOST_ORDER)
+HOST_SORT = (["total_listings", "host_id", "host_name"], [False, True, True])
+
+
+# ---------------------------------------------------------------------------
+# Builders (one city)
+# ---------------------------------------------------------------------------
+
+def sentiment_summary_docs(city: str, reviews: pd.DataFrame) -> list[dict]:
+    """reviews: neighborhood, sentiment_category"""
+    reviews = reviews[reviews["sentiment_category"].isin(CATEGORIES)]
+    if reviews.empty:
+        return []
+
+    counts = (
+        reviews.groupby(["neighborhood", "sentiment_category"], dropna=False)
+        .size()
+        .unstack(fill_value=0)
+        .reindex(columns=CATEGORIES, fill_value=0)
+    )
+
+    docs = []
+    pos, neu, neg = (int(counts[c].sum()) for c in CATEGORIES)
+    if pos + neu + neg > 0:
+        docs.append(summary_doc(city, None, pos, neu, neg))
+
+    counts = counts[counts.index.notna()].sort_index()
+    for neigh, pos_n, neu_n, neg_n in counts.itertuples():
+        docs.append(summary_doc(city, neigh, int(pos_n), int(neu_n), int(neg_n)))
+    return docs
+
+
+def room_type_docs(city: str, listings: pd.DataFrame) -> list[dict]:
+    """listings: neighborhood, room_type"""
+    listings = listings[listings["room_type"].notna()]
+    counts = listings.groupby(["neighborhood", "room_type"], dropna=False).size()
+    if counts.empty:
+        return []
+
+    docs = [{
+        "city": city,
+        "neighborhood": None,
+        "level": "city",
+        **room_type_distribution(counts.groupby(level="room_type").sum().to_dict()),
+    }]
+
+    counts = counts[counts.index.get_level_values("neighborhood").notna()]
+    for neigh, neigh_counts in counts.groupby(level="neighborhood", sort=True):
+        docs.append({
+            "city": city,
+            "neighborhood": neigh,
+            "level": "neighborhood",
+            **room_type_distribution(neigh_counts.droplevel("neighborhood").to_dict()),
+        })
+    return docs
+
+
+def _host_entries(hosts: pd.DataFrame) -> list[dict]:
+    return [
+        {
+            "host_id": int(h.host_id),
+            "host_name": h.host_name,
+            "total_listings": int(h.total_listings),
+            "avg_price": round(float(h.price_sum / h.price_count), 2) if h.price_count else None,
+            "avg_rating": round(float(h.rating_sum / h.rating_count), 3) if h.rating_count else None,
+        }
+        for h in hosts.itertuples()
+    ]
+
+
+def top_hosts_docs(city: str, listings: pd.DataFrame) -> list[dict]:
+    """listings: neighborhood, host_id, host_name, price, review_scores_rating"""
+    hosts = listings[listings["host_id"].notna() & listings["host_name"].notna()]
+    rating = hosts[RATING_FIELD]
+    in_range = rating.between(0, 5)  # NaN -> False
+
+    # (neighborhood, host) partial sums; a NaN neighborhood still counts city-wide
+    partial = pd.DataFrame({
+        "neighborhood": hosts["neighborhood"],
+        "host_id": hosts["host_id"].astype("int64"),
+        "host_name": hosts["host_name"],
+        "total_listings": 1,
+        "price_sum": hosts["price"].fillna(0.0),
+        "price_count": hosts["price"].notna().astype("int64"),
+        "rating_sum": rating.where(in_range, 0.0),
+        "rating_count": in_range.astype("int64"),
+    }).groupby(["neighborhood", "host_id", "host_name"], dropna=False, sort=False)[HOST_SUMS].sum().reset_index()
+
+    by, ascending = HOST_SORT
+    city_hosts = (
+        partial.groupby(["host_id", "host_name"], sort=False)[HOST_SUMS].sum().reset_index()
+        .sort_values(by, ascending=ascending, kind="stable")
+        .head(TOP_N)
+    )
+    ranked = (
+        partial[partial["neighborhood"].notna()]
+        .sort_values(by, ascending=ascending, kind="stable")
+        .groupby("neighborhood", sort=False)
+        .head(TOP_N)
+    )
+    by_neighborhood = {n: _host_entries(g) for n, g in ranked.groupby("neighborhood", sort=False)}
+
+    docs = [{
+        "city": city,
+        "neighborhood": None,
+        "level": "city",
+        "top_hosts": _host_entries(city_hosts),
+    }]
+    # Every neighborhood with listings gets a doc, even without identified hosts
+    for neigh in sorted(listings["neighborhood"].dropna().unique()):
+        docs.append({
+            "city": city,
+            "neighborhood": neigh,
+            "level": "neighborhood",
+            "top_hosts": by_neighborhood.get(neigh, []),
+        })
+    return docs
+
+
+def city_dashboard_docs(city: str, listings=None, reviews=None, occupancy=None) -> dict:
+    """{collection: [docs]} for one city; a missing frame leaves its collections empty."""
+    docs = {name: [] for name in DASHBOARD_COLLECTIONS}
+    if reviews is not None:
+        docs["sentiment_summary"] = sentiment_summary_docs(city, reviews)
+    if listings is not None:
+        docs["room_type_distribution"] = room_type_docs(city, listings)
+        docs["top_hosts_agg"] = top_hosts_docs(city, listings)
+    if occupancy is not None:
+        docs["occupancy_by_month"] = city_occupancy_docs(city, occupancy)
+    return docs
+
+
+def load_city_frames(city_path) -> dict:
+    """The frames city_dashboard_docs needs, read from the city's artifacts (None if missing)."""
+    def load(name, columns=None):
+        if not artifact_exists(city_path, name):
+            print(f"  ⚠️  {name} not found in {city_path}")
+            return None
+        return read_artifact(city_path, name, columns=columns)
+
+    return {
+        "listings": load("listings_clean", LISTING_COLUMNS),
+        "reviews": load("reviews_sentiment", ["neighborhood", "sentiment_category"]),
+        "occupancy": load("occupancy_neighborhood"),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+def write_dashboards(db, docs_by_city: dict, rebuild: bool):
+    """One staging collection + swap per dashboard collection, one insert_many per city."""
+    cities = list(docs_by_city)
+    for name in DASHBOARD_COLLECTIONS:
+        with swap_collection(db, name, indexes=DASHBOARD_INDEXES, cities=None if rebuild else cities) as out:
+            for city in cities:
+                if docs_by_city[city][name]:
+                    out.insert_many(docs_by_city[city][name])
+                    record_mongo_writes(len(docs_by_city[city][name]))
+        print(f"  ✅ {name}: {sum(len(d[name]) for d in docs_by_city.values()):,} documents")
+
+
+def build_dashboards(cities=None, data_dir=PROCESSED_DIR):
+    client = MongoClient(Config.MONGO_URI)
+    db = client[Config.MONGO_DB]
+
+    print("🔄 Building dashboard collections from the processed artifacts...")
+    rebuild = cities is None
+    if rebuild:
+        cities = CITIES
+
+    docs_by_city = {}
+    for city in cities:
+        start = time.perf_counter()
+        frames = load_city_frames(os.path.join(data_dir, city))
+        docs_by_city[city] = city_dashboard_docs(city, **frames)
+        total = sum(len(d) for d in docs_by_city[city].values())
+        print(f"  📊 {city}: {total:,} documents in {time.perf_counter() - start:.2f}s")
+
+    write_dashboards(db, docs_by_city, rebuild)
+    print("✅ Dashboard collections ready")
+
+
+def main(cities=None):
+    """Callable entrypoint for pipeline imports."""
+    build_dashboards(cities=cities)
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the dashboard collections from the processed artifacts")
+    parser.add_argument("cities", nargs="*", help="Cities to replace (default: rebuild all)")
+    args = parser.parse_args()
+
+    main(cities=args.cities or None)
@@ -1,17 +1,25 @@
 #!/usr/bin/env python3
 
+import sys
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import re
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.artifacts import write_artifact  # noqa: E402
+from scripts.calendar_occupancy import (  # noqa: E402
+    read_calendar, neighborhood_month_counts, city_monthly_occupancy
+)
+
 
 class DataETL:
 
-    def __init__(self, city):
+    def __init__(self, city, data_dir='../data'):
         self.city = city
-        self.raw_path = Path(f'../data/raw/{city}')
-        self.output_path = Path(f'../data/processed/{city}')
+        self.raw_path = Path(data_dir) / 'raw' / city
+        self.output_path = Path(data_dir) / 'processed' / city
         self.output_path.mkdir(parents=True, exist_ok=True)
 
     def clean_price(self, price_str):
@@ -88,8 +96,7 @@ class DataETL:
         required = ['listing_id', 'latitude', 'longitude', 'price', 'neighborhood']
         listings_clean.dropna(subset=required, inplace=True)
 
-        output_file = self.output_path / 'listings_clean.csv'
-        listings_clean.to_csv(output_file, index=False)
+        output_file = write_artifact(listings_clean, self.output_path, 'listings_clean')
         print(f"✓ Saved: {output_file} ({len(listings_clean):,} listings)")
 
         return listings_clean
@@ -101,25 +108,18 @@ class DataETL:
         if not calendar_path.exists():
             raise FileNotFoundError(f"Missing {calendar_path}")
 
-        calendar = pd.read_csv(calendar_path)
-        calendar = calendar[calendar['listing_id'].isin(listings['listing_id'])]
-
-        calendar['date'] = pd.to_datetime(calendar['date'], errors='coerce')
-        calendar = calendar.dropna(subset=['date'])
+        # One pass: per (neighborhood, month) counts feed both the city-level
+        # artifact and the occupancy_by_month aggregation
+        calendar = read_calendar(calendar_path)
+        counts = neighborhood_month_counts(calendar, listings[['listing_id', 'neighborhood']])
+        del calendar
 
-        calendar['year_month'] = calendar['date'].dt.to_period('M')
-        calendar['is_available'] = calendar['available'].map({'t': 1, 'f': 0})
-
-        monthly = calendar.groupby('year_month').agg(
-            available_nights=('is_available', 'sum'),
-            total_nights=('is_available', 'count')
-        ).reset_index()
+        output_file = write_artifact(counts, self.output_path, 'occupancy_neighborhood')
+        print(f"✓ Saved: {output_file} ({len(counts):,} neighborhood-months)")
 
-        monthly['occupancy_rate'] = (1 - monthly['available_nights'] / monthly['total_nights']) * 100
-        monthly['year_month'] = monthly['year_month'].astype(str)
+        monthly = city_monthly_occupancy(counts)
 
-        output_file = self.output_path / 'occupancy_monthly.csv'
-        monthly.to_csv(output_file, index=False)
+        output_file = write_artifact(monthly, self.output_path, 'occupancy_monthly')
         print(f"✓ Saved: {output_file} ({len(monthly):,} months)")
 
         return monthly
@@ -143,8 +143,7 @@ class DataETL:
 
         neighborhood_stats = neighborhood_stats.merge(room_type_dist, on='neighborhood', how='left')
 
-        output_file = self.output_path / 'neighborhood_stats.csv'
-        neighborhood_stats.to_csv(output_file, index=False)
+        output_file = write_artifact(neighborhood_stats, self.output_path, 'neighborhood_stats')
         print(f"✓ Saved: {output_file} ({len(neighborhood_stats):,} neighborhoods)")
 
         return neighborhood_stats
@@ -159,8 +158,7 @@ class DataETL:
 
         host_listings = host_listings.sort_values('total_listings', ascending=False).head(20)
 
-        output_file = self.output_path / 'top_hosts.csv'
-        host_listings.to_csv(output_file, index=False)
+        output_file = write_artifact(host_listings, self.output_path, 'top_hosts')
         print("✓ Saved:", output_file, "(top 20)")
 
         return host_listings
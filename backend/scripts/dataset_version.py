@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Publishes the dataset version the API keys its cache on (utils/dataset_version.py).
+
+run_full_pipeline.py, upload_all_data.py and sentiment_delta.py publish a
+new version after they change MongoDB; the API workers pick it up within
+DATASET_VERSION_POLL seconds and stop using the previous cache entries.
+Bump it by hand after changing the database another way (mongorestore).
+
+Usage:
+    python scripts/dataset_version.py show
+    python scripts/dataset_version.py bump [--source NOTE]
+"""
+
+import argparse
+import sys
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pymongo import MongoClient  # noqa: E402
+
+from config import Config  # noqa: E402
+from utils.dataset_version import COLLECTION, DOC_ID  # noqa: E402
+
+
+def current_version(db) -> dict | None:
+    return db[COLLECTION].find_one({"_id": DOC_ID})
+
+
+def publish(db, cities=None, source: str = "manual") -> str:
+    """Stores a new version for the whole database and returns it."""
+    now = datetime.now()
+    version = f"{now.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    db[COLLECTION].replace_one(
+        {"_id": DOC_ID},
+        {
+            "_id": DOC_ID,
+            "version": version,
+            "published_at": now.isoformat(timespec="seconds"),
+            "cities": sorted(cities) if cities else None,
+            "source": source,
+        },
+        upsert=True,
+    )
+    print(f"🏷️ Dataset version {version} published ({source})")
+    return version
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dataset version used by the API cache")
+    parser.add_argument("command", choices=["show", "bump"])
+    parser.add_argument("--source", default="manual", help="Recorded with the version (bump)")
+    args = parser.parse_args()
+
+    db = MongoClient(Config.MONGO_URI)[Config.MONGO_DB]
+    if args.command == "bump":
+        publish(db, source=args.source)
+        return True
+
+    doc = current_version(db)
+    if doc is None:
+        print("ℹ️ No dataset version published yet")
+        return True
+    cities = ", ".join(doc["cities"]) if doc.get("cities") else "all"
+    print(f"  version       {doc['version']}")
+    print(f"  published at  {doc['published_at']} by {doc['source']} (cities: {cities})")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Fingerprints of pipeline inputs/outputs (data/processed/pipeline_manifest.json).
+
+For every city and stage the manifest records the fingerprint (sha256) of
+each input and output file plus any parameters the stage depends on. A
+stage is up to date when all of them still match; run_full_pipeline.py
+only re-runs the stages (and cities) that are not.
+
+Hashing a multi-GB reviews.csv on every run would defeat the purpose, so
+file hashes are cached by (size, mtime): an untouched file is never re-read.
+
+{
+  "files":  {"raw/rome/reviews.csv": {"size": ..., "mtime_ns": ..., "sha256": ...}, ...},
+  "cities": {"rome": {"data_etl": {"inputs": {...}, "outputs": {...},
+                                   "params": {...}, "completed_at": "..."}, ...}}
+}
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BACKEND_DIR / "data"
+
+MANIFEST_FILE = "pipeline_manifest.json"
+
+HASH_BLOCK = 1 << 20
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class PipelineManifest:
+    """
+    Usage:
+        manifest = PipelineManifest()
+        needed, reason = manifest.stage_status('rome', 'data_etl', inputs, outputs)
+        ... run the stage ...
+        manifest.record('rome', 'data_etl', inputs, outputs)
+        manifest.save()
+    """
+
+    def __init__(self, data_dir=DATA_DIR):
+        self.data_dir = Path(data_dir).resolve()
+        self.path = self.data_dir / "processed" / MANIFEST_FILE
+        self.files = {}
+        self.cities = {}
+
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+            self.files = stored.get("files", {})
+            self.cities = stored.get("cities", {})
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"files": self.files, "cities": self.cities}, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    # ------------------------------------------------------------------
+    # Fingerprints
+    # ------------------------------------------------------------------
+
+    def _key(self, path) -> str:
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(self.data_dir).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def fingerprint(self, path) -> str | None:
+        """sha256 of a file (None if missing), cached by size + mtime."""
+        path = Path(path)
+        key = self._key(path)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self.files.pop(key, None)
+            return None
+
+        cached = self.files.get(key)
+        if cached and cached["size"] == st.st_size and cached["mtime_ns"] == st.st_mtime_ns:
+            return cached["sha256"]
+
+        sha = file_sha256(path)
+        self.files[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": sha}
+        return sha
+
+    def fingerprints(self, paths) -> dict:
+        return {self._key(p): self.fingerprint(p) for p in paths}
+
+    # ------------------------------------------------------------------
+    # Stage records
+    # ------------------------------------------------------------------
+
+    def stage_status(self, city: str, stage: str, inputs, outputs=(), params=None) -> tuple[bool, str]:
+        """(needs_run, reason) for one city/stage."""
+        record = self.cities.get(city, {}).get(stage)
+        if record is None:
+            return True, "never run"
+
+        if record.get("params", {}) != (params or {}):
+            return True, "parameters changed"
+
+        current = self.fingerprints(inputs)
+        changed = sorted(k for k, v in current.items() if record["inputs"].get(k) != v)
+        changed += sorted(k for k in record["inputs"] if k not in current)
+        if changed:
+            return True, f"inputs changed: {', '.join(Path(k).name for k in changed)}"
+
+        outputs = self.fingerprints(outputs)
+        stale = sorted(k for k, v in outputs.items() if record["outputs"].get(k, "") != v)
+        if stale:
+            return True, f"outputs missing/modified: {', '.join(Path(k).name for k in stale)}"
+
+        return False, "up to date"
+
+    def record(self, city: str, stage: str, inputs, outputs=(), params=None):
+        self.cities.setdefault(city, {})[stage] = {
+            "inputs": self.fingerprints(inputs),
+            "outputs": self.fingerprints(outputs),
+            "params": params or {},
+            "completed_at": datetime.now().isoformat(timespec="seconds"),
+        }
+
+    def invalidate(self, city: str, stage: str):
+        self.cities.get(city, {}).pop(stage, None)
+
+    # ------------------------------------------------------------------
+    # Per-city state (cities run in separate processes, the parent merges)
+    # ------------------------------------------------------------------
+
+    def city_state(self, city: str) -> dict:
+        prefixes = (f"raw/{city}/", f"processed/{city}/")
+        return {
+            "stages": self.cities.get(city, {}),
+            "files": {k: v for k, v in self.files.items() if k.startswith(prefixes)},
+        }
+
+    def merge_city_state(self, city: str, state: dict):
+        self.cities[city] = state["stages"]
+        self.files.update(state["files"])
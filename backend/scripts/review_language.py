@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Review language filter (shared by sentiment ETL, wordcloud ETL and RAG ingest).
+
+Reads data/raw/<city>/reviews.csv once and writes a compact per-review
+artifact data/processed/<city>/reviews_language.parquet (or .csv):
+
+    id, listing_id, is_english, length
+
+Downstream stages read comments for the English ids only, instead of each
+re-classifying the whole corpus.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.artifacts import find_artifact, read_artifact_file, write_artifact  # noqa: E402
+
+
+# Rows per reviews.csv chunk
+CHUNK_SIZE = 200000
+
+LANGUAGE_ARTIFACT = 'reviews_language'
+
+NON_ENGLISH_MARKERS = frozenset({
+    'het', 'een', 'van', 'voor', 'was', 'zeer', 'erg', 'mooie', 'zijn', 'de', 'op',
+    'sehr', 'gut', 'war', 'und', 'ist', 'auch', 'wir', 'schön', 'die', 'der',
+    'molto', 'bella', 'ottimo', 'casa', 'bellissimo', 'siamo', 'che', 'della',
+    'très', 'bien', 'nous', 'était', 'avec', 'merci', 'les', 'des',
+    'muy', 'estaba', 'todo', 'excelente', 'las', 'los',
+    'velmi', 'dobrý', 'jsme', 'bylo', 'jsou'
+})
+
+ENGLISH_MARKERS = frozenset({
+    'the', 'was', 'very', 'great', 'nice', 'good', 'we', 'our', 'had',
+    'place', 'location', 'stay', 'apartment', 'host', 'clean',
+    'would', 'recommend'
+})
+
+
+def is_likely_english(text) -> bool:
+    """
+    Quick heuristic: no foreign marker in the first 5 words, >= 2 English markers.
+    Scalar reference for english_mask(), which is what the stage uses.
+    """
+    if pd.isna(text) or len(str(text)) < 10:
+        return False
+
+    words = str(text).lower().split()
+
+    for word in words[:5]:
+        if word in NON_ENGLISH_MARKERS:
+            return False
+
+    english_count = sum(1 for word in words if word in ENGLISH_MARKERS)
+    return english_count >= 2
+
+
+# Every character str.split() splits on (str.isspace), as a regex class
+_SPACE = "".join(chr(i) for i in range(0x3001) if chr(i).isspace())
+_S = "[" + "".join(f"\\x{{{ord(c):x}}}" for c in _SPACE) + "]"
+_NS = "[^" + _S[1:]
+
+
+def _alternation(markers) -> str:
+    return "(?:" + "|".join(re.escape(m) for m in sorted(markers, key=len, reverse=True)) + ")"
+
+
+# On a lowercased comment padded with a space on each side, a marker is a
+# whole str.split() token when whitespace surrounds it.
+# A foreign marker among the first five tokens:
+FOREIGN_START = rf"^{_S}*(?:{_NS}+{_S}+){{0,4}}{_alternation(NON_ENGLISH_MARKERS)}{_S}"
+
+# Two English marker tokens anywhere (adjacent ones share the space between them):
+TWO_ENGLISH = rf"(?s){_S}{_alternation(ENGLISH_MARKERS)}{_S}(?:.*{_S})?{_alternation(ENGLISH_MARKERS)}{_S}"
+
+
+def english_mask(comments: pd.Series) -> np.ndarray:
+    """
+    Column-at-once is_likely_english: returns a boolean mask aligned with
+    comments.
+
+    The column is lowercased and padded once, then both rules run as
+    Arrow regex kernels (pyarrow.compute.match_substring_regex, RE2) over
+    the whole column: a foreign marker among the first five tokens, and
+    two English markers anywhere. Same result as applying
+    is_likely_english row by row.
+    """
+    mask = np.zeros(len(comments), dtype=bool)
+
+    present = comments.notna().to_numpy()
+    text = comments[present].astype(str)
+    long_enough = (text.str.len() >= 10).to_numpy()
+    rows = np.flatnonzero(present)[long_enough]
+    if not len(rows):
+        return mask
+
+    text = pa.array((" " + text[long_enough].str.lower() + " ").to_numpy(dtype=object), type=pa.large_string())
+
+    foreign = pc.match_substring_regex(text, FOREIGN_START).to_numpy(zero_copy_only=False)
+    english = pc.match_substring_regex(text, TWO_ENGLISH).to_numpy(zero_copy_only=False)
+    mask[rows] = english & ~foreign
+    return mask
+
+
+def comment_lengths(comments: pd.Series) -> np.ndarray:
+    """len(str(comment)), 0 for missing comments."""
+    return comments.astype(str).str.len().where(comments.notna(), 0).to_numpy(dtype=np.int32)
+
+
+class ReviewLanguageETL:
+    """
+    Classify every review of a city once.
+    Input:  data/raw/<city>/reviews.csv
+    Output: data/processed/<city>/reviews_language.parquet|.csv
+    """
+
+    def __init__(self, city, data_dir='../data', chunksize=CHUNK_SIZE):
+        self.city = city
+        self.raw_path = Path(data_dir) / 'raw' / city
+        self.processed_path = Path(data_dir) / 'processed' / city
+        self.processed_path.mkdir(parents=True, exist_ok=True)
+        self.chunksize = chunksize
+
+    def classify(self, reviews: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({
+            'id': reviews['id'].to_numpy(),
+            'listing_id': reviews['listing_id'].to_numpy(),
+            'is_english': english_mask(reviews['comments']),
+            'length': comment_lengths(reviews['comments']),
+        })
+
+    def run(self) -> pd.DataFrame:
+        print(f"Classifying {self.city} review languages...")
+
+        reviews_path = self.raw_path / 'reviews.csv'
+        if not reviews_path.exists():
+            print(f"⚠️  No reviews.csv in {self.raw_path}")
+            return pd.DataFrame(columns=['id', 'listing_id', 'is_english', 'length'])
+
+        parts = []
+        for chunk in pd.read_csv(
+            reviews_path,
+            usecols=['id', 'listing_id', 'comments'],
+            chunksize=self.chunksize,
+        ):
+            parts.append(self.classify(chunk))
+
+        language = pd.concat(parts, ignore_index=True)
+
+        output_file = write_artifact(language, self.processed_path, LANGUAGE_ARTIFACT)
+
+        english = int(language['is_english'].sum())
+        pct = english / max(len(language), 1) * 100
+        print(f"✓ Saved: {output_file} ({len(language):,} reviews, {english:,} English = {pct:.1f}%)")
+
+        return language
+
+
+def load_review_language(city, data_dir='../data') -> pd.DataFrame:
+    """
+    Read the language artifact for a city, (re)building it first if it is
+    missing or older than reviews.csv (a new scrape would otherwise lose
+    every review the old artifact doesn't list).
+    """
+    artifact = find_artifact(Path(data_dir) / 'processed' / city, LANGUAGE_ARTIFACT)
+    reviews_path = Path(data_dir) / 'raw' / city / 'reviews.csv'
+
+    stale = artifact is not None and reviews_path.exists() and reviews_path.stat().st_mtime > artifact.stat().st_mtime
+    if artifact is None or stale:
+        if stale:
+            print(f"ℹ️ {artifact.name} is older than {reviews_path}: rebuilding")
+        return ReviewLanguageETL(city, data_dir=data_dir).run()
+
+    return read_artifact_file(artifact)
+
+
+def english_review_ids(language: pd.DataFrame, min_length: int = 0) -> np.ndarray:
+    """Ids of English reviews (optionally at least min_length characters)."""
+    mask = language['is_english'].to_numpy(dtype=bool)
+    if min_length:
+        mask &= language['length'].to_numpy() >= min_length
+    return language['id'].to_numpy()[mask]
+
+
+def main(cities=None):
+    """Callable entrypoint for pipeline imports."""
+    if cities is None:
+        cities = ['amsterdam', 'rome', 'lisbon', 'sicily', 'bordeaux', 'crete']
+
+    for city in cities:
+        ReviewLanguageETL(city).run()
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Classify review languages once per city")
+    parser.add_argument("cities", nargs="*", help="Cities to process (default: all)")
+    args = parser.parse_args()
+
+    main(cities=args.cities or None)
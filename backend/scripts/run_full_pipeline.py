@@ -1,23 +1,80 @@
 #!/usr/bin/env python3
 """
-RUN FULL PIPELINE (import-call style)
+RUN FULL PIPELINE (import-call style, incremental)
 
-Order:
-1) Drop DB
-2) data_etl -> creates processed CSVs
+Order (per city, cities in parallel worker processes):
+1) data_etl -> creates processed artifacts (Parquet by default)
+2) review_language -> one English/length flag per review (reviews_language artifact)
 3) sentiment_etl -> english-filtered sentiment + listing_sentiment + listings_map
-4) wordcloud_etl -> review_words + images (optional)
-5) upload_all_data -> uploads processed CSVs to Mongo (NO aggregations here)
-6) aggregation scripts -> build dashboard collections
+4) wordcloud_etl -> review_words + images (cached renders; failures don't stop the city)
+5) upload_all_data -> replaces the cities' slices of each collection (once, after all cities)
+6) dashboard_aggregates -> rebuild the cities' dashboard docs from their artifacts (once, after the upload)
+7) dataset_version -> publish a new version for the API cache keys, then warm_cache (after a load)
+
+Steps 5 and 6 rewrite whole collections (staging collection + atomic swap,
+see collection_swap.py), so they run in this process for every city that
+needs them instead of concurrently in the city workers.
+
+Each stage's input/output fingerprints are kept in
+data/processed/pipeline_manifest.json; a re-run only repeats the stages
+whose inputs, outputs or parameters changed (see pipeline_manifest.py).
+
+Usage:
+    python scripts/run_full_pipeline.py                  # everything that changed
+    python scripts/run_full_pipeline.py --dry-run        # list planned work only
+    python scripts/run_full_pipeline.py --cities rome    # only these cities
+    python scripts/run_full_pipeline.py --force          # re-run every stage
+    python scripts/run_full_pipeline.py --jobs 2         # at most 2 cities at a time
+    python scripts/run_full_pipeline.py --compare        # flag regressions vs the last run report
+    python scripts/run_full_pipeline.py --no-warm        # publish the dataset version, skip the warm-up
+
+Every stage is measured (wall/CPU time, rows, rows/s, peak RSS, Mongo
+documents written; see stage_timer.py) and the run's metrics are written to
+data/processed/reports/pipeline_report_<timestamp>.json.
 """
 
+import argparse
+import os
 import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack, redirect_stderr, redirect_stdout
 from pathlib import Path
 from datetime import datetime
 
 BACKEND_DIR = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = BACKEND_DIR / "scripts"
 sys.path.insert(0, str(BACKEND_DIR))
 
+from config import Config  # noqa: E402
+from scripts.artifacts import SCHEMAS, UPLOAD_ARTIFACTS, artifact_path, find_artifact, output_formats  # noqa: E402
+from scripts.pipeline_manifest import PipelineManifest  # noqa: E402
+from scripts.stage_timer import (  # noqa: E402
+    StageTimer, previous_report, print_comparison, print_stage_table, write_report
+)
+from scripts.wordcloud_render import CACHE_FILE as RENDER_CACHE_FILE  # noqa: E402
+
+CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+RAW_DATA_DIR = BACKEND_DIR / "data" / "raw"
+PROCESSED_DIR = BACKEND_DIR / "data" / "processed"
+REPORT_DIR = PROCESSED_DIR / "reports"
+
+# Wordcloud PNGs render in a pool and only when their words change
+ENABLE_WORDCLOUD = True
+
+UPLOAD_STAGE = "upload"
+AGGREGATE_STAGE = "aggregate"
+WARM_STAGE = "warm_cache"
+
+# Collection-wide stages: flagged by the city workers, run once by the parent
+SHARED_STAGES = (UPLOAD_STAGE, AGGREGATE_STAGE)
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
 
 def print_header(title: str):
     print("\n" + "=" * 80)
@@ -31,64 +88,450 @@ def must(ok: bool, step: str):
         raise RuntimeError(f"CRITICAL: {step} failed. Pipeline stopped.")
 
 
-def main():
+def artifact_files(city: str, names: list[str]) -> list[Path]:
+    """Current file of each artifact (or where it would be written)."""
+    directory = PROCESSED_DIR / city
+    return [
+        find_artifact(directory, name) or artifact_path(directory, name, output_formats()[0])
+        for name in names
+    ]
+
+
+def etl_params(artifacts: list[str]) -> dict:
+    """ETL stage parameters: a new column in an output's schema re-runs the stage."""
+    return {
+        "artifact_format": Config.ARTIFACT_FORMAT,
+        "schemas": {name: SCHEMAS[name] for name in artifacts if name in SCHEMAS},
+    }
+
+
+def city_stages(city: str) -> list[dict]:
+    """Stages for one city: fingerprinted inputs/outputs, parameters, upstream stages."""
+    raw = RAW_DATA_DIR / city
+    db_params = {"mongo_db": Config.MONGO_DB}
+
+    data_outputs = ["listings_clean", "occupancy_monthly", "occupancy_neighborhood", "neighborhood_stats", "top_hosts"]
+    sentiment_outputs = ["reviews_sentiment", "listing_sentiment", "neighborhood_sentiment", "listings_map"]
+
+    stages = [
+        {
+            "name": "data_etl",
+            "inputs": [raw / "listings.csv", raw / "calendar.csv"],
+            "outputs": artifact_files(city, data_outputs),
+            "params": etl_params(data_outputs),
+            "after": [],
+        },
+        {
+            "name": "review_language",
+            "inputs": [raw / "reviews.csv"],
+            "outputs": artifact_files(city, ["reviews_language"]),
+            "params": etl_params(["reviews_language"]),
+            "after": [],
+        },
+        {
+            "name": "sentiment",
+            "inputs": [raw / "reviews.csv", *artifact_files(city, ["listings_clean", "reviews_language"])],
+            "outputs": artifact_files(city, sentiment_outputs),
+            "params": etl_params(sentiment_outputs),
+            "after": ["data_etl", "review_language"],
+        },
+    ]
+
+    if ENABLE_WORDCLOUD:
+        stages.append({
+            "name": "wordcloud",
+            "inputs": [raw / "reviews.csv", *artifact_files(city, ["listings_clean", "reviews_language"])],
+            "outputs": [
+                *artifact_files(city, ["review_words"]),
+                PROCESSED_DIR / city / "wordcloud_images" / RENDER_CACHE_FILE,
+            ],
+            "params": etl_params(["review_words"]),
+            "after": ["data_etl", "review_language"],
+        })
+
+    stages += [
+        {
+            "name": UPLOAD_STAGE,
+            "inputs": artifact_files(city, UPLOAD_ARTIFACTS),
+            "outputs": [],
+            "params": db_params,
+            "after": [s["name"] for s in stages],
+        },
+        {
+            "name": AGGREGATE_STAGE,
+            "inputs": artifact_files(city, ["listings_clean", "reviews_sentiment", "occupancy_neighborhood"]),
+            "outputs": [],
+            "params": db_params,
+            "after": [UPLOAD_STAGE],
+        },
+    ]
+    return stages
+
+
+def stage_needed(manifest, city: str, stage: dict, force: bool, upstream: set) -> tuple[bool, str]:
+    if force:
+        return True, "forced"
+    needed, reason = manifest.stage_status(city, stage["name"], stage["inputs"], stage["outputs"], stage["params"])
+    if needed:
+        return True, reason
+    changed = [name for name in stage["after"] if name in upstream]
+    if changed:
+        return True, f"after {', '.join(changed)}"
+    return False, reason
+
+
+def plan(manifest, cities: list[str], force: bool) -> dict:
+    """
+    {city: [(stage, reason), ...]} for stages that will run. Conservative:
+    anything downstream of a planned stage is planned too (at run time it
+    is skipped again if the upstream outputs came out byte-identical).
+    """
+    planned = {}
+    for city in cities:
+        todo = []
+        for stage in city_stages(city):
+            needed, reason = stage_needed(manifest, city, stage, force, {name for name, _ in todo})
+            if needed:
+                todo.append((stage["name"], reason))
+        planned[city] = todo
+    return planned
+
+
+def print_plan(planned: dict):
+    print_header("PLANNED WORK")
+    for city, todo in planned.items():
+        if not todo:
+            print(f"  ✅ {city}: up to date")
+            continue
+        print(f"  🏙️  {city}:")
+        for name, reason in todo:
+            print(f"     • {name:<16} ({reason})")
+
+
+def run_city_stage(city: str, name: str, workers: int | None = None) -> bool:
+    """
+    Run one per-city stage for one city. False = optional stage failed (not recorded).
+    workers: processes for the stage's pool (VADER scoring, wordcloud renders); None = every CPU.
+    """
+    from scripts import data_etl
+    from scripts import review_language
+    from scripts import sentiment_etl
+    from scripts import wordcloud_etl
+
+    if name == "data_etl":
+        must(data_etl.main(cities=[city]) is not False, f"Data ETL ({city})")
+    elif name == "review_language":
+        must(review_language.main(cities=[city]) is not False, f"Review language filter ({city})")
+    elif name == "sentiment":
+        must(
+            sentiment_etl.main(cities=[city], workers=workers or default_jobs()) is not False,
+            f"Sentiment ETL ({city})",
+        )
+    elif name == "wordcloud":
+        try:
+            wordcloud_etl.main(cities=[city], render_workers=workers)
+        except Exception as e:
+            print(f"⚠️ Wordcloud ETL failed, continuing... ({e})")
+            return False
+    else:
+        raise ValueError(f"Unknown stage: {name}")
+    return True
+
+
+def run_upload(cities: list[str]):
+    from scripts import upload_all_data
+
+    must(
+        upload_all_data.main(upload_raw=True, run_aggs=False, show_summary=False, cities=cities) is not False,
+        f"Upload processed artifacts ({', '.join(cities)})",
+    )
+
+
+def run_aggregations(cities: list[str]):
+    """Dashboard collections for these cities, computed from their artifacts (dashboard_aggregates.py)."""
+    from scripts import dashboard_aggregates
+
+    must(dashboard_aggregates.main(cities=cities) is not False, "Dashboard aggregates")
+
+
+def publish_dataset_version(cities: list[str]):
+    """New version for the API's cache keys (dataset_version.py): cached responses of the old data stop being used."""
+    from pymongo import MongoClient
+    from scripts.dataset_version import publish
+
+    publish(MongoClient(Config.MONGO_URI)[Config.MONGO_DB], cities, source="run_full_pipeline")
+
+
+def run_warm_up() -> bool:
+    """Hot API responses under the new version (warm_cache.py); a failure only costs cache misses."""
+    from scripts import warm_cache
+
+    try:
+        return warm_cache.main() is not False
+    except Exception:
+        traceback.print_exc()
+        return False
+
+
+def run_city(city: str, force: bool = False, log_dir=None, workers: int | None = None) -> dict:
+    """
+    Run one city's stage chain (everything except the upload and aggregations).
+    Runs in a worker process: never raises, the outcome is returned and the
+    parent merges the city's manifest entries.
+    """
+    started = time.perf_counter()
+    result = {"city": city, "ok": True, "error": None, "ran": [], "upload": False, "aggregate": False, "log": None,
+              "stages": []}
+    manifest = PipelineManifest()
+
+    with ExitStack() as stack:
+        if log_dir is not None:
+            result["log"] = str(Path(log_dir) / f"pipeline_{city}.log")
+            log = stack.enter_context(open(result["log"], "w", encoding="utf-8"))
+            stack.enter_context(redirect_stdout(log))
+            stack.enter_context(redirect_stderr(log))
+
+        try:
+            changed = set()
+            for stage in city_stages(city):
+                needed, reason = stage_needed(manifest, city, stage, force, changed)
+                if not needed:
+                    print(f"⏭️  {stage['name']}: {reason}")
+                    continue
+
+                if stage["name"] in SHARED_STAGES:
+                    result[stage["name"]] = True
+                    changed.add(stage["name"])
+                    continue
+
+                print_header(f"{city.upper()}: {stage['name'].upper()} ({reason})")
+                before = manifest.fingerprints(stage["outputs"])
+                timer = StageTimer(stage["name"], city, stage["inputs"], stage["outputs"])
+                try:
+                    with timer:
+                        timer.ok = run_city_stage(city, stage["name"], workers)
+                finally:
+                    result["stages"].append(timer.metrics)
+                if not timer.ok:
+                    result["ran"].append(f"{stage['name']} (failed)")
+                    continue
+                result["ran"].append(stage["name"])
+
+                # Re-resolve paths: outputs may have been written in another format
+                stage = next(s for s in city_stages(city) if s["name"] == stage["name"])
+                manifest.record(city, stage["name"], stage["inputs"], stage["outputs"], stage["params"])
+
+                if not stage["outputs"] or manifest.fingerprints(stage["outputs"]) != before:
+                    changed.add(stage["name"])
+        except Exception as e:
+            traceback.print_exc()
+            result["ok"] = False
+            result["error"] = f"{type(e).__name__}: {e}"
+
+    result["manifest"] = manifest.city_state(city)
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def record_shared_stage(manifest, city: str, name: str):
+    stage = next(s for s in city_stages(city) if s["name"] == name)
+    manifest.record(city, name, stage["inputs"], stage["outputs"], stage["params"])
+
+
+def run_cities(cities: list[str], force: bool, jobs: int) -> list[dict]:
+    """City chains, up to `jobs` at a time (one process per city)."""
+    if jobs <= 1 or len(cities) <= 1:
+        return [run_city(city, force) for city in cities]
+
+    # Share the CPUs between the city processes' scoring / render pools
+    workers = max(1, default_jobs() // jobs)
+
+    log_dir = PROCESSED_DIR
+    log_dir.mkdir(parents=True, exist_ok=True)
+    print(f"⚙️  {len(cities)} cities, {jobs} at a time (logs: {log_dir}/pipeline_<city>.log)\n")
+
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(run_city, city, force, log_dir, workers): city for city in cities}
+        for future in as_completed(futures):
+            city = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:  # worker died (e.g. killed / out of memory)
+                result = {"city": city, "ok": False, "error": f"{type(e).__name__}: {e}",
+                          "ran": [], "upload": False, "aggregate": False, "manifest": None, "seconds": None,
+                          "log": None, "stages": []}
+
+            status = "✅" if result["ok"] else "❌"
+            print(f"  {status} {city} finished" + (f" ({result['seconds']:.1f}s)" if result["seconds"] else ""))
+            results.append(result)
+
+    order = {city: i for i, city in enumerate(cities)}
+    return sorted(results, key=lambda r: order[r["city"]])
+
+
+def print_summary(results: list[dict]):
+    print_header("CITY SUMMARY")
+    for r in results:
+        seconds = f"{r['seconds']:.1f}s" if r["seconds"] is not None else "-"
+        ran = ", ".join(r["ran"]) or "nothing to do"
+        if r["ok"]:
+            print(f"  ✅ {r['city']:<10} {seconds:>8}  {ran}")
+        else:
+            print(f"  ❌ {r['city']:<10} {seconds:>8}  {r['error']}")
+            if r["log"]:
+                print(f"     → {r['log']}")
+
+
+def shared_stage_timer(name: str, cities: list[str]) -> StageTimer:
+    """Timer for a stage run once for several cities (inputs: all their stage inputs)."""
+    inputs = [p for city in cities for s in city_stages(city) if s["name"] == name for p in s["inputs"]]
+    return StageTimer(name, ",".join(cities), inputs)
+
+
+def main(
+    cities=None, force: bool = False, dry_run: bool = False, jobs: int | None = None, compare=None, warm: bool = True
+):
+    """
+    compare: report to check this run against ("previous" = the latest one)
+    warm: precompute the API's hot responses after a load
+    """
     start = datetime.now()
+    cities = list(cities or CITIES)
+    jobs = max(1, min(jobs or default_jobs(), len(cities)))
 
     print("=" * 80)
     print("  🚀 INNSIGHT FULL PIPELINE")
-    print("  Drop DB → ETL → Upload → Aggregations")
+    print("  ETL per city (parallel) → Upload → Aggregations")
     print("=" * 80)
     print(f"\n⏰ Started at: {start.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-    # Import after sys.path is set
-    from scripts import drop_innsight_db
-    from scripts import data_etl
-    from scripts import sentiment_etl
-    from scripts import wordcloud_etl
-    from scripts import upload_all_data
+    # ETL classes resolve ../data relative to the working directory
+    os.chdir(SCRIPTS_DIR)
 
-    from scripts import aggregate_sentiment_summary
-    from scripts import aggregate_room_types
-    from scripts import aggregate_occupancy
-    from scripts import aggregate_top_hosts
+    manifest = PipelineManifest()
+    planned = plan(manifest, cities, force)
+    print_plan(planned)
 
-    cities = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+    if dry_run:
+        print("\nℹ️ --dry-run → nothing executed, manifest untouched")
+        return True
 
-    # 0) Drop DB
-    print_header("STEP 0: DROP DATABASE")
-    must(drop_innsight_db.main() is not False, "Drop database")
+    todo = [city for city in cities if planned[city]]
+    results = run_cities(todo, force, jobs) if todo else []
 
-    # 1) Data ETL
-    print_header("STEP 1: DATA ETL")
-    must(data_etl.main(cities=cities) is not False, "Data ETL")
+    for r in results:
+        if r["manifest"] is not None:
+            manifest.merge_city_state(r["city"], r["manifest"])
+    manifest.save()
 
-    # 2) Sentiment ETL
-    print_header("STEP 2: SENTIMENT ETL")
-    must(sentiment_etl.main(cities=cities) is not False, "Sentiment ETL")
+    # One upload for all the cities whose artifacts changed
+    upload_cities = [r["city"] for r in results if r["ok"] and r["upload"]]
+    shared_stages = []
+    if upload_cities:
+        print_header(f"UPLOAD (STAGING + SWAP): {', '.join(upload_cities)}")
+        timer = shared_stage_timer(UPLOAD_STAGE, upload_cities)
+        try:
+            with timer:
+                run_upload(upload_cities)
+        except Exception as e:
+            traceback.print_exc()
+            for r in results:
+                if r["city"] in upload_cities:
+                    r["ok"] = False
+                    r["error"] = f"upload: {type(e).__name__}: {e}"
+        else:
+            for r in results:
+                if r["city"] in upload_cities:
+                    r["ran"].append(UPLOAD_STAGE)
+                    record_shared_stage(manifest, r["city"], UPLOAD_STAGE)
+            manifest.save()
+        shared_stages.append(timer.metrics)
 
-    # 3) Wordcloud ETL (optional)
-    # print_header("STEP 3: WORDCLOUD ETL (OPTIONAL)")
-    # try:
-    #     wordcloud_etl.main(cities=cities)
-    # except Exception as e:
-    #     print(f"⚠️ Wordcloud ETL failed, continuing... ({e})")
+    print_summary(results)
 
-    # 4) Upload ONLY
-    print_header("STEP 4: UPLOAD PROCESSED CSVs (NO AGGREGATIONS)")
-    must(upload_all_data.main(upload_raw=True, run_aggs=False, show_summary=True) is not False, "Upload processed CSVs")
+    # Global aggregations once every city chain is done (successful cities only)
+    aggregate_cities = [r["city"] for r in results if r["ok"] and r["aggregate"]]
+    if aggregate_cities:
+        print_header(f"AGGREGATIONS (DASHBOARD COLLECTIONS): {', '.join(aggregate_cities)}")
+        timer = shared_stage_timer(AGGREGATE_STAGE, aggregate_cities)
+        try:
+            with timer:
+                run_aggregations(aggregate_cities)
+        except Exception as e:
+            traceback.print_exc()
+            for r in results:
+                if r["city"] in aggregate_cities:
+                    r["ok"] = False
+                    r["error"] = f"aggregations: {type(e).__name__}: {e}"
+        else:
+            for r in results:
+                if r["city"] in aggregate_cities:
+                    r["ran"].append(AGGREGATE_STAGE)
+                    record_shared_stage(manifest, r["city"], AGGREGATE_STAGE)
+            manifest.save()
+        shared_stages.append(timer.metrics)
 
-    # 5) Run aggregations explicitly
-    print_header("STEP 5: AGGREGATIONS (DASHBOARD COLLECTIONS)")
-    must(aggregate_sentiment_summary.main() is not False, "Aggregate sentiment summary")
-    must(aggregate_room_types.main() is not False, "Aggregate room types")
-    must(aggregate_occupancy.main() is not False, "Aggregate occupancy")
-    must(aggregate_top_hosts.main() is not False, "Aggregate top hosts")
+    # Anything loaded (even partially) → new dataset version for the API cache
+    loaded = sorted(set(upload_cities) | set(aggregate_cities))
+    if loaded:
+        print_header("DATASET VERSION")
+        publish_dataset_version(loaded)
+        if warm:
+            print_header("CACHE WARM-UP")
+            timer = StageTimer(WARM_STAGE)
+            with timer:
+                timer.ok = run_warm_up()
+            shared_stages.append(timer.metrics)
+            if not timer.ok:
+                print("⚠️ Cache warm-up failed: the API computes responses on first request")
+
+    failed = [r["city"] for r in results if not r["ok"]]
+
+    stages = [s for r in results for s in r["stages"]] + shared_stages
+    if stages:
+        print_header("STAGE METRICS")
+        print_stage_table(stages)
+        report = write_report(
+            REPORT_DIR, stages,
+            cities=cities, force=force, jobs=jobs, failed=failed, artifact_format=Config.ARTIFACT_FORMAT,
+        )
+        print(f"\n📝 Run report: {report}")
+
+        baseline = previous_report(REPORT_DIR, before=report) if compare == "previous" else compare
+        if baseline:
+            print_comparison(baseline, report)
+        elif compare:
+            print("\nℹ️ No previous report to compare with")
 
     end = datetime.now()
     print_header("DONE")
     print(f"⏱️ Duration: {end - start}")
+    if failed:
+        print(f"❌ Failed cities: {', '.join(failed)} (other cities were updated)")
+        return False
     print("✅ Pipeline finished successfully.")
+    return True
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Run the InnSight pipeline for changed cities/stages")
+    parser.add_argument("--cities", nargs="+", choices=CITIES, help="Cities to consider (default: all)")
+    parser.add_argument("--force", action="store_true", help="Re-run every stage, ignoring the manifest")
+    parser.add_argument("--dry-run", action="store_true", help="Only list the planned work")
+    parser.add_argument(
+        "--jobs", type=int, default=None,
+        help="Cities processed at the same time (default: CPU count, max one per city)",
+    )
+    parser.add_argument(
+        "--compare", nargs="?", const="previous", default=None, metavar="REPORT",
+        help="Flag regressions against a run report (default: the previous one)",
+    )
+    parser.add_argument("--no-warm", action="store_true", help="Skip the API cache warm-up after a load")
+    args = parser.parse_args()
+
+    ok = main(
+        cities=args.cities, force=args.force, dry_run=args.dry_run, jobs=args.jobs, compare=args.compare,
+        warm=not args.no_warm,
+    )
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of VADER scores: (review id, comment hash) -> compound, category.
+
+One SQLite file per city (data/processed/<city>/sentiment_scores.sqlite).
+SentimentETL looks a column (or streamed chunk) of reviews up at once,
+sends only the misses to VADER (SentimentScorer, in batches) and writes
+them back in one transaction, so rebuilding an unchanged corpus skips the
+scoring. Lookups are joined inside SQLite, one chunk of keys at a time:
+the table is never loaded into memory. A review whose text was edited
+hashes differently and is scored again. The VADER version is stored with
+the scores: another version starts an empty cache.
+
+Usage:
+    python scripts/sentiment_cache.py stats [cities]     # entries, size, last run's hit rate
+    python scripts/sentiment_cache.py compact [cities]   # drop stale entries + VACUUM
+"""
+
+import argparse
+import hashlib
+import sqlite3
+import sys
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.artifacts import artifact_exists, read_artifact  # noqa: E402
+from scripts.sentiment_scoring import categorize_sentiment  # noqa: E402
+
+
+CACHE_FILE = "sentiment_scores.sqlite"
+
+PROCESSED_DIR = Path(__file__).resolve().parent.parent / "data" / "processed"
+
+CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    review_id INTEGER NOT NULL,
+    text_hash INTEGER NOT NULL,
+    compound REAL NOT NULL,
+    category TEXT NOT NULL,
+    UNIQUE (review_id, text_hash)
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def scorer_version() -> str:
+    try:
+        return f"vaderSentiment {version('vaderSentiment')}"
+    except PackageNotFoundError:
+        return "vaderSentiment"
+
+
+def text_hashes(comments) -> np.ndarray:
+    """64-bit BLAKE2 hash of each comment (missing comments hash as "")."""
+    return np.fromiter(
+        (
+            int.from_bytes(
+                hashlib.blake2b(("" if pd.isna(c) else str(c)).encode("utf-8"), digest_size=8).digest(),
+                "little", signed=True,
+            )
+            for c in comments
+        ),
+        dtype=np.int64,
+        count=len(comments),
+    )
+
+
+class ScoreCache:
+    """
+    Usage:
+        with ScoreCache(processed_path / CACHE_FILE) as cache:
+            scores = cache.score(reviews['id'], reviews['comments'], score_fn)
+        cache.hits, cache.misses
+
+    score_fn(comments) -> scores, called once per score() with the misses only.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=60)
+        self._conn.executescript(SCHEMA)
+
+        if self.meta("scorer") != scorer_version():
+            with self._conn:
+                self._conn.execute("DELETE FROM scores")
+                self._set_meta("scorer", scorer_version())
+
+    def close(self):
+        if self._conn is not None:
+            if self.hits or self.misses:
+                with self._conn:
+                    self._set_meta("last_hits", self.hits)
+                    self._set_meta("last_misses", self.misses)
+            self._conn.close()
+            self._conn = None
+
+    def meta(self, key: str):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value):
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def lookup(self, ids, hashes) -> np.ndarray:
+        """Cached compound per (id, hash); NaN for misses."""
+        scores = np.full(len(ids), np.nan)
+        # The keys go to a temp table joined on the scores' (review_id, text_hash) index
+        with self._conn:
+            self._conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS lookup_keys "
+                "(pos INTEGER PRIMARY KEY, review_id INTEGER NOT NULL, text_hash INTEGER NOT NULL)"
+            )
+            self._conn.executemany(
+                "INSERT INTO lookup_keys (pos, review_id, text_hash) VALUES (?, ?, ?)",
+                zip(range(len(ids)), map(int, ids), map(int, hashes)),
+            )
+            for pos, compound in self._conn.execute(
+                "SELECT k.pos, s.compound FROM lookup_keys k "
+                "JOIN scores s ON s.review_id = k.review_id AND s.text_hash = k.text_hash"
+            ):
+                scores[pos] = compound
+            self._conn.execute("DELETE FROM lookup_keys")
+        return scores
+
+    def store(self, ids, hashes, scores):
+        rows = [
+            (int(i), int(h), float(s), categorize_sentiment(s))
+            for i, h, s in zip(ids, hashes, scores)
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO scores (review_id, text_hash, compound, category) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def score(self, ids, comments, score_fn) -> np.ndarray:
+        """Compound scores for comments (aligned with ids), scoring only the cache misses."""
+        ids = np.asarray(ids, dtype=np.int64)
+        comments = list(comments)
+        hashes = text_hashes(comments)
+
+        scores = self.lookup(ids, hashes)
+        missing = np.flatnonzero(np.isnan(scores))
+        self.hits += len(scores) - len(missing)
+        self.misses += len(missing)
+
+        if len(missing):
+            fresh = np.asarray(score_fn([comments[i] for i in missing]), dtype=float)
+            scores[missing] = fresh
+            self.store(ids[missing], hashes[missing], fresh)
+        return scores
+
+    def report(self) -> str:
+        total = self.hits + self.misses
+        rate = self.hits / total if total else 0.0
+        return f"{self.hits:,} hits, {self.misses:,} misses ({rate:.1%} hit rate)"
+
+    def stats(self) -> dict:
+        entries, reviews = self._conn.execute("SELECT COUNT(*), COUNT(DISTINCT review_id) FROM scores").fetchone()
+        hits, misses = int(self.meta("last_hits") or 0), int(self.meta("last_misses") or 0)
+        return {
+            "entries": entries,
+            "reviews": reviews,
+            "size_mb": self.path.stat().st_size / 2**20,
+            "last_hit_rate": hits / (hits + misses) if hits + misses else None,
+        }
+
+    def compact(self, keep_ids=None) -> int:
+        """
+        Drops superseded texts (older hashes of a review) and, if keep_ids is
+        given, reviews not in it; then VACUUMs. Returns the rows removed.
+        """
+        before = self._conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+        with self._conn:
+            # INSERT OR REPLACE gives the latest text of a review the highest rowid
+            self._conn.execute(
+                "DELETE FROM scores WHERE rowid NOT IN (SELECT MAX(rowid) FROM scores GROUP BY review_id)"
+            )
+            if keep_ids is not None:
+                self._conn.execute("CREATE TEMP TABLE keep (review_id INTEGER PRIMARY KEY)")
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO keep VALUES (?)", ((int(i),) for i in keep_ids)
+                )
+                self._conn.execute("DELETE FROM scores WHERE review_id NOT IN (SELECT review_id FROM keep)")
+                self._conn.execute("DROP TABLE keep")
+        self._conn.execute("VACUUM")
+        return before - self._conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentiment score cache maintenance")
+    parser.add_argument("command", choices=["stats", "compact"])
+    parser.add_argument("cities", nargs="*", help="Cities (default: all)")
+    parser.add_argument("--data-dir", default=str(PROCESSED_DIR), help="Processed data directory")
+    args = parser.parse_args()
+
+    for city in args.cities or CITIES:
+        city_path = Path(args.data_dir) / city
+        path = city_path / CACHE_FILE
+        if not path.exists():
+            print(f"  {city:<10} no cache")
+            continue
+
+        with ScoreCache(path) as cache:
+            if args.command == "compact":
+                # Scored reviews = the English ones in the current reviews_sentiment
+                keep = None
+                if artifact_exists(city_path, "reviews_sentiment"):
+                    keep = read_artifact(city_path, "reviews_sentiment", columns=["id"])["id"].to_numpy()
+                removed = cache.compact(keep)
+                print(f"  🧹 {city:<10} removed {removed:,} entries")
+
+            s = cache.stats()
+            rate = "-" if s["last_hit_rate"] is None else f"{s['last_hit_rate']:.1%}"
+            print(f"  {city:<10} {s['entries']:>10,} entries {s['reviews']:>10,} reviews "
+                  f"{s['size_mb']:>8.1f} MB   last run hit rate {rate}")
+
+
+if __name__ == "__main__":
+    main()
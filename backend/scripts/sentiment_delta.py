@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Incremental sentiment ingestion for a new scrape.
+
+Only the reviews added to reviews.csv since the last sentiment run are
+scored (SentimentETL.run_delta: id/date watermark + the saved per-listing
+moments and per-neighborhood histogram), then MongoDB is patched in place
+instead of re-uploaded:
+
+  reviews_sentiment       new reviews upserted on (city, id)
+  listing_sentiment,
+  listings_map            documents of the listings that got new reviews
+  neighborhood_sentiment  documents of the neighborhoods that got new reviews
+  sentiment_summary       those neighborhoods + the city document
+
+and a new dataset version is published so the API drops its cached
+responses (dataset_version.py).
+
+A city without saved state (never run by this version of sentiment_etl.py)
+gets a full sentiment run instead and must be uploaded again. Changes to
+the listings themselves (new listings, neighborhoods) need the full
+pipeline.
+
+Usage:
+    python scripts/sentiment_delta.py                    # all cities
+    python scripts/sentiment_delta.py rome --no-mongo    # artifacts only
+"""
+
+import argparse
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pandas as pd
+from pymongo import MongoClient, ReplaceOne
+
+from config import Config
+from scripts.aggregate_sentiment_summary import CATEGORIES, summary_doc
+from scripts.artifacts import read_artifact
+from scripts.bulk_loader import frame_documents, normalize_columns
+from scripts.dataset_version import publish as publish_dataset_version
+from scripts.sentiment_etl import BATCH_SIZE, SentimentETL
+from scripts.sentiment_scoring import categorize_sentiment
+from scripts.stage_timer import record_mongo_writes
+
+
+CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+# Upsert key of each patched collection (indexed so the upserts are lookups)
+DOCUMENT_KEYS = {
+    "reviews_sentiment": ["city", "id"],
+    "listing_sentiment": ["city", "listing_id"],
+    "listings_map": ["city", "listing_id"],
+    "neighborhood_sentiment": ["city", "neighborhood"],
+    "sentiment_summary": ["city", "level", "neighborhood"],
+}
+
+
+def replace_documents(db, name: str, docs: list[dict]) -> int:
+    """Upsert docs on the collection's DOCUMENT_KEYS in one bulk_write."""
+    if not docs:
+        return 0
+    keys = DOCUMENT_KEYS[name]
+    db[name].create_index([(k, 1) for k in keys])
+    db[name].bulk_write([ReplaceOne({k: d[k] for k in keys}, d, upsert=True) for d in docs], ordered=False)
+    record_mongo_writes(len(docs))
+    return len(docs)
+
+
+def artifact_documents(city: str, processed_path, name: str, column: str, values) -> list[dict]:
+    """Documents (as uploaded by upload_all_data) of the artifact rows whose column is in values."""
+    df = read_artifact(processed_path, name)
+    return frame_documents(normalize_columns(df[df[column].isin(values)]), city=city)
+
+
+def summary_docs(city: str, stats, neighborhoods) -> list[dict]:
+    """sentiment_summary docs of the city and of these neighborhoods, from the accumulator."""
+    counts = (
+        stats.neighborhood_category_counts(categorize_sentiment)
+        .reindex(columns=CATEGORIES, fill_value=0)
+    )
+    if counts.empty:
+        return []
+
+    # listings_clean drops listings without a neighborhood: the histogram covers every review
+    docs = [summary_doc(city, None, *(int(counts[c].sum()) for c in CATEGORIES))]
+    for neigh in sorted(set(neighborhoods) & set(counts.index)):
+        docs.append(summary_doc(city, neigh, *(int(counts.at[neigh, c]) for c in CATEGORIES)))
+    return docs
+
+
+def refresh_mongo(db, city: str, processed_path, reviews: pd.DataFrame, stats) -> dict:
+    """Patch the city's documents touched by the new reviews; {collection: documents written}."""
+    listing_ids = reviews["listing_id"].unique()
+    neighborhoods = reviews["neighborhood"].dropna().unique()
+
+    written = {
+        "reviews_sentiment": replace_documents(
+            db, "reviews_sentiment", frame_documents(normalize_columns(reviews), city=city)
+        ),
+    }
+    for name in ("listing_sentiment", "listings_map"):
+        written[name] = replace_documents(
+            db, name, artifact_documents(city, processed_path, name, "listing_id", listing_ids)
+        )
+    written["neighborhood_sentiment"] = replace_documents(
+        db, "neighborhood_sentiment",
+        artifact_documents(city, processed_path, "neighborhood_sentiment", "neighborhood", neighborhoods),
+    )
+    written["sentiment_summary"] = replace_documents(db, "sentiment_summary", summary_docs(city, stats, neighborhoods))
+    return written
+
+
+def main(cities=None, mongo: bool = True, workers: int = 1, batch_size: int = BATCH_SIZE):
+    """Callable entrypoint for pipeline imports."""
+    if cities is None:
+        cities = CITIES
+
+    db = MongoClient(Config.MONGO_URI)[Config.MONGO_DB] if mongo else None
+
+    full_runs = []
+    patched = []
+    for city in cities:
+        etl = SentimentETL(city, workers=workers, batch_size=batch_size)
+        reviews = etl.run_delta()
+
+        if reviews is None:
+            print(f"🔁 {city}: full sentiment run")
+            etl.run()
+            full_runs.append(city)
+            continue
+
+        if db is not None and not reviews.empty:
+            written = refresh_mongo(db, city, etl.processed_path, reviews, etl.stats)
+            print("  ✅ MongoDB: " + ", ".join(f"{name} {n:,}" for name, n in written.items()))
+            patched.append(city)
+
+    if patched:
+        publish_dataset_version(db, patched, source="sentiment_delta")
+
+    if full_runs and mongo:
+        print(f"\nℹ️ Upload needed for (full run): {', '.join(full_runs)}")
+        print(f"   python scripts/upload_all_data.py {' '.join(full_runs)}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score only new reviews and patch the sentiment collections")
+    parser.add_argument("cities", nargs="*", help="Cities to process (default: all)")
+    parser.add_argument("--no-mongo", action="store_true", help="Update the artifacts only")
+    parser.add_argument("--workers", type=int, default=1, help="VADER scoring processes (default 1)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Comments per scoring batch")
+    args = parser.parse_args()
+
+    main(cities=args.cities or None, mongo=not args.no_mongo, workers=args.workers, batch_size=args.batch_size)
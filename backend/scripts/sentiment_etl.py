@@ -1,72 +1,169 @@
 #!/usr/bin/env python3
 
+import sys
+import argparse
+import csv
+import hashlib
+import json
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import math
+from contextlib import contextmanager
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.artifacts import (  # noqa: E402
+    ArtifactWriter, artifact_exists, find_artifact, read_artifact, write_artifact
+)
+from scripts.sentiment_cache import CACHE_FILE, ScoreCache  # noqa: E402
+from scripts.sentiment_stats import HISTOGRAM_COLS, MOMENT_COLS, SentimentAccumulator  # noqa: E402
+from scripts.review_language import load_review_language, english_review_ids, english_mask  # noqa: E402
+from scripts.sentiment_scoring import (  # noqa: E402
+    SentimentScorer, compound_score, categorize_sentiment, BATCH_SIZE
+)
+
+
+# Rows per reviews.csv chunk in streaming mode
+CHUNK_SIZE = 200000
+
+# reviews_sentiment artifact columns
+REVIEW_COLUMNS = ['listing_id', 'id', 'date', 'neighborhood', 'sentiment', 'sentiment_category']
+
+# Saved by every run for the next run_delta(): SentimentAccumulator state + watermark
+STATE_ARTIFACTS = ('sentiment_moments', 'sentiment_histogram')
+WATERMARK_FILE = 'sentiment_watermark.json'
+
+# Bytes hashed at the end of the reviews.csv a run has read, to recognise it after appends
+CSV_TAIL_BYTES = 1 << 16
+
+REVIEW_CSV_COLUMNS = ['listing_id', 'id', 'date', 'comments']
+
+
+def review_watermark(reviews, previous=None):
+    """Highest review id and date among raw reviews (any language), merged with previous."""
+    if reviews.empty:
+        return previous
+    dates = reviews['date'].dropna().astype(str)
+    mark = {'max_id': int(reviews['id'].max()), 'max_date': dates.max() if len(dates) else ''}
+    if previous:
+        mark = {key: max(mark[key], previous[key]) for key in mark}
+    return mark
+
+
+def _tail_hash(path, end: int) -> str:
+    start = max(0, end - CSV_TAIL_BYTES)
+    with open(path, 'rb') as f:
+        f.seek(start)
+        tail = f.read(end - start)
+    # Only a file ending on a row boundary can be continued
+    return hashlib.blake2b(tail, digest_size=16).hexdigest() if tail.endswith(b'\n') else ''
+
+
+def csv_mark(path) -> dict:
+    """Size of reviews.csv and a hash of its last bytes, saved with the watermark."""
+    size = Path(path).stat().st_size
+    return {'size': size, 'tail': _tail_hash(path, size)}
+
+
+def appended_offset(path, mark) -> int | None:
+    """Byte offset of the rows appended to path since mark was taken; None if it was rewritten."""
+    if not mark or not mark.get('tail'):
+        return None
+    if Path(path).stat().st_size < mark['size'] or _tail_hash(path, mark['size']) != mark['tail']:
+        return None
+    return mark['size']
+
+
+def read_csv_from(path, offset: int, usecols, chunksize: int):
+    """Chunks of the csv rows from byte offset (a row boundary) on, parsed with the file's header."""
+    with open(path, 'rb') as f:
+        names = next(csv.reader([f.readline().decode('utf-8-sig')]))
+        f.seek(offset)
+        if not f.read(1):
+            return
+        f.seek(offset)
+        yield from pd.read_csv(f, header=None, names=names, usecols=usecols, chunksize=chunksize)
 
 
 class SentimentETL:
     """
     Sentiment analysis on reviews using PROCESSED listings_clean.csv
     Requires: data_etl.py run first (creates listings_clean.csv)
-    VADER only works on English - filters non-English reviews
-    """
+    VADER only works on English - keeps reviews flagged English in
+    reviews_language artifact (built by review_language.py if missing)
 
-    def __init__(self, city):
-        self.city = city
-        self.raw_path = Path(f'../data/raw/{city}')
-        self.processed_path = Path(f'../data/processed/{city}')
-        self.processed_path.mkdir(parents=True, exist_ok=True)
-
-        self.vader = SentimentIntensityAnalyzer()
+    chunksize: when set, reviews.csv is streamed in chunks of this many rows
+    and listing/neighborhood stats are built from running accumulators
+    instead of the full reviews frame.
 
-    def is_likely_english(self, text):
-        if pd.isna(text) or len(str(text)) < 10:
-            return False
+    workers / batch_size: VADER scoring is split into batches of batch_size
+    comments across a pool of this many processes (1 = in-process).
 
-        text_lower = str(text).lower()
+    cache: reuse the scores of reviews whose id and text are unchanged
+    (sentiment_cache.py); only the misses go to VADER.
 
-        non_english_markers = [
-            'het', 'een', 'van', 'voor', 'was', 'zeer', 'erg', 'mooie', 'zijn', 'de', 'op',
-            'sehr', 'gut', 'war', 'und', 'ist', 'auch', 'wir', 'schön', 'die', 'der',
-            'molto', 'bella', 'ottimo', 'casa', 'bellissimo', 'siamo', 'che', 'della',
-            'très', 'bien', 'nous', 'était', 'avec', 'merci', 'les', 'des',
-            'muy', 'estaba', 'todo', 'casa', 'excelente', 'las', 'los',
-            'velmi', 'dobrý', 'jsme', 'bylo', 'jsou'
-        ]
-
-        first_words = text_lower.split()[:5]
-        for word in first_words:
-            if word in non_english_markers:
-                return False
+    Every run saves its accumulator and the id/date watermark of the raw
+    reviews; run_delta() then scores only the reviews added since.
+    """
 
-        english_markers = [
-            'the', 'was', 'very', 'great', 'nice', 'good', 'we', 'our', 'had',
-            'place', 'location', 'stay', 'apartment', 'host', 'clean',
-            'would', 'recommend'
-        ]
+    def __init__(self, city, chunksize=None, workers=1, batch_size=BATCH_SIZE, data_dir='../data', cache=True):
+        self.city = city
+        self.data_dir = data_dir
+        self.chunksize = chunksize
+        self.workers = workers
+        self.batch_size = batch_size
+        self.use_cache = cache
+        self.scorer = None
+        self.cache = None
+        self.watermark = None
+        self.csv_mark = None
+        self.stats = None
+        self.raw_path = Path(data_dir) / 'raw' / city
+        self.processed_path = Path(data_dir) / 'processed' / city
+        self.processed_path.mkdir(parents=True, exist_ok=True)
 
-        english_count = sum(1 for word in text_lower.split() if word in english_markers)
-        return english_count >= 2
+        self.vader = SentimentIntensityAnalyzer()
 
     def calculate_sentiment(self, comments):
-        if pd.isna(comments) or comments == '':
-            return 0.0
-        try:
-            scores = self.vader.polarity_scores(str(comments))
-            return scores['compound']
-        except Exception:
-            return 0.0
+        return compound_score(self.vader, comments)
+
+    def score_comments(self, comments, ids=None):
+        """
+        Compound scores for a whole comments column (parallel when workers > 1).
+        Given the review ids, cached scores are reused and only misses are scored.
+        """
+        if self.cache is not None and ids is not None:
+            scores = self.cache.score(ids, comments, self._score)
+        else:
+            scores = self._score(comments)
+        return pd.Series(scores, index=comments.index, dtype=float)
+
+    def _score(self, comments):
+        if self.scorer is None:
+            return [self.calculate_sentiment(c) for c in comments]
+        return self.scorer.score(comments)
+
+    @contextmanager
+    def scoring(self):
+        """Scorer pool and score cache, for the duration of a run."""
+        with SentimentScorer(self.workers, self.batch_size) as scorer:
+            self.scorer = scorer if self.workers > 1 else None
+            if self.use_cache:
+                self.cache = ScoreCache(self.processed_path / CACHE_FILE)
+                self.cache.open()
+            try:
+                yield
+            finally:
+                if self.cache is not None:
+                    print(f"  Score cache: {self.cache.report()}")
+                    self.cache.close()
+                self.cache = None
+                self.scorer = None
 
     def categorize_sentiment(self, score):
-        if score >= 0.30:
-            return 'positive'
-        elif score <= -0.30:
-            return 'negative'
-        else:
-            return 'neutral'
+        return categorize_sentiment(score)
 
     def process_reviews(self):
         print(f"Processing {self.city} reviews sentiment...")
@@ -76,23 +173,24 @@ class SentimentETL:
             print(f"⚠️  No reviews.csv in {self.raw_path}")
             return pd.DataFrame()
 
-        reviews = pd.read_csv(reviews_path)
+        self.csv_mark = csv_mark(reviews_path)
+        reviews = pd.read_csv(reviews_path, usecols=REVIEW_CSV_COLUMNS)
         print(f"  Total reviews: {len(reviews):,}")
+        self.watermark = review_watermark(reviews)
 
-        listings_path = self.processed_path / 'listings_clean.csv'
-        if not listings_path.exists():
+        if not artifact_exists(self.processed_path, 'listings_clean'):
             print(f"❌ Run data_etl.py {self.city} first!")
             return pd.DataFrame()
 
-        listings = pd.read_csv(listings_path)
-        valid_listings = set(listings['listing_id'])
+        listings = read_artifact(self.processed_path, 'listings_clean', columns=['listing_id', 'neighborhood'])
+        neighborhood_of = listings.drop_duplicates('listing_id').set_index('listing_id')['neighborhood']
 
-        reviews = reviews[reviews['listing_id'].isin(valid_listings)]
+        reviews = reviews[reviews['listing_id'].isin(neighborhood_of.index)]
         print(f"  Reviews for processed listings: {len(reviews):,}")
 
         print("  Filtering for English reviews...")
-        reviews['is_english'] = reviews['comments'].apply(self.is_likely_english)
-        reviews = reviews[reviews['is_english'] == True]
+        english_ids = english_review_ids(load_review_language(self.city, self.data_dir))
+        reviews = reviews[reviews['id'].isin(english_ids)]
         print(f"  English reviews: {len(reviews):,}")
 
         if reviews.empty:
@@ -100,54 +198,207 @@ class SentimentETL:
             return pd.DataFrame()
 
         print("  Analyzing sentiment (this takes time)...")
-        reviews['sentiment'] = reviews['comments'].apply(self.calculate_sentiment)
+        reviews['sentiment'] = self.score_comments(reviews['comments'], reviews['id'])
         reviews['sentiment_category'] = reviews['sentiment'].apply(self.categorize_sentiment)
+        # Stored on every review so Mongo can group by it without a $lookup
+        reviews['neighborhood'] = reviews['listing_id'].map(neighborhood_of)
 
-        output_file = self.processed_path / 'reviews_sentiment.csv'
-        reviews[['listing_id', 'id', 'date', 'sentiment', 'sentiment_category']].to_csv(
-            output_file, index=False
+        output_file = write_artifact(
+            reviews[REVIEW_COLUMNS],
+            self.processed_path, 'reviews_sentiment'
         )
         print(f"✓ Saved: {output_file} ({len(reviews):,} reviews)")
 
         return reviews
 
-    def create_listing_sentiment(self, reviews):
-        print("Aggregating sentiment per listing...")
+    def process_reviews_streaming(self):
+        """
+        Chunked version of process_reviews: the full reviews.csv is never
+        loaded. Each chunk is filtered, scored, appended to the
+        reviews_sentiment artifact and folded into a SentimentAccumulator.
+        """
+        print(f"Processing {self.city} reviews sentiment (streaming, {self.chunksize:,} rows/chunk)...")
 
-        listing_sentiment = reviews.groupby('listing_id').agg({
-            'sentiment': ['mean', 'std', 'min', 'max', 'count']
-        }).reset_index()
+        stats = SentimentAccumulator()
 
-        listing_sentiment.columns = [
-            'listing_id', 'sentiment_mean', 'sentiment_std',
-            'sentiment_min', 'sentiment_max', 'review_count'
-        ]
+        reviews_path = self.raw_path / 'reviews.csv'
+        if not reviews_path.exists():
+            print(f"⚠️  No reviews.csv in {self.raw_path}")
+            return stats
+
+        if not artifact_exists(self.processed_path, 'listings_clean'):
+            print(f"❌ Run data_etl.py {self.city} first!")
+            return stats
+
+        listings = read_artifact(self.processed_path, 'listings_clean', columns=['listing_id', 'neighborhood'])
+        neighborhood_of = listings.drop_duplicates('listing_id').set_index('listing_id')['neighborhood']
+
+        english_ids = english_review_ids(load_review_language(self.city, self.data_dir))
+
+        total = 0
+        valid = 0
+        self.csv_mark = csv_mark(reviews_path)
+        with ArtifactWriter(self.processed_path, 'reviews_sentiment') as writer:
+            for chunk in pd.read_csv(
+                reviews_path,
+                usecols=REVIEW_CSV_COLUMNS,
+                chunksize=self.chunksize,
+            ):
+                total += len(chunk)
+                self.watermark = review_watermark(chunk, self.watermark)
+
+                chunk = chunk[chunk['listing_id'].isin(neighborhood_of.index)]
+                valid += len(chunk)
+
+                chunk = chunk[chunk['id'].isin(english_ids)]
+                if chunk.empty:
+                    continue
+
+                chunk = chunk.copy()
+                chunk['sentiment'] = self.score_comments(chunk['comments'], chunk['id'])
+                chunk['sentiment_category'] = chunk['sentiment'].apply(self.categorize_sentiment)
+                chunk['neighborhood'] = chunk['listing_id'].map(neighborhood_of)
+
+                writer.append(chunk[REVIEW_COLUMNS])
+                stats.update(chunk)
+
+                print(f"  … {total:,} read, {stats.rows:,} English scored")
+
+        print(f"  Total reviews: {total:,}")
+        print(f"  Reviews for processed listings: {valid:,}")
+        print(f"  English reviews: {stats.rows:,}")
+
+        if stats.empty:
+            print(f"⚠️  No English reviews found for {self.city}")
+            return stats
+
+        print(f"✓ Saved: {find_artifact(self.processed_path, 'reviews_sentiment')} ({stats.rows:,} reviews)")
+        return stats
+
+    def process_delta(self, stats, watermark):
+        """
+        Reviews of reviews.csv past the watermark (id above max_id or date
+        after max_date, minus ids already scored), filtered and scored like
+        process_reviews. They are folded into stats and appended to the
+        reviews_sentiment artifact. None if an input is missing.
+
+        When reviews.csv only grew since the last run (same bytes up to the
+        saved size), only the appended rows are parsed.
+        """
+        print(f"Processing {self.city} new reviews (id > {watermark['max_id']} or date > {watermark['max_date']})...")
+
+        reviews_path = self.raw_path / 'reviews.csv'
+        if not reviews_path.exists():
+            print(f"⚠️  No reviews.csv in {self.raw_path}")
+            return None
+
+        if not artifact_exists(self.processed_path, 'listings_clean'):
+            print(f"❌ Run data_etl.py {self.city} first!")
+            return None
+
+        listings = read_artifact(self.processed_path, 'listings_clean', columns=['listing_id', 'neighborhood'])
+        neighborhood_of = listings.drop_duplicates('listing_id').set_index('listing_id')['neighborhood']
+
+        chunksize = self.chunksize or CHUNK_SIZE
+        mark = csv_mark(reviews_path)
+        offset = appended_offset(reviews_path, watermark.get('csv'))
+        if offset is None:
+            chunks = pd.read_csv(reviews_path, usecols=REVIEW_CSV_COLUMNS, chunksize=chunksize)
+        else:
+            print(f"  reviews.csv grew from {offset:,} to {mark['size']:,} bytes: reading the appended rows")
+            chunks = read_csv_from(reviews_path, offset, REVIEW_CSV_COLUMNS, chunksize)
+
+        # Only the tail past the watermark is kept (comments included)
+        self.watermark = {key: watermark[key] for key in ('max_id', 'max_date')}
+        self.csv_mark = mark
+        total = 0
+        parts = []
+        for chunk in chunks:
+            total += len(chunk)
+            self.watermark = review_watermark(chunk, self.watermark)
+            new = (chunk['id'] > watermark['max_id']) | (chunk['date'].fillna('').astype(str) > watermark['max_date'])
+            parts.append(chunk[new])
+
+        if parts:
+            reviews = pd.concat(parts, ignore_index=True).drop_duplicates('id', keep='last')
+        else:
+            reviews = pd.DataFrame(columns=REVIEW_CSV_COLUMNS)
+        print(f"  {'Appended' if offset is not None else 'Total'} reviews: {total:,}")
+        print(f"  Past the watermark: {len(reviews):,}")
+
+        reviews = reviews[reviews['listing_id'].isin(neighborhood_of.index)]
+
+        # A late-dated review with an old id may have been scored already
+        seen = reviews['id'] <= watermark['max_id']
+        if seen.any():
+            scored = read_artifact(self.processed_path, 'reviews_sentiment', columns=['id'])['id']
+            reviews = reviews[~(seen & reviews['id'].isin(scored))]
+
+        # The reviews_language artifact predates these reviews: same classifier, on the delta only
+        reviews = reviews[english_mask(reviews['comments'])].copy()
+        print(f"  New English reviews: {len(reviews):,}")
+
+        if reviews.empty:
+            return reviews.reindex(columns=REVIEW_COLUMNS)
+
+        reviews['sentiment'] = self.score_comments(reviews['comments'], reviews['id'])
+        reviews['sentiment_category'] = reviews['sentiment'].apply(self.categorize_sentiment)
+        reviews['neighborhood'] = reviews['listing_id'].map(neighborhood_of)
+        reviews = reviews[REVIEW_COLUMNS]
+
+        stats.update(reviews)
+
+        # Already-scored ids were dropped above: the delta rows are all new
+        with ArtifactWriter(self.processed_path, 'reviews_sentiment', append=True) as writer:
+            writer.append(reviews)
+        print(f"✓ Saved: {find_artifact(self.processed_path, 'reviews_sentiment')} (+{len(reviews):,} reviews)")
+
+        return reviews
+
+    def save_state(self, stats):
+        """Accumulator artifacts + watermark, for the next run_delta()."""
+        moments, hist = stats.state()
+        for name, df in zip(STATE_ARTIFACTS, (moments, hist)):
+            write_artifact(df, self.processed_path, name)
+
+        with open(self.processed_path / WATERMARK_FILE, 'w', encoding='utf-8') as f:
+            json.dump({**self.watermark, 'csv': self.csv_mark, 'reviews': stats.rows}, f, indent=2)
+
+    def load_state(self):
+        """(SentimentAccumulator, watermark) saved by the last run, or None."""
+        path = self.processed_path / WATERMARK_FILE
+        if not path.exists() or not all(artifact_exists(self.processed_path, n) for n in STATE_ARTIFACTS):
+            return None
+
+        moments, hist = (read_artifact(self.processed_path, n) for n in STATE_ARTIFACTS)
+        # State saved as float mean/M2 can't be extended exactly: rebuild it with a full run
+        if not set(MOMENT_COLS) <= set(moments.columns) or not set(HISTOGRAM_COLS) <= set(hist.columns):
+            print(f"⚠️  Saved sentiment state for {self.city} predates the integer sums")
+            return None
+
+        with open(path, encoding='utf-8') as f:
+            watermark = json.load(f)
+        return SentimentAccumulator.from_state(moments, hist), watermark
+
+    def create_listing_sentiment(self, stats):
+        print("Aggregating sentiment per listing...")
+
+        listing_sentiment = stats.listing_stats()
 
         listing_sentiment['sentiment_std'] = listing_sentiment['sentiment_std'].fillna(0)
         listing_sentiment['city'] = self.city
 
-        output_file = self.processed_path / 'listing_sentiment.csv'
-        listing_sentiment.to_csv(output_file, index=False)
+        output_file = write_artifact(listing_sentiment, self.processed_path, 'listing_sentiment')
         print(f"✓ Saved: {output_file} ({len(listing_sentiment):,} listings)")
 
         return listing_sentiment
 
-    def create_neighborhood_sentiment(self, reviews):
+    def create_neighborhood_sentiment(self, stats):
         print("Creating neighborhood sentiment stats...")
 
-        listings = pd.read_csv(self.processed_path / 'listings_clean.csv')
-
-        reviews_with_neighborhood = reviews.merge(
-            listings[['listing_id', 'neighborhood']],
-            on='listing_id',
-            how='inner'
-        )
-
-        print(f"  Reviews with neighborhood: {len(reviews_with_neighborhood):,}")
-
-        neighborhood_sentiment = reviews_with_neighborhood.groupby('neighborhood')['sentiment'].agg([
-            'mean', 'median', 'std', 'count'
-        ]).reset_index()
+        neighborhood_sentiment = stats.neighborhood_stats()
+        sentiment_dist = stats.neighborhood_category_counts(self.categorize_sentiment)
+        print(f"  Reviews with neighborhood: {int(neighborhood_sentiment['count'].sum()):,}")
 
         neighborhood_sentiment.columns = [
             'neighborhood', 'sentiment_mean', 'sentiment_median',
@@ -156,13 +407,6 @@ class SentimentETL:
 
         neighborhood_sentiment['sentiment_std'] = neighborhood_sentiment['sentiment_std'].fillna(0)
 
-        sentiment_dist = (
-            reviews_with_neighborhood
-            .groupby(['neighborhood', 'sentiment_category'])
-            .size()
-            .unstack(fill_value=0)
-        )
-
         sentiment_dist = sentiment_dist.div(sentiment_dist.sum(axis=1), axis=0) * 100
         sentiment_dist = sentiment_dist.reset_index()
 
@@ -174,8 +418,7 @@ class SentimentETL:
 
         neighborhood_sentiment['city'] = self.city
 
-        output_file = self.processed_path / 'neighborhood_sentiment.csv'
-        neighborhood_sentiment.to_csv(output_file, index=False)
+        output_file = write_artifact(neighborhood_sentiment, self.processed_path, 'neighborhood_sentiment')
         print(f"✓ Saved: {output_file} ({len(neighborhood_sentiment):,} neighborhoods)")
 
         return neighborhood_sentiment
@@ -183,8 +426,13 @@ class SentimentETL:
     def create_listings_map(self):
         print("Creating map data with sentiment...")
 
-        listings = pd.read_csv(self.processed_path / 'listings_clean.csv')
-        listing_sentiment = pd.read_csv(self.processed_path / 'listing_sentiment.csv')
+        listings = read_artifact(
+            self.processed_path, 'listings_clean',
+            columns=['listing_id', 'listing_name', 'latitude', 'longitude', 'price', 'room_type', 'neighborhood']
+        )
+        listing_sentiment = read_artifact(
+            self.processed_path, 'listing_sentiment', columns=['listing_id', 'sentiment_mean', 'review_count']
+        )
 
         map_data = listings.merge(listing_sentiment, on='listing_id', how='left')
 
@@ -200,8 +448,7 @@ class SentimentETL:
         map_data = map_data[map_cols]
         map_data['city'] = self.city
 
-        output_file = self.processed_path / 'listings_map.csv'
-        map_data.to_csv(output_file, index=False)
+        output_file = write_artifact(map_data, self.processed_path, 'listings_map')
         print(f"✓ Saved: {output_file} ({len(map_data):,} listings)")
 
         return map_data
@@ -211,31 +458,112 @@ class SentimentETL:
         print(f"SENTIMENT ETL: {self.city.upper()}")
         print("=" * 60)
 
-        reviews = self.process_reviews()
+        with self.scoring():
+            if self.chunksize:
+                reviews = self.process_reviews_streaming()
+            else:
+                reviews = self.process_reviews()
+
         if reviews.empty:
             print(f"⚠️  No data processed for {self.city}")
             return
 
-        self.create_listing_sentiment(reviews)
-        self.create_neighborhood_sentiment(reviews)
+        # Both modes aggregate through the accumulator's exact integer sums,
+        # so their outputs are identical
+        if isinstance(reviews, SentimentAccumulator):
+            self.stats = reviews
+        else:
+            self.stats = SentimentAccumulator()
+            self.stats.update(reviews)
+
+        self.create_listing_sentiment(self.stats)
+        self.create_neighborhood_sentiment(self.stats)
         self.create_listings_map()
+        self.save_state(self.stats)
 
         print(f"\n✓ {self.city.upper()} SENTIMENT ETL COMPLETE!\n")
 
+    def run_delta(self):
+        """
+        Score only the reviews added since the last run and rebuild the
+        listing/neighborhood outputs from the saved accumulator, whose exact
+        integer sums make them equal to a full rebuild's. Returns the
+        new reviews (REVIEW_COLUMNS; empty if none), or None when there is
+        no saved state or input (a full run() is needed).
+        """
+        print("=" * 60)
+        print(f"SENTIMENT ETL (DELTA): {self.city.upper()}")
+        print("=" * 60)
+
+        state = self.load_state()
+        if state is None:
+            print(f"⚠️  No saved sentiment state for {self.city}")
+            return None
+        stats, watermark = state
+
+        with self.scoring():
+            reviews = self.process_delta(stats, watermark)
+
+        if reviews is None:
+            return None
 
-def main(cities=None):
+        if not reviews.empty:
+            self.create_listing_sentiment(stats)
+            self.create_neighborhood_sentiment(stats)
+            self.create_listings_map()
+
+        # Saved even without new reviews: the watermark moved past them
+        self.stats = stats
+        self.save_state(stats)
+
+        print(f"\n✓ {self.city.upper()} SENTIMENT DELTA COMPLETE! (+{len(reviews):,} reviews)\n")
+        return reviews
+
+
+def main(cities=None, chunksize=None, workers=1, batch_size=BATCH_SIZE, cache=True):
     """
     Callable entrypoint for pipeline imports.
     Still supports running this file directly.
+
+    chunksize: stream reviews.csv in chunks (bounded memory) instead of
+    loading it whole.
+    workers / batch_size: parallel VADER scoring (see SentimentScorer).
+    cache: reuse scores of unchanged reviews (see sentiment_cache.py).
     """
     if cities is None:
         cities = ['amsterdam', 'rome', 'lisbon', 'sicily', 'bordeaux', 'crete']
 
     for city in cities:
-        etl = SentimentETL(city)
+        etl = SentimentETL(city, chunksize=chunksize, workers=workers, batch_size=batch_size, cache=cache)
         etl.run()
         print()
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Sentiment ETL on English reviews")
+    parser.add_argument("cities", nargs="*", help="Cities to process (default: all)")
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        nargs="?",
+        const=CHUNK_SIZE,
+        default=None,
+        help=f"Stream reviews.csv in chunks (default chunk {CHUNK_SIZE:,} rows)",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="VADER scoring processes (default 1)")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"Comments per scoring task (default {BATCH_SIZE})",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Score every review (ignore the score cache)")
+    args = parser.parse_args()
+
+    main(
+        cities=args.cities or None,
+        chunksize=args.chunksize,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        cache=not args.no_cache,
+    )
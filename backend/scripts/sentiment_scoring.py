@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+VADER compound scoring, optionally spread over a process pool.
+
+Each worker builds its own SentimentIntensityAnalyzer once (pool
+initializer) and scores whole batches of comments; batches come back in
+submission order, so the result lines up with the input.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import pandas as pd
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+
+# Comments per task sent to a worker
+BATCH_SIZE = 2000
+
+_worker_analyzer = None
+
+
+def compound_score(analyzer, comments) -> float:
+    """Compound score for one comment; 0.0 for empty/unscorable text."""
+    if pd.isna(comments) or comments == '':
+        return 0.0
+    try:
+        scores = analyzer.polarity_scores(str(comments))
+        return scores['compound']
+    except Exception:
+        return 0.0
+
+
+def categorize_sentiment(score) -> str:
+    if score >= 0.30:
+        return 'positive'
+    elif score <= -0.30:
+        return 'negative'
+    else:
+        return 'neutral'
+
+
+def _init_worker():
+    global _worker_analyzer
+    _worker_analyzer = SentimentIntensityAnalyzer()
+
+
+def _score_batch(comments: list) -> list[float]:
+    return [compound_score(_worker_analyzer, c) for c in comments]
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+class SentimentScorer:
+    """
+    Usage:
+        with SentimentScorer(workers=4) as scorer:
+            scores = scorer.score(reviews['comments'])
+
+    workers <= 1 scores in-process (no pool).
+    """
+
+    def __init__(self, workers: int = 1, batch_size: int = BATCH_SIZE):
+        self.workers = max(1, int(workers or 1))
+        self.batch_size = max(1, int(batch_size))
+        self._pool = None
+        self._analyzer = None
+
+    def __enter__(self):
+        if self.workers > 1:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def score(self, comments) -> list[float]:
+        """Compound scores for comments (Series or list), in input order."""
+        comments = list(comments)
+
+        if self._pool is None or len(comments) <= self.batch_size:
+            if self._analyzer is None:
+                self._analyzer = SentimentIntensityAnalyzer()
+            return [compound_score(self._analyzer, c) for c in comments]
+
+        batches = [
+            comments[i:i + self.batch_size]
+            for i in range(0, len(comments), self.batch_size)
+        ]
+
+        scores: list[float] = []
+        for batch_scores in self._pool.map(_score_batch, batches):
+            scores.extend(batch_scores)
+        return scores
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Running sentiment statistics for chunked review processing.
+
+SentimentAccumulator keeps just enough state to rebuild listing_sentiment
+and neighborhood_sentiment without holding every review in memory:
+
+  - per listing:      count, sum, sum of squares, min, max
+  - per neighborhood: histogram of compound scores
+
+VADER rounds compound scores to 4 decimals, so every score is kept as an
+integer number of 1e-4 units and all the sums are exact int64s: adding
+chunks in any order (or a delta to a saved state) gives the same sums, and
+mean/std are derived from them only at the end. The full-frame and
+streaming modes of sentiment_etl.py both go through this class, so their
+outputs are identical. The histogram has at most ~20k distinct scores per
+neighborhood and gives an exact median.
+
+state() / from_state() turn an accumulator into two frames and back, so
+the delta mode of sentiment_etl.py can persist it and fold in only the
+reviews of the next scrape.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Compound scores are stored as round(score * SCALE)
+SCALE = 10_000
+
+MOMENT_COLS = ["count", "sum", "sum_sq", "min", "max"]
+
+HISTOGRAM_COLS = ["neighborhood", "score", "count"]
+
+
+def to_units(sentiment: pd.Series) -> pd.Series:
+    """Compound scores (4 decimals) as int64 multiples of 1/SCALE."""
+    return np.rint(sentiment.astype(float) * SCALE).astype("int64")
+
+
+def from_units(units) -> np.ndarray:
+    """Back to floats: n / SCALE is the double closest to the 4-decimal score."""
+    return np.asarray(units, dtype="int64") / SCALE
+
+
+def mean_std(count, total, total_sq) -> tuple[np.ndarray, np.ndarray]:
+    """
+    mean and sample std (ddof=1; NaN for a single review, like pandas) from
+    integer sums of score units. The numerators are exact Python ints and
+    each division is correctly rounded.
+    """
+    count = np.asarray(count, dtype=object)
+    total = np.asarray(total, dtype=object)
+    total_sq = np.asarray(total_sq, dtype=object)
+
+    mean = (total / (count * SCALE)).astype(float)
+
+    single = count <= 1
+    pairs = np.where(single, 1, count * (count - 1))
+    var = ((count * total_sq - total * total) / (pairs * SCALE * SCALE)).astype(float)
+    std = np.sqrt(var)
+    std[single.astype(bool)] = np.nan
+    return mean, std
+
+
+def chunk_moments(units: pd.Series, keys: pd.Series) -> pd.DataFrame:
+    """count/sum/sum_sq/min/max of score units grouped by keys."""
+    frame = pd.DataFrame({"units": units.to_numpy(), "sq": units.to_numpy() ** 2})
+    grouped = frame.groupby(keys.to_numpy())
+    moments = grouped["units"].agg(["count", "sum", "min", "max"])
+    moments["sum_sq"] = grouped["sq"].sum()
+    return moments[MOMENT_COLS].astype("int64")
+
+
+def merge_moments(a: pd.DataFrame, b: pd.DataFrame) -> pd.DataFrame:
+    """Combine two moment frames; rows missing on one side are taken from the other."""
+    if a.empty:
+        return b.copy()
+    if b.empty:
+        return a.copy()
+
+    index = a.index.union(b.index)
+    a = a.reindex(index)
+    b = b.reindex(index)
+
+    merged = pd.DataFrame(index=index)
+    for col in ("count", "sum", "sum_sq"):
+        merged[col] = a[col].fillna(0).astype("int64") + b[col].fillna(0).astype("int64")
+    merged["min"] = np.fmin(a["min"], b["min"]).astype("int64")
+    merged["max"] = np.fmax(a["max"], b["max"]).astype("int64")
+    return merged[MOMENT_COLS]
+
+
+def histogram_stats(hist: pd.Series) -> pd.DataFrame:
+    """
+    mean/median/std/count per neighborhood from a (neighborhood, score) -> count
+    histogram. Matches groupby('neighborhood')['sentiment'].agg([...]).
+    """
+    rows = []
+    for neighborhood, group in hist.groupby(level=0, sort=True):
+        units = group.index.get_level_values(1).to_numpy(dtype=np.int64)
+        counts = group.to_numpy(dtype=np.int64)
+
+        order = np.argsort(units, kind="stable")
+        units = units[order]
+        counts = counts[order]
+
+        n = int(counts.sum())
+        total = sum(int(u) * int(c) for u, c in zip(units, counts))
+        total_sq = sum(int(u) * int(u) * int(c) for u, c in zip(units, counts))
+        mean, std = mean_std([n], [total], [total_sq])
+
+        cumulative = np.cumsum(counts)
+        lo = int(units[np.searchsorted(cumulative, (n - 1) // 2 + 1)])
+        hi = int(units[np.searchsorted(cumulative, n // 2 + 1)])
+
+        rows.append({
+            "neighborhood": neighborhood,
+            "mean": float(mean[0]),
+            "median": (lo + hi) / (2 * SCALE),
+            "std": float(std[0]),
+            "count": n,
+        })
+
+    return pd.DataFrame(rows, columns=["neighborhood", "mean", "median", "std", "count"])
+
+
+class SentimentAccumulator:
+    """Running per-listing integer moments + per-neighborhood score histogram."""
+
+    def __init__(self):
+        self.listing_moments = pd.DataFrame(columns=MOMENT_COLS, dtype="int64")
+        self.neighborhood_hist = pd.Series(dtype="int64")
+        self.rows = 0
+
+    @property
+    def empty(self) -> bool:
+        return self.rows == 0
+
+    def state(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        (moments, histogram) frames, scores in 1/SCALE units:
+          listing_id, count, sum, sum_sq, min, max
+          neighborhood, score, count
+        """
+        moments = self.listing_moments.rename_axis("listing_id").reset_index()
+        if self.neighborhood_hist.empty:
+            hist = pd.DataFrame(columns=HISTOGRAM_COLS)
+        else:
+            hist = self.neighborhood_hist.rename("count").rename_axis(HISTOGRAM_COLS[:2]).reset_index()
+        return moments, hist
+
+    @classmethod
+    def from_state(cls, moments: pd.DataFrame, hist: pd.DataFrame) -> "SentimentAccumulator":
+        stats = cls()
+        if not moments.empty:
+            stats.listing_moments = moments.set_index("listing_id")[MOMENT_COLS].astype("int64")
+            stats.rows = int(moments["count"].sum())
+        if not hist.empty:
+            stats.neighborhood_hist = hist.set_index(HISTOGRAM_COLS[:2])["count"].astype("int64")
+        return stats
+
+    def update(self, reviews: pd.DataFrame):
+        """
+        reviews: scored chunk with listing_id, sentiment and (optionally
+        NaN) neighborhood columns.
+        """
+        if reviews.empty:
+            return
+
+        self.rows += len(reviews)
+        units = to_units(reviews["sentiment"])
+
+        moments = chunk_moments(units, reviews["listing_id"])
+        self.listing_moments = merge_moments(self.listing_moments, moments)
+
+        scored = pd.DataFrame({
+            "neighborhood": reviews["neighborhood"].to_numpy(),
+            "score": units.to_numpy(),
+        }).dropna(subset=["neighborhood"])
+        if not scored.empty:
+            hist = scored.groupby(HISTOGRAM_COLS[:2]).size()
+            if self.neighborhood_hist.empty:
+                self.neighborhood_hist = hist.astype("int64")
+            else:
+                self.neighborhood_hist = self.neighborhood_hist.add(hist, fill_value=0).astype("int64")
+
+    def listing_stats(self) -> pd.DataFrame:
+        """Rows shaped like groupby('listing_id')['sentiment'].agg([mean, std, min, max, count])."""
+        moments = self.listing_moments.sort_index()
+        mean, std = mean_std(moments["count"], moments["sum"], moments["sum_sq"])
+        return pd.DataFrame({
+            "listing_id": moments.index,
+            "sentiment_mean": mean,
+            "sentiment_std": std,
+            "sentiment_min": from_units(moments["min"]),
+            "sentiment_max": from_units(moments["max"]),
+            "review_count": moments["count"].astype("int64").to_numpy(),
+        })
+
+    def neighborhood_stats(self) -> pd.DataFrame:
+        return histogram_stats(self.neighborhood_hist)
+
+    def neighborhood_category_counts(self, categorize) -> pd.DataFrame:
+        """(neighborhood x sentiment_category) counts, like groupby(...).size().unstack()."""
+        if self.neighborhood_hist.empty:
+            return pd.DataFrame()
+
+        hist = self.neighborhood_hist.reset_index()
+        hist.columns = HISTOGRAM_COLS
+        hist["sentiment_category"] = pd.Series(from_units(hist["score"])).apply(categorize)
+
+        return (
+            hist.groupby(["neighborhood", "sentiment_category"])["count"]
+            .sum()
+            .unstack(fill_value=0)
+        )
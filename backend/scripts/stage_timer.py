@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Per-stage instrumentation for the pipeline.
+
+    with StageTimer("sentiment", city="rome", inputs=[...], outputs=[...]) as timer:
+        run_stage()
+    timer.metrics  # {"stage", "city", "ok", "wall_s", "cpu_s", "rows_in", "rows_out",
+                   #  "rows_per_s", "peak_rss_mb", "mongo_docs"}
+
+  cpu_s        user + system time of this process and of the worker
+               processes that finished during the stage (VADER, renders)
+  rows_in/out  rows of the input/output files (Parquet metadata, line count
+               for CSVs; None for other files)
+  rows_per_s   rows_in (or rows_out when there are no inputs) / wall_s
+  peak_rss_mb  highest resident memory of this process plus its live child
+               processes, sampled every SAMPLE_INTERVAL seconds
+  mongo_docs   documents written through record_mongo_writes()
+
+Run reports are JSON files in data/processed/reports/. Compare two of them:
+    python scripts/stage_timer.py compare OLD.json NEW.json [--threshold 0.25]
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.artifacts import FORMATS  # noqa: E402
+
+
+SAMPLE_INTERVAL = 0.05
+
+# compare_reports: a stage regresses when a metric gets worse by more than this fraction...
+REGRESSION_THRESHOLD = 0.25
+# ...and by more than these absolute amounts (ignores noise on tiny stages)
+MIN_SECONDS = 1.0
+MIN_RSS_MB = 50.0
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+_mongo_docs = 0
+_mongo_lock = threading.Lock()
+
+_row_cache = {}
+
+
+# ---------------------------------------------------------------------------
+# Counters and probes
+# ---------------------------------------------------------------------------
+
+def record_mongo_writes(n: int):
+    """Called by the writers after each insert (thread-safe, per process)."""
+    global _mongo_docs
+    with _mongo_lock:
+        _mongo_docs += n
+
+
+def mongo_writes() -> int:
+    with _mongo_lock:
+        return _mongo_docs
+
+
+def _pid_rss(pid) -> int:
+    with open(f"/proc/{pid}/statm") as f:
+        return int(f.read().split()[1]) * _PAGE_SIZE
+
+
+def _child_pids() -> list[str]:
+    pids = []
+    for children in Path("/proc/self/task").glob("*/children"):
+        pids += children.read_text().split()
+    return pids
+
+
+def current_rss() -> int:
+    """Resident bytes of this process and its live children (Linux /proc)."""
+    total = _pid_rss("self")
+    for pid in _child_pids():
+        try:
+            total += _pid_rss(pid)
+        except OSError:  # child exited meanwhile
+            pass
+    return total
+
+
+def max_rss() -> int:
+    """Lifetime peak of this process, where /proc is not available (bytes)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def cpu_seconds() -> float:
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def count_rows(path) -> int | None:
+    """
+    Rows of an artifact or raw CSV (None if missing/other). An artifact
+    rewritten in another format is looked up under its other extension.
+    Cached per (path, size, mtime).
+    """
+    path = Path(path)
+    if not path.exists() and path.suffix.lstrip(".") in FORMATS:
+        path = next((p for p in (path.with_suffix(f".{f}") for f in FORMATS) if p.exists()), path)
+    if not path.is_file() or path.suffix not in (".parquet", ".csv"):
+        return None
+
+    stat = path.stat()
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    if key not in _row_cache:
+        if path.suffix == ".parquet":
+            import pyarrow.parquet as pq
+            rows = pq.ParquetFile(path).metadata.num_rows
+        else:
+            # Line count: quoted newlines (multi-line comments) count extra
+            lines = 0
+            last = b"\n"
+            with open(path, "rb") as f:
+                while block := f.read(1 << 20):
+                    lines += block.count(b"\n")
+                    last = block[-1:]
+            rows = max(0, lines - 1 + (last != b"\n"))
+        _row_cache[key] = rows
+    return _row_cache[key]
+
+
+def total_rows(paths) -> int | None:
+    counts = [c for c in (count_rows(p) for p in paths) if c is not None]
+    return sum(counts) if counts else None
+
+
+# ---------------------------------------------------------------------------
+# StageTimer
+# ---------------------------------------------------------------------------
+
+class StageTimer:
+    """Context manager measuring one stage; never swallows exceptions."""
+
+    def __init__(self, stage: str, city: str | None = None, inputs=(), outputs=()):
+        self.stage = stage
+        self.city = city
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.ok = True
+        self.metrics = None
+        self._peak = 0
+        self._stop = threading.Event()
+        self._sampler = None
+
+    def _sample(self):
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            self._peak = max(self._peak, current_rss())
+
+    def __enter__(self):
+        self.rows_in = total_rows(self.inputs)
+        self._procfs = Path("/proc/self/statm").exists()
+        if self._procfs:
+            self._peak = current_rss()
+            self._sampler = threading.Thread(target=self._sample, daemon=True)
+            self._sampler.start()
+        self._mongo = mongo_writes()
+        self._cpu = cpu_seconds()
+        self._wall = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self._wall
+        cpu = cpu_seconds() - self._cpu
+        mongo = mongo_writes() - self._mongo
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            peak = max(self._peak, current_rss())
+        else:
+            peak = max_rss()
+
+        rows_out = total_rows(self.outputs)
+        rows = self.rows_in if self.rows_in is not None else rows_out
+
+        self.metrics = {
+            "stage": self.stage,
+            "city": self.city,
+            "ok": self.ok and exc_type is None,
+            "wall_s": round(wall, 3),
+            "cpu_s": round(cpu, 3),
+            "rows_in": self.rows_in,
+            "rows_out": rows_out,
+            "rows_per_s": round(rows / wall, 1) if rows is not None and wall > 0 else None,
+            "peak_rss_mb": round(peak / 2**20, 1),
+            "mongo_docs": mongo,
+        }
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Reports
+# ---------------------------------------------------------------------------
+
+def _fmt(value, spec: str) -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def print_stage_table(stages: list[dict]):
+    print(f"  {'city':<16} {'stage':<16} {'wall s':>8} {'cpu s':>8} {'rows in':>11} {'rows out':>11} "
+          f"{'rows/s':>10} {'peak MB':>8} {'mongo':>9}")
+    for s in stages:
+        flag = "" if s["ok"] else "  ❌"
+        print(
+            f"  {s['city'] or '-':<16} {s['stage']:<16} {s['wall_s']:>8.2f} {s['cpu_s']:>8.2f} "
+            f"{_fmt(s['rows_in'], ',d'):>11} {_fmt(s['rows_out'], ',d'):>11} {_fmt(s['rows_per_s'], ',.0f'):>10} "
+            f"{s['peak_rss_mb']:>8.1f} {s['mongo_docs']:>9,}{flag}"
+        )
+
+
+def write_report(report_dir, stages: list[dict], **meta) -> Path:
+    """reports/pipeline_report_<timestamp>.json with the run's stage metrics."""
+    report_dir = Path(report_dir)
+    report_dir.mkdir(parents=True, exist_ok=True)
+    created = datetime.now()
+    path = report_dir / f"pipeline_report_{created.strftime('%Y%m%d_%H%M%S')}.json"
+
+    report = {"created_at": created.isoformat(timespec="seconds"), **meta, "stages": stages}
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp, path)
+    return path
+
+
+def load_report(path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def previous_report(report_dir, before=None) -> Path | None:
+    """Most recent report in report_dir, other than `before`."""
+    reports = sorted(Path(report_dir).glob("pipeline_report_*.json"))
+    reports = [p for p in reports if before is None or p.resolve() != Path(before).resolve()]
+    return reports[-1] if reports else None
+
+
+def compare_reports(old: dict, new: dict, threshold: float = REGRESSION_THRESHOLD) -> list[str]:
+    """
+    Regressions of `new` vs `old` for (city, stage) pairs present in both:
+    slower wall time, lower rows/s, higher peak RSS.
+    """
+    before = {(s["city"], s["stage"]): s for s in old["stages"] if s["ok"]}
+    regressions = []
+
+    for s in new["stages"]:
+        o = before.get((s["city"], s["stage"]))
+        if o is None or not s["ok"]:
+            continue
+        name = f"{s['city'] or '-'}/{s['stage']}"
+
+        if s["wall_s"] > o["wall_s"] * (1 + threshold) and s["wall_s"] - o["wall_s"] > MIN_SECONDS:
+            regressions.append(f"{name}: wall {o['wall_s']:.2f}s → {s['wall_s']:.2f}s")
+        if (
+            s["rows_per_s"] is not None and o["rows_per_s"]
+            and s["rows_per_s"] < o["rows_per_s"] * (1 - threshold)
+            and s["wall_s"] > MIN_SECONDS
+        ):
+            regressions.append(f"{name}: {o['rows_per_s']:,.0f} → {s['rows_per_s']:,.0f} rows/s")
+        if (
+            s["peak_rss_mb"] > o["peak_rss_mb"] * (1 + threshold)
+            and s["peak_rss_mb"] - o["peak_rss_mb"] > MIN_RSS_MB
+        ):
+            regressions.append(f"{name}: peak RSS {o['peak_rss_mb']:,.0f} → {s['peak_rss_mb']:,.0f} MB")
+
+    return regressions
+
+
+def print_comparison(old_path, new_path, threshold: float = REGRESSION_THRESHOLD) -> bool:
+    """Prints the regressions of new vs old; True if there are none."""
+    regressions = compare_reports(load_report(old_path), load_report(new_path), threshold)
+    print(f"\n📈 Compared with {old_path} (threshold {threshold:.0%})")
+    if not regressions:
+        print("  ✅ No regressions")
+        return True
+    for r in regressions:
+        print(f"  ⚠️  {r}")
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline run reports")
+    sub = parser.add_subparsers(dest="command", required=True)
+    show = sub.add_parser("show", help="Print a report's stage table")
+    show.add_argument("report")
+    compare = sub.add_parser("compare", help="Flag regressions of NEW vs OLD")
+    compare.add_argument("old")
+    compare.add_argument("new")
+    compare.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+
+    if args.command == "show":
+        print_stage_table(load_report(args.report)["stages"])
+        return True
+    return print_comparison(args.old, args.new, args.threshold)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
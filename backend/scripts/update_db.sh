@@ -36,6 +36,9 @@ mongorestore --uri="$MONGO_URI" --db "$DB_NAME" --drop "$DUMP_PATH"
 
 echo "✅ Restore complete."
 
+# New dataset version: the API stops serving responses cached from the old data
+MONGO_URI="$MONGO_URI" MONGO_DB="$DB_NAME" python scripts/dataset_version.py bump --source update_db.sh || true
+
 # Quick verification
 echo "📋 Collections:"
 mongosh --quiet --eval "use $DB_NAME; show collections" || true
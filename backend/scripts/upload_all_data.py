@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
+import argparse
 import sys
+import time
 from pathlib import Path
-import pandas as pd
 
 BACKEND_DIR = Path(__file__).resolve().parent.parent
 SCRIPTS_DIR = BACKEND_DIR / "scripts"
@@ -10,15 +11,11 @@ sys.path.insert(0, str(BACKEND_DIR))
 
 from pymongo import MongoClient
 from config import Config
-
-
-CHUNK_SIZE = 10000
-
-# Columns we want to normalize across the whole project
-RENAME_MAP = {
-    "neighbourhood": "neighborhood",
-    "review_score_rating": "review_scores_rating",
-}
+from scripts.artifacts import UPLOAD_ARTIFACTS, find_artifact
+from scripts.dataset_version import publish as publish_dataset_version
+from scripts.bulk_loader import (
+    BATCH_SIZE, UPLOAD_THREADS, upload_files, print_upload_report
+)
 
 
 def get_db():
@@ -26,56 +23,18 @@ def get_db():
     return client[Config.MONGO_DB]
 
 
-def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    cols = {c: RENAME_MAP[c] for c in df.columns if c in RENAME_MAP}
-    if cols:
-        df = df.rename(columns=cols)
-    return df
-
-
-def upload_file(db, city_name: str, csv_path: Path) -> int:
-    collection_name = csv_path.stem
-    coll = db[collection_name]
-
-    print(f"  📄 {csv_path.name}")
-
-    # Overwrite city slice for clean re-runs
-    coll.delete_many({"city": city_name})
-
-    total = 0
-
-    for chunk_num, df_chunk in enumerate(pd.read_csv(csv_path, chunksize=CHUNK_SIZE), 1):
-        df_chunk = normalize_columns(df_chunk)
-        df_chunk = df_chunk.where(pd.notnull(df_chunk), None)
-        df_chunk["city"] = city_name
-
-        docs = df_chunk.to_dict("records")
-        if docs:
-            result = coll.insert_many(docs, ordered=False)
-            total += len(result.inserted_ids)
-
-        print(f"     Chunk {chunk_num}: {len(docs):,} rows")
-
-    return total
-
-
-def process_city(db, city_dir: Path, expected_files: list[str]) -> int:
-    city_name = city_dir.name
-    print(f"\n🏙️  {city_name.upper()}")
-
-    total = 0
-    for f in expected_files:
-        csv_path = city_dir / f
-        if csv_path.exists():
-            total += upload_file(db, city_name, csv_path)
+def city_upload_jobs(city_dir: Path, expected_artifacts: list[str]) -> list[tuple[str, Path]]:
+    jobs = []
+    for name in expected_artifacts:
+        path = find_artifact(city_dir, name)
+        if path is not None:
+            jobs.append((city_dir.name, path))
         else:
-            print(f"  ⚠️  Missing: {f}")
+            print(f"  ⚠️  Missing: {city_dir.name}/{name}")
+    return jobs
 
-    print(f"  ✅ Total: {total:,} rows")
-    return total
 
-
-def run_aggregations():
+def run_aggregations(cities=None):
     print("\n" + "=" * 70)
     print("🔄 RUNNING AGGREGATIONS FOR DASHBOARD")
     print("=" * 70)
@@ -103,7 +62,7 @@ def run_aggregations():
         spec.loader.exec_module(module)
 
         if hasattr(module, fn):
-            getattr(module, fn)()
+            getattr(module, fn)(cities=cities)
             print(f"✅ {description} complete")
         else:
             print(f"❌ {script_name} has no function {fn}()")
@@ -148,14 +107,22 @@ def main(
     upload_raw: bool = True,
     run_aggs: bool = True,
     show_summary: bool = True,
+    cities=None,
+    threads: int = UPLOAD_THREADS,
+    batch_size: int = BATCH_SIZE,
+    data_dir=None,
 ):
     """
-    Upload processed CSVs to MongoDB + (optionally) run aggregations.
+    Upload processed artifacts (Parquet or CSV) to MongoDB + (optionally) run aggregations.
 
     Parameters:
-      upload_raw: upload all processed CSV collections (listings_clean, listing_sentiment, etc.)
+      upload_raw: upload all processed collections (listings_clean, listing_sentiment, etc.)
       run_aggs: run aggregation scripts to build dashboard collections
       show_summary: print DB doc counts at end
+      cities: only upload these cities (default: every folder in data/processed)
+      threads: files (collection x city) uploaded concurrently
+      batch_size: rows per insert_many
+      data_dir: data directory holding processed/ (default: backend/data)
     """
     db = get_db()
 
@@ -163,41 +130,39 @@ def main(
     print("🚀 INNSIGHT DATABASE UPLOAD")
     print("=" * 70)
 
-    base_path = BACKEND_DIR / "data" / "processed"
+    base_path = Path(data_dir or BACKEND_DIR / "data") / "processed"
     if not base_path.exists():
         print(f"❌ Processed data directory not found: {base_path}")
         return False
 
-    city_folders = [p for p in base_path.iterdir() if p.is_dir()]
+    city_folders = [p for p in base_path.iterdir() if p.is_dir() and p.name in Config.ALLOWED_CITIES]
+    if cities is not None:
+        city_folders = [p for p in city_folders if p.name in cities]
     print(f"\n📍 Found cities: {[p.name for p in city_folders]}")
 
-    expected_files = [
-        "listings_clean.csv",
-        "neighborhood_stats.csv",
-        "occupancy_monthly.csv",
-        "top_hosts.csv",
-        "review_words.csv",
-        "reviews_sentiment.csv",
-        "listing_sentiment.csv",
-        "neighborhood_sentiment.csv",
-        "listings_map.csv",
-    ]
-
     if upload_raw:
         print("\n" + "=" * 70)
-        print("📤 STEP 1: UPLOADING CSV FILES")
+        print("📤 STEP 1: UPLOADING PROCESSED FILES")
         print("=" * 70)
 
-        grand_total = 0
+        jobs = []
         for city_dir in sorted(city_folders):
-            grand_total += process_city(db, city_dir, expected_files)
+            jobs += city_upload_jobs(city_dir, UPLOAD_ARTIFACTS)
+
+        print(f"\n📦 {len(jobs)} files, {threads} at a time, {batch_size:,} rows per batch\n")
+        start = time.perf_counter()
+        stats = upload_files(db, jobs, threads, batch_size)
+        elapsed = time.perf_counter() - start
+
+        print_upload_report(stats, elapsed)
 
-        print(f"\n✅ CSV UPLOAD COMPLETE: {grand_total:,} TOTAL ROWS")
+        grand_total = sum(s["docs"] for s in stats)
+        print(f"\n✅ UPLOAD COMPLETE: {grand_total:,} TOTAL ROWS in {elapsed:.1f}s")
     else:
-        print("\nℹ️ upload_raw=False → skipping CSV upload")
+        print("\nℹ️ upload_raw=False → skipping upload")
 
     if run_aggs:
-        run_aggregations()
+        run_aggregations(cities=cities)
     else:
         print("\nℹ️ run_aggs=False → skipping aggregations")
 
@@ -212,4 +177,13 @@ def main(
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Upload processed artifacts to MongoDB")
+    parser.add_argument("cities", nargs="*", help="Cities to upload (default: all processed)")
+    parser.add_argument("--threads", type=int, default=UPLOAD_THREADS, help="Files uploaded concurrently")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Rows per insert_many")
+    parser.add_argument("--no-aggs", action="store_true", help="Skip the aggregation scripts")
+    args = parser.parse_args()
+
+    if main(run_aggs=not args.no_aggs, cities=args.cities or None, threads=args.threads, batch_size=args.batch_size):
+        # The API's cached responses are keyed on this version
+        publish_dataset_version(get_db(), args.cities or None, source="upload_all_data")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Warm the API response cache after a load.
+
+Requests the dashboard's hot URLs (what the Landing and City pages fetch
+on open, and the map payload in every format of utils/listings_payload.py,
+compressed) through the app itself, so they are computed under the current
+dataset version (utils/dataset_version.py) and stored in the shared cache
+(CACHE_TYPE in config.py). The API workers switch to that version within
+DATASET_VERSION_POLL seconds and find every hot key already there.
+
+Run with the same CACHE_* and MONGO_* environment as the API. With
+CACHE_TYPE=SimpleCache the cache is per process and warming is pointless.
+
+Usage:
+    python scripts/warm_cache.py                 # all cities
+    python scripts/warm_cache.py rome lisbon
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import Config  # noqa: E402
+from utils.listings_payload import FORMATS, codings  # noqa: E402
+
+CITIES = ["amsterdam", "rome", "lisbon", "sicily", "bordeaux", "crete"]
+
+
+def hot_requests(cities) -> list[tuple[str, dict]]:
+    """(url, headers) pairs: browsers ask for compressed JSON, other clients may pick another format."""
+    compressed = {"Accept-Encoding": ", ".join(codings())}
+    requests = [("/api/cities", {})]
+    for city in cities:
+        requests += [
+            (f"/api/listings-map?city={city}&limit=50000", {**compressed, "Accept": mimetype})
+            for mimetype in FORMATS
+        ]
+        requests += [(url, {}) for url in [
+            f"/api/neighborhood-sentiment?city={city}",
+            f"/api/room-types?city={city}&level=city",
+            f"/api/occupancy?city={city}&level=city",
+            f"/api/top-hosts?city={city}&level=city",
+            f"/api/wordcloud?city={city}",
+        ]]
+    return requests
+
+
+def main(cities=None):
+    """Callable entrypoint for pipeline imports; True if every URL answered 200."""
+    from app import create_app
+
+    if cities is None:
+        cities = CITIES
+
+    if Config.CACHE_TYPE == "SimpleCache":
+        print("ℹ️ CACHE_TYPE=SimpleCache is per process → nothing to warm")
+        return True
+
+    app = create_app()
+    client = app.test_client()
+    version = app.dataset_version.current()
+    print(f"\n🔥 Warming {Config.CACHE_TYPE} for dataset version {version or '(none published)'}")
+
+    ok = True
+    start = time.perf_counter()
+    for url, headers in hot_requests(cities):
+        t = time.perf_counter()
+        response = client.get(url, headers=headers)
+        flag = "✅" if response.status_code == 200 else "❌"
+        ok = ok and response.status_code == 200
+        variant = FORMATS.get(headers.get("Accept"), "")
+        print(f"  {flag} {url:<50} {variant:<8} {response.status_code} {time.perf_counter() - t:>7.2f}s")
+
+    print(f"\n✅ Cache warmed in {time.perf_counter() - start:.1f}s" if ok else "\n❌ Some URLs failed")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute the API's hot responses")
+    parser.add_argument("cities", nargs="*", help="Cities to warm (default: all)")
+    args = parser.parse_args()
+
+    sys.exit(0 if main(cities=args.cities or None) else 1)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Word counts for the wordcloud ETL: every review is tokenized once.
+
+count_words() walks the reviews in order and fills one Counter per
+neighborhood; the city totals are the sum of those Counters. Counter keeps
+keys in first-occurrence order and most_common() breaks ties by that order,
+so the merged result ranks words exactly like counting the whole corpus in
+one go. Chunks can be counted in worker processes and merged in chunk order
+(merge_counts) without changing the outcome.
+"""
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import re
+
+import pandas as pd
+
+
+# Reviews per task sent to a worker
+CHUNK_SIZE = 20000
+
+NON_LETTERS = re.compile(r'[^a-z\s]')
+
+# Common Airbnb words to filter out (on top of NLTK's English stopwords)
+AIRBNB_STOP_WORDS = [
+    'apartment', 'room', 'place', 'stay', 'flat', 'house',
+    'host', 'airbnb', 'booking', 'location', 'area', 'great',
+    'good', 'nice', 'also', 'really', 'would', 'highly',
+    'stayed', 'perfect', 'recommend', 'excellent', 'amsterdam',
+    'rome', 'lisbon', 'everything', 'appartment', 'restaurants',
+    'molto', 'amazing', 'para', 'pour', 'sehr', 'many', 'casa',
+    'roma', 'zona', 'time', 'posizione', 'todo', 'paolo', 'definitely',
+    'thank', 'staff', 'next', 'super', 'hotel', 'close', 'walk',
+    'clean', 'comfortable', 'easy', 'beautiful', 'walking', 'centro',
+    'sicily', 'bordeaux', 'crete'
+]
+
+_worker_stop_words = None
+
+
+def default_stop_words() -> set[str]:
+    from nltk.corpus import stopwords
+
+    stop_words = set(stopwords.words('english'))
+    stop_words.update(AIRBNB_STOP_WORDS)
+    return stop_words
+
+
+def clean_text(text, stop_words) -> list[str]:
+    """Extract meaningful words from review text"""
+    if pd.isna(text) or text == '':
+        return []
+
+    text = NON_LETTERS.sub(' ', str(text).lower())
+    return [w for w in text.split() if len(w) > 3 and w not in stop_words]
+
+
+class WordCounts:
+    """
+    Per-neighborhood Counters (in first-appearance order of the
+    neighborhoods; reviews without a neighborhood are kept under None so
+    they still count city-wide) plus the order in which words first
+    appeared city-wide.
+    """
+
+    def __init__(self):
+        self.neighborhoods: dict[str, Counter] = {}
+        self.first_seen: dict[str, None] = {}
+
+    def city_counts(self) -> Counter:
+        """City totals: sum of the neighborhood Counters, in city-wide first-occurrence order."""
+        totals = Counter()
+        for counts in self.neighborhoods.values():
+            totals.update(counts)
+        return Counter({word: totals[word] for word in self.first_seen})
+
+
+def count_words(comments, neighborhoods, stop_words) -> WordCounts:
+    """Tokenize each (comment, neighborhood) pair once, in order."""
+    result = WordCounts()
+    for text, neighborhood in zip(comments, neighborhoods):
+        words = clean_text(text, stop_words)
+        if pd.isna(neighborhood):
+            neighborhood = None
+
+        counts = result.neighborhoods.get(neighborhood)
+        if counts is None:
+            counts = result.neighborhoods[neighborhood] = Counter()
+        counts.update(words)
+        # dict.update keeps the position of keys already present
+        result.first_seen.update(dict.fromkeys(words))
+    return result
+
+
+def merge_counts(parts) -> WordCounts:
+    """Merge chunk results; parts must be in review order."""
+    merged = WordCounts()
+    for part in parts:
+        for neighborhood, counts in part.neighborhoods.items():
+            if neighborhood in merged.neighborhoods:
+                merged.neighborhoods[neighborhood].update(counts)
+            else:
+                merged.neighborhoods[neighborhood] = counts
+        merged.first_seen.update(part.first_seen)
+    return merged
+
+
+def _init_worker(stop_words):
+    global _worker_stop_words
+    _worker_stop_words = stop_words
+
+
+def _count_chunk(chunk: tuple[list, list]) -> WordCounts:
+    comments, neighborhoods = chunk
+    return count_words(comments, neighborhoods, _worker_stop_words)
+
+
+def count_reviews(reviews: pd.DataFrame, stop_words, workers: int = 1, chunksize: int = CHUNK_SIZE) -> WordCounts:
+    """
+    WordCounts for reviews (comments, neighborhood columns). workers > 1
+    counts chunks of reviews in a process pool.
+    """
+    comments = reviews['comments'].tolist()
+    neighborhoods = reviews['neighborhood'].tolist()
+
+    if workers <= 1 or len(comments) <= chunksize:
+        return count_words(comments, neighborhoods, stop_words)
+
+    chunks = [
+        (comments[i:i + chunksize], neighborhoods[i:i + chunksize])
+        for i in range(0, len(comments), chunksize)
+    ]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(stop_words,)) as pool:
+        return merge_counts(pool.map(_count_chunk, chunks))
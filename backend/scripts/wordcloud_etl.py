@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
 
+import sys
+import argparse
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from collections import Counter
-import re
-from nltk.corpus import stopwords
 import nltk
-from wordcloud import WordCloud
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
-import matplotlib.pyplot as plt
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.artifacts import artifact_exists, find_artifact, read_artifact, write_artifact  # noqa: E402
+from scripts.review_language import load_review_language, english_review_ids  # noqa: E402
+from scripts.word_counts import clean_text, count_reviews, default_stop_words  # noqa: E402
+from scripts.wordcloud_render import WordcloudRenderer, render_image  # noqa: E402
 
 
 # Download stopwords once
@@ -23,96 +25,34 @@ except LookupError:
 class WordCloudETL:
     """
     Extract top words from ENGLISH reviews for word cloud visualization
-    Generates: CSV data + PNG images
+    (English flags come from the reviews_language artifact, see review_language.py)
+    Generates: review_words artifact + PNG images (only re-rendered when
+    their top words change, see wordcloud_render.py)
     Requires: data_etl.py run first (creates listings_clean.csv)
     """
 
-    def __init__(self, city):
+    def __init__(self, city, workers=1, render_workers=None, data_dir='../data'):
         self.city = city
-        self.raw_path = Path(f'../data/raw/{city}')
-        self.processed_path = Path(f'../data/processed/{city}')
+        self.data_dir = data_dir
+        self.workers = workers
+        self.render_workers = render_workers
+        self.raw_path = Path(data_dir) / 'raw' / city
+        self.processed_path = Path(data_dir) / 'processed' / city
         self.images_path = self.processed_path / 'wordcloud_images'
         self.images_path.mkdir(exist_ok=True)
 
-        self.stop_words = set(stopwords.words('english'))
-
-        # Common Airbnb words to filter out
-        self.stop_words.update([
-            'apartment', 'room', 'place', 'stay', 'flat', 'house',
-            'host', 'airbnb', 'booking', 'location', 'area', 'great',
-            'good', 'nice', 'also', 'really', 'would', 'highly',
-            'stayed', 'perfect', 'recommend', 'excellent', 'amsterdam',
-            'rome', 'lisbon', 'everything', 'appartment', 'restaurants',
-            'molto', 'amazing', 'para', 'pour', 'sehr', 'many', 'casa',
-            'roma', 'zona', 'time', 'posizione', 'todo', 'paolo', 'definitely',
-            'thank', 'staff', 'next', 'super', 'hotel', 'close', 'walk',
-            'clean', 'comfortable', 'easy', 'beautiful', 'walking', 'centro',
-            'sicily', 'bordeaux', 'crete'
-        ])
-
-    def is_likely_english(self, text):
-        """Same filter as sentiment_etl.py - only process English reviews"""
-        if pd.isna(text) or len(str(text)) < 10:
-            return False
-
-        text_lower = str(text).lower()
-
-        non_english_markers = [
-            'het', 'een', 'van', 'voor', 'was', 'zeer', 'erg', 'mooie', 'zijn', 'de', 'op',
-            'sehr', 'gut', 'war', 'und', 'ist', 'auch', 'wir', 'schön', 'die', 'der',
-            'molto', 'bella', 'ottimo', 'casa', 'bellissimo', 'siamo', 'che', 'della',
-            'très', 'bien', 'nous', 'était', 'avec', 'merci', 'les', 'des',
-            'muy', 'estaba', 'todo', 'casa', 'excelente', 'las', 'los',
-            'velmi', 'dobrý', 'jsme', 'bylo', 'jsou'
-        ]
-
-        first_words = text_lower.split()[:5]
-        for word in first_words:
-            if word in non_english_markers:
-                return False
-
-        english_markers = [
-            'the', 'was', 'very', 'great', 'nice', 'good', 'we', 'our', 'had',
-            'place', 'location', 'stay', 'apartment', 'host', 'clean',
-            'would', 'recommend'
-        ]
-        english_count = sum(1 for word in text_lower.split() if word in english_markers)
-
-        return english_count >= 2
+        self.stop_words = default_stop_words()
 
     def clean_text(self, text):
         """Extract meaningful words from review text"""
-        if pd.isna(text) or text == '':
-            return []
-
-        text = str(text).lower()
-        text = re.sub(r'[^a-z\s]', ' ', text)
-
-        words = text.split()
-        words = [w for w in words if len(w) > 3 and w not in self.stop_words]
-        return words
+        return clean_text(text, self.stop_words)
 
     def generate_wordcloud_image(self, word_freq, filename, title):
-        """Generate a single wordcloud PNG image"""
+        """Generate a single wordcloud PNG image (uncached, see WordcloudRenderer)"""
         if not word_freq:
             return
 
-        wc = WordCloud(
-            width=1200,
-            height=600,
-            background_color='white',
-            colormap='viridis',
-            max_words=100,
-            relative_scaling=0.5
-        ).generate_from_frequencies(word_freq)
-
-        plt.figure(figsize=(15, 7.5))
-        plt.imshow(wc, interpolation='bilinear')
-        plt.axis('off')
-        plt.title(title, fontsize=20, pad=20)
-        plt.tight_layout(pad=0)
-        plt.savefig(self.images_path / filename, dpi=150, bbox_inches='tight')
-        plt.close()
+        render_image(word_freq, self.images_path / filename, title)
 
     def process_reviews(self):
         print(f"Processing {self.city} word frequencies (English only)...")
@@ -122,16 +62,15 @@ class WordCloudETL:
             print(f"⚠️  No reviews.csv in {self.raw_path}")
             return pd.DataFrame()
 
-        reviews = pd.read_csv(reviews_path)
+        reviews = pd.read_csv(reviews_path, usecols=['id', 'listing_id', 'comments'])
         total_before = len(reviews)
         print(f"  Total reviews: {total_before:,}")
 
-        listings_path = self.processed_path / 'listings_clean.csv'
-        if not listings_path.exists():
+        if not artifact_exists(self.processed_path, 'listings_clean'):
             print("❌ Run data_etl.py first!")
             return pd.DataFrame()
 
-        listings = pd.read_csv(listings_path)
+        listings = read_artifact(self.processed_path, 'listings_clean', columns=['listing_id', 'neighborhood'])
 
         # Merge to get neighborhoods
         reviews = reviews.merge(
@@ -142,9 +81,9 @@ class WordCloudETL:
 
         # Filter for English
         print("  Filtering for English reviews...")
-        reviews['is_english'] = reviews['comments'].apply(self.is_likely_english)
-        english_count = int(reviews['is_english'].sum())
-        reviews = reviews[reviews['is_english'] == True]
+        english_ids = english_review_ids(load_review_language(self.city, self.data_dir))
+        reviews = reviews[reviews['id'].isin(english_ids)]
+        english_count = len(reviews)
         total_after = len(reviews)
 
         pct = (english_count / max(total_before, 1)) * 100
@@ -156,17 +95,16 @@ class WordCloudETL:
 
         print(f"  Extracting words from {len(reviews):,} English reviews...")
 
+        # One tokenization pass: per-neighborhood Counters, city = their sum
+        counts = count_reviews(reviews, self.stop_words, workers=self.workers)
+        renderer = WordcloudRenderer(self.images_path, workers=self.render_workers)
+
         results = []
         image_count = 0
 
-        for neighborhood in reviews['neighborhood'].dropna().unique():
-            neighborhood_reviews = reviews[reviews['neighborhood'] == neighborhood]
-
-            all_words = []
-            for comment in neighborhood_reviews['comments'].dropna():
-                all_words.extend(self.clean_text(comment))
-
-            word_counts = Counter(all_words)
+        for neighborhood, word_counts in counts.neighborhoods.items():
+            if neighborhood is None:
+                continue
 
             # Top 100 words per neighborhood
             for word, freq in word_counts.most_common(100):
@@ -183,18 +121,12 @@ class WordCloudETL:
                 safe_name = str(neighborhood).replace('/', '_').replace(' ', '_')
                 filename = f'{safe_name}.png'
                 title = f'{neighborhood} - {self.city.title()}'
-                self.generate_wordcloud_image(word_freq, filename, title)
+                renderer.add(word_freq, filename, title)
                 image_count += 1
 
-        print(f"  ✓ Generated {image_count} neighborhood wordcloud images")
-
         # City-level (all neighborhoods combined)
         print("  Creating city-level word cloud...")
-        all_words = []
-        for comment in reviews['comments'].dropna():
-            all_words.extend(self.clean_text(comment))
-
-        word_counts = Counter(all_words)
+        word_counts = counts.city_counts()
         for word, freq in word_counts.most_common(200):
             results.append({
                 'city': self.city,
@@ -204,16 +136,21 @@ class WordCloudETL:
             })
 
         word_freq = dict(word_counts.most_common(100))
-        self.generate_wordcloud_image(
+        renderer.add(
             word_freq,
             f'{self.city}_overall.png',
             f'{self.city.title()} - All English Reviews'
         )
 
+        rendered, skipped, pruned = renderer.run()
+        print(
+            f"  ✓ {image_count} neighborhood + 1 city wordcloud images "
+            f"({rendered} rendered, {skipped} unchanged, {pruned} stale removed)"
+        )
+
         df = pd.DataFrame(results)
 
-        output_file = self.processed_path / 'review_words.csv'
-        df.to_csv(output_file, index=False)
+        output_file = write_artifact(df, self.processed_path, 'review_words')
         print(f"✓ Saved: {output_file} ({len(df):,} words)")
 
         return df
@@ -229,20 +166,28 @@ class WordCloudETL:
             return
 
         print(f"\n✓ {self.city.upper()} WORD CLOUD ETL COMPLETE!")
-        print(f"  → CSV: {self.processed_path / 'review_words.csv'}")
+        print(f"  → Words: {find_artifact(self.processed_path, 'review_words')}")
         print(f"  → Images: {self.images_path}/\n")
 
 
-def main(cities=None):
+def main(cities=None, workers=1, render_workers=None):
     """Callable entrypoint for pipeline imports."""
     if cities is None:
         cities = ['amsterdam', 'rome', 'lisbon', 'sicily', 'bordeaux', 'crete']
 
     for city in cities:
-        etl = WordCloudETL(city)
+        etl = WordCloudETL(city, workers=workers, render_workers=render_workers)
         etl.run()
         print()
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Word frequencies + wordcloud images per city")
+    parser.add_argument("cities", nargs="*", help="Cities to process (default: all)")
+    parser.add_argument("--workers", type=int, default=1, help="Processes counting review chunks (default: 1)")
+    parser.add_argument(
+        "--render-workers", type=int, default=None, help="Processes rendering PNGs (default: CPU count)"
+    )
+    args = parser.parse_args()
+
+    main(cities=args.cities or None, workers=args.workers, render_workers=args.render_workers)
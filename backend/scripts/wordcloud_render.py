@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Wordcloud PNG rendering: process pool + content-hash cache.
+
+Each image is keyed by a hash of its frequency dict, title and the render
+settings. wordcloud_images/.render_cache.json remembers the key every PNG
+was rendered from, so a re-run only renders images whose words changed
+(or whose file is missing) and deletes PNGs no longer produced.
+
+    renderer = WordcloudRenderer(images_path, workers=4)
+    renderer.add(word_freq, 'Centrum.png', 'Centrum - Amsterdam')
+    rendered, skipped, pruned = renderer.run()
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from wordcloud import WordCloud
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend
+import matplotlib.pyplot as plt
+
+
+CACHE_FILE = '.render_cache.json'
+
+# Part of every image key: changing any of these re-renders everything
+RENDER_SETTINGS = {
+    'width': 1200,
+    'height': 600,
+    'background_color': 'white',
+    'colormap': 'viridis',
+    'max_words': 100,
+    'relative_scaling': 0.5,
+    'figsize': [15, 7.5],
+    'title_fontsize': 20,
+    'dpi': 150,
+}
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def render_key(word_freq: dict, title: str) -> str:
+    payload = json.dumps(
+        {'words': list(word_freq.items()), 'title': title, 'settings': RENDER_SETTINGS},
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def render_image(word_freq: dict, path, title: str):
+    """Render a single wordcloud PNG."""
+    wc = WordCloud(
+        width=RENDER_SETTINGS['width'],
+        height=RENDER_SETTINGS['height'],
+        background_color=RENDER_SETTINGS['background_color'],
+        colormap=RENDER_SETTINGS['colormap'],
+        max_words=RENDER_SETTINGS['max_words'],
+        relative_scaling=RENDER_SETTINGS['relative_scaling'],
+    ).generate_from_frequencies(word_freq)
+
+    plt.figure(figsize=tuple(RENDER_SETTINGS['figsize']))
+    plt.imshow(wc, interpolation='bilinear')
+    plt.axis('off')
+    plt.title(title, fontsize=RENDER_SETTINGS['title_fontsize'], pad=20)
+    plt.tight_layout(pad=0)
+    plt.savefig(path, dpi=RENDER_SETTINGS['dpi'], bbox_inches='tight')
+    plt.close()
+
+
+def _render_job(job: tuple) -> str:
+    word_freq, path, title = job
+    render_image(word_freq, path, title)
+    return Path(path).name
+
+
+class WordcloudRenderer:
+    """Collects the images of one run, then renders only what changed."""
+
+    def __init__(self, images_path, workers: int | None = None):
+        self.images_path = Path(images_path)
+        self.images_path.mkdir(parents=True, exist_ok=True)
+        self.workers = max(1, workers or default_workers())
+        self.cache_path = self.images_path / CACHE_FILE
+        self.jobs = {}
+
+    def add(self, word_freq: dict, filename: str, title: str):
+        if not word_freq:
+            return
+        self.jobs[filename] = (word_freq, title, render_key(word_freq, title))
+
+    def _load_cache(self) -> dict:
+        if not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def run(self) -> tuple[int, int, int]:
+        """Render changed images, prune stale ones. Returns (rendered, skipped, pruned)."""
+        cached = self._load_cache()
+
+        todo = [
+            (word_freq, str(self.images_path / filename), title)
+            for filename, (word_freq, title, key) in self.jobs.items()
+            if cached.get(filename) != key or not (self.images_path / filename).exists()
+        ]
+
+        if self.workers > 1 and len(todo) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(todo))) as pool:
+                list(pool.map(_render_job, todo))
+        else:
+            for job in todo:
+                _render_job(job)
+
+        pruned = 0
+        for png in self.images_path.glob('*.png'):
+            if png.name not in self.jobs:
+                png.unlink()
+                pruned += 1
+
+        tmp = self.cache_path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({filename: key for filename, (_, _, key) in self.jobs.items()}, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.cache_path)
+
+        return len(todo), len(self.jobs) - len(todo), pruned
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests import the backend packages (scripts, utils, ...) like the benchmarks do
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,134 @@
+"""
+The in-process dashboard builders (scripts/dashboard_aggregates.py) against
+the documents the original aggregate_* scripts produced for the same small
+city: Mongo pipelines over listings_clean/reviews_sentiment and, for
+occupancy, the raw calendar mapped to neighborhoods. The expected documents
+below were worked out by hand from those pipelines.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scripts.calendar_occupancy import neighborhood_month_counts, read_calendar
+from scripts.dashboard_aggregates import city_dashboard_docs
+
+CITY = "testville"
+
+# listing 5 has no room type and no host name, listing 6 no neighborhood,
+# listing 3 a rating outside 0..5 and listing 4 neither price nor rating
+LISTINGS = pd.DataFrame({
+    "listing_id": [1, 2, 3, 4, 5, 6],
+    "neighborhood": ["Centro", "Centro", "Centro", "Porto", "Porto", None],
+    "room_type": ["Entire home/apt", "Entire home/apt", "Private room", "Private room", None, "Hotel room"],
+    "host_id": [10, 10, 20, 20, 30, 10],
+    "host_name": ["Ana", "Ana", "Bo", "Bo", None, "Ana"],
+    "price": [100.0, 50.0, 40.0, np.nan, 80.0, 30.0],
+    "review_scores_rating": [4.8, 4.6, 6.0, np.nan, 4.0, 5.0],
+})
+
+# reviews_sentiment rows carry the neighborhood of their listing (none for
+# listing 6 and for listing 99, which isn't in listings_clean)
+REVIEWS = pd.DataFrame({
+    "listing_id": [1, 1, 1, 3, 4, 6, 99, 1],
+    "sentiment_category": ["positive", "positive", "neutral", "negative", "positive", "negative", "neutral", None],
+})
+REVIEWS["neighborhood"] = REVIEWS["listing_id"].map(LISTINGS.set_index("listing_id")["neighborhood"])
+
+CALENDAR = """listing_id,date,available,price
+1,2024-01-30,t,$100.00
+1,2024-01-31,f,$100.00
+1,2024-02-01,f,$100.00
+1,not-a-date,f,$100.00
+2,2024-01-15,f,$50.00
+3,2024-02-10,t,$40.00
+4,2024-01-05,t,
+4,2024-02-05,,
+6,2024-01-01,f,$30.00
+99,2024-01-01,f,$10.00
+"""
+
+
+def sentiment(neighborhood, total, pos, neu, neg, pct):
+    return {
+        "city": CITY, "neighborhood": neighborhood,
+        "level": "city" if neighborhood is None else "neighborhood",
+        "total_reviews": total, "positive_count": pos, "neutral_count": neu, "negative_count": neg,
+        "positive": pct[0], "neutral": pct[1], "negative": pct[2],
+    }
+
+
+def room_types(neighborhood, total, counts):
+    return {
+        "city": CITY, "neighborhood": neighborhood,
+        "level": "city" if neighborhood is None else "neighborhood",
+        "total_listings": total,
+        "room_types": {rt: {"count": c, "percentage": p} for rt, (c, p) in counts.items()},
+    }
+
+
+def hosts(neighborhood, entries):
+    return {
+        "city": CITY, "neighborhood": neighborhood,
+        "level": "city" if neighborhood is None else "neighborhood",
+        "top_hosts": [
+            {"host_id": i, "host_name": n, "total_listings": t, "avg_price": p, "avg_rating": r}
+            for i, n, t, p, r in entries
+        ],
+    }
+
+
+def occupancy(neighborhood, months):
+    return {
+        "city": CITY, "neighborhood": neighborhood,
+        "level": "city" if neighborhood is None else "neighborhood",
+        "monthly_occupancy": [
+            {"month": m, "occupied_nights": o, "total_nights": t, "occupancy_rate": r}
+            for m, o, t, r in months
+        ],
+    }
+
+
+EXPECTED = {
+    "sentiment_summary": [
+        sentiment(None, 7, 3, 2, 2, (42.9, 28.6, 28.6)),
+        sentiment("Centro", 4, 2, 1, 1, (50.0, 25.0, 25.0)),
+        sentiment("Porto", 1, 1, 0, 0, (100.0, 0.0, 0.0)),
+    ],
+    "room_type_distribution": [
+        room_types(None, 5, {"Entire home/apt": (2, 40.0), "Private room": (2, 40.0), "Hotel room": (1, 20.0)}),
+        room_types("Centro", 3, {"Entire home/apt": (2, 66.67), "Private room": (1, 33.33)}),
+        room_types("Porto", 1, {"Private room": (1, 100.0)}),
+    ],
+    "top_hosts_agg": [
+        hosts(None, [(10, "Ana", 3, 60.0, 4.8), (20, "Bo", 2, 40.0, None)]),
+        hosts("Centro", [(10, "Ana", 2, 75.0, 4.7), (20, "Bo", 1, 40.0, None)]),
+        hosts("Porto", [(20, "Bo", 1, None, None)]),
+    ],
+    "occupancy_by_month": [
+        occupancy(None, [("2024-01", 2, 4, 50.0), ("2024-02", 2, 3, 66.67)]),
+        occupancy("Centro", [("2024-01", 2, 3, 66.67), ("2024-02", 1, 2, 50.0)]),
+        occupancy("Porto", [("2024-01", 0, 1, 0.0), ("2024-02", 1, 1, 100.0)]),
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def docs(tmp_path_factory):
+    calendar_path = tmp_path_factory.mktemp("raw") / "calendar.csv"
+    calendar_path.write_text(CALENDAR)
+    counts = neighborhood_month_counts(read_calendar(calendar_path), LISTINGS[["listing_id", "neighborhood"]])
+    return city_dashboard_docs(CITY, listings=LISTINGS, reviews=REVIEWS, occupancy=counts)
+
+
+def by_key(documents):
+    return {(d["level"], d["neighborhood"]): d for d in documents}
+
+
+@pytest.mark.parametrize("collection", list(EXPECTED))
+def test_builder_matches_original_aggregation(docs, collection):
+    assert by_key(docs[collection]) == by_key(EXPECTED[collection])
+
+
+def test_missing_frames_leave_collections_empty():
+    assert city_dashboard_docs(CITY) == {name: [] for name in EXPECTED}
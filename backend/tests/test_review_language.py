@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from benchmarks.language_filter import EDGE_CASES
+from scripts.review_language import english_mask, is_likely_english
+
+# Whitespace str.split() knows and plain regex \s may not, adjacent/overlapping
+# markers, markers inside longer words
+MORE_CASES = pd.Series([
+    "the\xa0place　was great",
+    "the\x1cplace\x1dwas great",
+    "the\vplace was great",
+    "one\xa0two three four het the place was great",
+    "one two three four five\xa0het the place was great",
+    "het the host was nice",
+    "thewas placehost nothing here",
+    "the the only one marker kind",
+    "the was  ",
+    "   the was   ",
+    "a b c d\nvan the place was great",
+    "theplace wasgreat, hosts cleaner",
+    "İstanbul trip, the host was nice",
+    "\u0085the\u0085was\u0085",
+    12345678901234,
+], dtype=object)
+
+
+def test_english_mask_matches_is_likely_english():
+    cases = pd.concat([EDGE_CASES, MORE_CASES], ignore_index=True)
+    expected = cases.apply(is_likely_english).to_numpy(dtype=bool)
+
+    np.testing.assert_array_equal(english_mask(cases), expected)
+
+
+def test_english_mask_keeps_alignment_with_index():
+    cases = pd.concat([EDGE_CASES, MORE_CASES], ignore_index=True)
+    shuffled = cases.sample(frac=1, random_state=0)
+    shuffled.index = shuffled.index * 7 + 3
+
+    np.testing.assert_array_equal(
+        english_mask(shuffled), shuffled.apply(is_likely_english).to_numpy(dtype=bool)
+    )
+
+
+def test_english_mask_empty():
+    assert english_mask(pd.Series([], dtype=object)).shape == (0,)
+    assert not english_mask(pd.Series([None, "short"], dtype=object)).any()
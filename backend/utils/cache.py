@@ -0,0 +1,145 @@
+# backend/utils/cache.py
+"""
+Response cache shared by the API workers.
+
+The backend is Flask-Caching's, chosen in config.py (CACHE_TYPE):
+  FileSystemCache  one directory for all the gunicorn workers of a host,
+                   at most CACHE_THRESHOLD entries (default)
+  RedisCache       a Redis server (or any Redis-protocol store) at
+                   CACHE_REDIS_URL; bound it with its maxmemory setting
+  SimpleCache      in-process, one copy per worker (development)
+
+get_or_set() adds single-flight recomputation: entries are kept STALE_TTL
+seconds past their timeout, and when one expires only the worker holding
+the key's lock queries MongoDB; the others keep serving the stale value
+(or, for a key that was never computed, wait up to WAIT_TIMEOUT for it).
+
+Once the pipeline has published a dataset version (utils/dataset_version.py),
+keys are prefixed with it and kept CACHE_VERSIONED_TIMEOUT seconds instead
+of the route's timeout: a new load switches every worker to new keys.
+"""
+
+import os
+import time
+import uuid
+
+from flask import current_app
+
+# Seconds an expired entry is still served while it is being recomputed
+STALE_TTL = 3600
+# A lock older than this belongs to a worker that died mid-query
+LOCK_TIMEOUT = 60
+# How long a worker waits for another one computing a missing key
+WAIT_TIMEOUT = 30
+POLL_INTERVAL = 0.05
+
+
+class _FileLock:
+    """O_EXCL lock file, shared by the processes of one host (FileSystemCache)."""
+
+    def __init__(self, lock_dir: str, name: str):
+        os.makedirs(lock_dir, exist_ok=True)
+        self.path = os.path.join(lock_dir, name)
+
+    def acquire(self) -> bool:
+        # Second attempt only after removing a stale lock
+        for _ in range(2):
+            try:
+                os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) < LOCK_TIMEOUT:
+                        return False
+                    os.remove(self.path)
+                except FileNotFoundError:
+                    pass
+        return False
+
+    def held(self) -> bool:
+        return os.path.exists(self.path)
+
+    def release(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class _CacheLock:
+    """Lock entry in the cache itself: add() is SETNX on Redis, atomic in-process on SimpleCache."""
+
+    def __init__(self, cache, name: str):
+        self.cache = cache
+        self.key = f"lock:{name}"
+        self.token = uuid.uuid4().hex
+
+    def acquire(self) -> bool:
+        return bool(self.cache.add(self.key, self.token, timeout=LOCK_TIMEOUT))
+
+    def held(self) -> bool:
+        return self.cache.get(self.key) is not None
+
+    def release(self):
+        if self.cache.get(self.key) == self.token:
+            self.cache.delete(self.key)
+
+
+def _lock(cache, key: str):
+    if current_app.config.get("CACHE_TYPE") == "FileSystemCache":
+        # cachelib's FileSystemCache.add() is check-then-write: lock with a file instead
+        name = f"{uuid.uuid5(uuid.NAMESPACE_URL, key).hex}.lock"
+        return _FileLock(f"{current_app.config['CACHE_DIR'].rstrip(os.sep)}_locks", name)
+    return _CacheLock(cache, key)
+
+
+def dataset_version() -> str | None:
+    watcher = getattr(current_app, "dataset_version", None)
+    return watcher.current() if watcher is not None else None
+
+
+def get_or_set(key: str, compute, timeout: int | None = None):
+    """
+    Cached value of key, computing it with compute() (no arguments) when
+    missing or expired. Only returned values are cached: compute() raises
+    on failure, and the next request tries again.
+    """
+    cache = current_app.cache
+    if timeout is None:
+        timeout = current_app.config.get("CACHE_DEFAULT_TIMEOUT", 300)
+
+    version = dataset_version()
+    if version:
+        key = f"v{version}:{key}"
+        timeout = current_app.config.get("CACHE_VERSIONED_TIMEOUT", timeout)
+
+    # Entries are (value, fresh_until), stored for timeout + STALE_TTL
+    entry = cache.get(key)
+    if entry is not None and entry[1] > time.time():
+        return entry[0]
+
+    lock = _lock(cache, key)
+    if lock.acquire():
+        try:
+            # Another worker may have refreshed it between our get and the lock
+            fresh = cache.get(key)
+            if fresh is not None and fresh[1] > time.time():
+                return fresh[0]
+            value = compute()
+            cache.set(key, (value, time.time() + timeout), timeout=timeout + STALE_TTL)
+            return value
+        finally:
+            lock.release()
+
+    if entry is not None:
+        return entry[0]
+
+    deadline = time.time() + WAIT_TIMEOUT
+    while time.time() < deadline:
+        time.sleep(POLL_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
+        if not lock.held():
+            break  # the other worker failed: query ourselves
+    return compute()
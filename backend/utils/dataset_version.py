@@ -0,0 +1,57 @@
+# backend/utils/dataset_version.py
+"""
+Version of the data in MongoDB, published by the pipeline after each load
+(scripts/dataset_version.py) as one document: dataset_version {_id: "current", version, ...}.
+
+The API prefixes every cache key with it (utils/cache.py), so cached
+responses live until the next load instead of a few minutes.
+"""
+
+import os
+import threading
+import time
+
+from pymongo.errors import PyMongoError
+
+COLLECTION = "dataset_version"
+DOC_ID = "current"
+
+
+class DatasetVersionWatcher:
+    """
+    Latest published version, re-read every `interval` seconds by a daemon
+    thread. The thread is started on first use in each process, so gunicorn
+    workers forked from a preloaded app get their own.
+    """
+
+    def __init__(self, db, interval: int = 30):
+        self.db = db
+        self.interval = interval
+        self.version = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        try:
+            doc = self.db[COLLECTION].find_one({"_id": DOC_ID}, {"version": 1})
+        except PyMongoError as e:
+            # Keep serving with the last known version
+            print(f"⚠️ dataset version poll failed: {e}")
+            return self.version
+        self.version = doc["version"] if doc else None
+        return self.version
+
+    def _poll(self):
+        while True:
+            time.sleep(self.interval)
+            self.refresh()
+
+    def current(self) -> str | None:
+        """None until the pipeline has published a version."""
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._pid = os.getpid()
+                    self.refresh()
+                    threading.Thread(target=self._poll, daemon=True).start()
+        return self.version
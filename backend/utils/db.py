@@ -22,5 +22,7 @@ def init_db(app):
     db.listings_clean.create_index([("city", 1), ("neighborhood", 1)])
     db.listings_clean.create_index([("city", 1), ("price", 1)])
     db.neighborhood_sentiment.create_index([("city", 1)])
+    # /api/listings keyset pages (listing_id > cursor, per city)
+    db.listings_map.create_index([("city", 1), ("listing_id", 1)])
     print("✅ MongoDB connected + indexes created (innsight_db)")
 
@@ -0,0 +1,82 @@
+# backend/utils/http_cache.py
+"""
+Conditional GET for the flask-restx resources.
+
+Resources that subclass CachedResource instead of Resource answer GET with
+a strong ETag derived from the dataset version (utils/dataset_version.py),
+the path, the normalized query string and the Accept / Accept-Encoding
+headers (the listings routes negotiate on them, utils/listings_payload.py),
+plus Cache-Control and Vary. A request
+whose If-None-Match holds that ETag gets an empty 304 before the handler
+runs: no MongoDB query, no cache lookup, no JSON serialization.
+
+Streamed responses are left alone (no ETag, see conditional_get).
+
+Until the pipeline has published a dataset version there is nothing to
+derive the ETag from: responses then carry Cache-Control: no-cache only.
+A deploy that changes the shape of the responses should bump the version
+(python scripts/dataset_version.py bump) so clients don't keep old bodies.
+"""
+
+import functools
+import hashlib
+
+from flask import current_app, request
+from flask_restx import Resource
+from flask_restx.utils import unpack
+from werkzeug.wrappers import Response
+
+from utils.cache import dataset_version
+
+
+def request_etag(version: str | None) -> str | None:
+    """Same version + path + query parameters (in any order) + negotiation headers → same ETag."""
+    if not version:
+        return None
+    params = sorted(request.args.items(multi=True))
+    negotiation = (request.headers.get("Accept", ""), request.headers.get("Accept-Encoding", ""))
+    key = repr((version, request.path, params, negotiation)).encode("utf-8")
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+
+def cache_control() -> str:
+    max_age = current_app.config.get("HTTP_CACHE_MAX_AGE", 0)
+    # max-age 0: browsers revalidate on every load (a 304 when nothing changed)
+    return f"public, max-age={max_age}" if max_age else "no-cache"
+
+
+def conditional_get(handler):
+    """Method decorator: ETag/Cache-Control on 200 responses, 304 on a matching If-None-Match."""
+
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return handler(*args, **kwargs)
+
+        etag = request_etag(dataset_version())
+        headers = {"Cache-Control": cache_control(), "Vary": "Accept, Accept-Encoding"}
+        if etag:
+            headers["ETag"] = f'"{etag}"'
+            if request.if_none_match.contains_weak(etag):
+                return Response(status=304, headers=headers)
+
+        result = handler(*args, **kwargs)
+        if isinstance(result, Response):
+            # No ETag on a streamed body (listings ?stream=1): one cut short by a
+            # database error mid-stream must not be revalidated as complete
+            if result.status_code == 200 and not result.is_streamed:
+                result.headers.update(headers)
+            return result
+
+        data, code, extra = unpack(result)
+        if code != 200:
+            return data, code, extra
+        return data, code, {**headers, **(extra or {})}
+
+    return wrapper
+
+
+class CachedResource(Resource):
+    """Resource whose GET supports conditional requests (see conditional_get)."""
+
+    method_decorators = [conditional_get]
@@ -0,0 +1,130 @@
+# backend/utils/listings_payload.py
+"""
+Negotiated, precompressed bodies for /api/listings and /api/listings-map.
+
+Format (Accept):
+  application/json                        list of objects (default, as before)
+  application/vnd.innsight.columns+json   {"count": n, "columns": {field: [...]}}: one array per
+                                          field; room_type, neighborhood, sentiment_category and
+                                          city as {"dictionary": [...], "codes": [...]} (-1 = null)
+  application/vnd.apache.arrow.stream     Arrow IPC stream: float32 latitude/longitude,
+                                          dictionary-encoded strings
+
+Coding (Accept-Encoding): br when the optional brotli package is installed,
+else gzip, else none.
+
+Only the finished bodies are cached (utils/cache.py), per query, format and
+coding: a miss fetches the records once and encodes and compresses them for
+that variant, so each is built once per dataset version and the records
+themselves are never kept. scripts/warm_cache.py precomputes each city's
+map payloads.
+"""
+
+import gzip
+import json
+
+import pyarrow as pa
+from flask import request
+from werkzeug.wrappers import Response
+
+from utils.cache import get_or_set
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+JSON_MIME = "application/json"
+COLUMNS_MIME = "application/vnd.innsight.columns+json"
+ARROW_MIME = "application/vnd.apache.arrow.stream"
+
+# Negotiation order: JSON wins ties (*/*, no Accept header)
+FORMATS = {JSON_MIME: "json", COLUMNS_MIME: "columns", ARROW_MIME: "arrow"}
+
+DICTIONARY_FIELDS = {"room_type", "neighborhood", "sentiment_category", "city"}
+FLOAT32_FIELDS = {"latitude", "longitude"}
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 9
+
+
+def codings() -> list[str]:
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate() -> tuple[str, str | None]:
+    """(media type, content coding or None) for the current request."""
+    mimetype = request.accept_mimetypes.best_match(list(FORMATS), default=JSON_MIME)
+    return mimetype, request.accept_encodings.best_match(codings())
+
+
+def record_fields(records: list[dict]) -> list[str]:
+    return list(dict.fromkeys(k for r in records for k in r))
+
+
+def to_columns(records: list[dict]) -> dict:
+    columns = {}
+    for field in record_fields(records):
+        values = [r.get(field) for r in records]
+        if field in DICTIONARY_FIELDS:
+            dictionary = list(dict.fromkeys(v for v in values if v is not None))
+            index = {v: i for i, v in enumerate(dictionary)}
+            columns[field] = {"dictionary": dictionary, "codes": [-1 if v is None else index[v] for v in values]}
+        else:
+            columns[field] = values
+    return {"count": len(records), "columns": columns}
+
+
+def to_arrow(records: list[dict]) -> bytes:
+    arrays = {}
+    for field in record_fields(records):
+        values = [r.get(field) for r in records]
+        if field in FLOAT32_FIELDS:
+            arrays[field] = pa.array(values, type=pa.float32())
+        elif field in DICTIONARY_FIELDS:
+            arrays[field] = pa.array([None if v is None else str(v) for v in values], type=pa.string()).dictionary_encode()
+        else:
+            try:
+                arrays[field] = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Mixed types across documents: send them as strings
+                arrays[field] = pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+    table = pa.table(arrays)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def encode(records: list[dict], mimetype: str) -> bytes:
+    if mimetype == ARROW_MIME:
+        return to_arrow(records)
+    data = to_columns(records) if mimetype == COLUMNS_MIME else records
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def compress(body: bytes, coding: str | None) -> bytes:
+    if coding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if coding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+    return body
+
+
+def payload_response(cache_key: str, fetch, timeout: int) -> Response:
+    """
+    The records of fetch() in the negotiated format and coding. Only the
+    body is cached; fetch() runs once per variant miss.
+    """
+    mimetype, coding = negotiate()
+
+    def build():
+        return compress(encode(fetch(), mimetype), coding)
+
+    body = get_or_set(f"{cache_key}:{FORMATS[mimetype]}:{coding or 'identity'}", build, timeout=timeout)
+
+    response = Response(body, status=200, mimetype=mimetype)
+    if coding:
+        response.headers["Content-Encoding"] = coding
+    return response